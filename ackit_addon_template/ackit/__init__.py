@@ -1,22 +1,21 @@
 """
 Addon Creator Kit (ackit or ACKit) - A comprehensive toolkit for Blender addon development
-"""
-
-# Expose the main Facade class
-from ._ack import ACK
 
-# Expose top-level enums if desired
-from . import enums
+Public names are resolved on first access (PEP 562), so importing ``ackit`` doesn't
+import every subsystem up-front.
+"""
 
-# Expose globals utility facade class.
-from .globals import GLOBALS
+from typing import TYPE_CHECKING
 
-# Expose core loader for addon registration
-from .core.addon_loader import AddonLoader
-from .core.auto_load import AutoLoad
+from ._lazy import lazy_exports
 
-# Expose AutoCode if needed
-from .auto_code import AutoCode # Assuming auto_code.py is still top-level
+if TYPE_CHECKING:
+    from ._ack import ACK
+    from . import enums
+    from .globals import GLOBALS
+    from .core.addon_loader import AddonLoader
+    from .core.auto_load import AutoLoad
+    from .auto_code import AutoCode
 
 # Version (Consider moving this to a dedicated version file or metadata)
 __version__ = (0, 1, 0)
@@ -28,3 +27,17 @@ __all__ = [
     'AutoCode',
     '__version__',
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), {
+    # Expose the main Facade class
+    'ACK': ('._ack', 'ACK'),
+    # Expose top-level enums if desired
+    'enums': ('.enums', None),
+    # Expose globals utility facade class.
+    'GLOBALS': ('.globals', 'GLOBALS'),
+    # Expose core loader for addon registration
+    'AddonLoader': ('.core.addon_loader', 'AddonLoader'),
+    'AutoLoad': ('.core.auto_load', 'AutoLoad'),
+    # Expose AutoCode if needed
+    'AutoCode': ('.auto_code', 'AutoCode'),
+})
@@ -0,0 +1,5 @@
+""" Namespaces of the ``ACK`` facade, one module per subsystem.
+
+Each module imports its subsystem eagerly, but ``ACK`` only imports a module
+the first time its namespace is accessed (see ``ackit._ack``).
+"""
@@ -0,0 +1,38 @@
+from typing import TYPE_CHECKING, Any, Callable, Type
+
+from ..app import Handlers # From app.handlers
+from ..app import new_timer_as_decorator # From app.timer
+from .._ack import _LazyAttr
+
+if TYPE_CHECKING:
+    from ..app.async_loop import AsyncLoop
+    from ..app.jobs import Jobs as _Jobs  # Aliased, 'App.Jobs' would shadow it.
+    from ..app.playback import PlaybackDispatcher
+    from ..app.process_pool import ProcessPool
+    from ..app.render_pipeline import RenderPipeline as _RenderPipeline
+    from ..app.work_queue import WorkQueue
+
+
+__all__ = [
+    'App',
+]
+
+
+class App: # Or Application?
+    """Application-level handlers, timers, etc."""
+    Handler = Handlers # Enum from app.handlers
+    Timer = new_timer_as_decorator # Decorator func from app.timers
+    # Imported on first use, their handlers are installed then if the addon is already registered.
+    Debounce: Callable[..., Any] = _LazyAttr('.app.rate_limit', 'debounce') # Rate limit decorators for handlers, RNA subscriptions and property updates.
+    Throttle: Callable[..., Any] = _LazyAttr('.app.rate_limit', 'throttle')
+    CoalescePerTick: Callable[..., Any] = _LazyAttr('.app.rate_limit', 'coalesce_per_tick')
+    DepsgraphUpdate: Callable[..., Any] = _LazyAttr('.app.depsgraph_updates', 'subscribe_to_depsgraph_updates') # Decorator, depsgraph updates filtered by ID type, datablock and change flags.
+    FrameChange: Callable[..., Any] = _LazyAttr('.app.playback', 'frame_change_handler') # Decorator, frame change callbacks with a budget during playback.
+    Playback: Type['PlaybackDispatcher'] = _LazyAttr('.app.playback', 'PlaybackDispatcher') # Playback frame records and stats.
+    RenderPostProcess: Callable[..., Any] = _LazyAttr('.app.render_pipeline', 'render_post_process') # Decorator, render output post-processing in worker threads.
+    RenderPipeline: Type['_RenderPipeline'] = _LazyAttr('.app.render_pipeline', 'RenderPipeline') # Render post-processing reports.
+    Async: Type['AsyncLoop'] = _LazyAttr('.app.async_loop', 'AsyncLoop') # asyncio loop stepped from a timer (imported on first use)
+    Jobs: Type['_Jobs'] = _LazyAttr('.app.jobs', 'Jobs') # Worker pools with main thread callbacks (imported on first use)
+    Processes: Type['ProcessPool'] = _LazyAttr('.app.process_pool', 'ProcessPool') # Process pool with shared memory arrays (imported on first use)
+    Work: Type['WorkQueue'] = _LazyAttr('.app.work_queue', 'WorkQueue') # Frame budgeted generators in the main thread
+    # Keymap = RegisterKeymap # Class from app.keymaps
@@ -0,0 +1,31 @@
+from ..data import AddonPreferences
+from ..data import PropertyGroup
+from ..data import PropertyTypes # From data.props
+from ..data import WrappedTypedPropertyTypes # From data.props
+from ..data import register_property # From data.helpers
+from ..data import batch_register_properties # From data.helpers
+from ..data import subscribe_to_rna_change # From data.subscriptions
+from ..data import subscribe_to_rna_change_based_on_context # From data.subscriptions
+
+
+__all__ = [
+    'Data',
+]
+
+
+class Data:
+    """Base types, property definitions, and data-related registration."""
+    # Base Types
+    AddonPreferences = AddonPreferences
+    PropertyGroup = PropertyGroup
+    # Property Definition Types
+    Prop = PropertyTypes  # annotation
+    PropTyped = WrappedTypedPropertyTypes  # descriptor
+    # Property Registration Helpers
+    register_property = register_property
+    batch_register_properties = batch_register_properties
+    # PropertyGroup Registration (Conceptual)
+    # PropertyGroupRole = object()  # use as decorator
+    # RNA Subscription (MsgBus)
+    subscribe_to_rna = subscribe_to_rna_change
+    subscribe_to_rna_context = subscribe_to_rna_change_based_on_context
@@ -0,0 +1,93 @@
+from typing import Callable, Type, TypeVar
+
+from .. import flags
+from .. import ne
+from ..metadata import Node as _MetadataNodeFunc, NodeSocket as _MetadataSocketFunc # Import the specific functions
+from ..metadata import NodeTypeVar as _MetadataNodeTypeVar # Import TypeVar from metadata
+from ..metadata import NodeSocketTypeVar as _MetadataNodeSocketTypeVar
+from ..flags import NODE_CATEGORY as _NodeCategoryFunc # Import the specific function
+from ..flags import NodeT as _FlagsNodeT # Import TypeVar from flags
+from ..ne import Node as _Node, NodeExec as _NodeExec
+from ..ne import NodeTree, NodeTreeExec
+from ..ne import NodeSocket, NodeSocketExec
+from ..ne.annotations_internal import NodeSocketInput as _NodeSocketInput # Alias internal
+from ..ne.annotations_internal import NodeSocketOutput as _NodeSocketOutput # Alias internal
+from ..ne import socket_types as _socket_types_module # The module itself
+
+
+__all__ = [
+    'NE',
+]
+
+
+# Definir TypeVar. Esto nos ayuda a tener tipado del tipo de NodeSocket suyacente,
+# el cual usamos para definir el tipo de socket para inputs y outputs.
+SocketT = TypeVar('SocketT', bound=NodeSocket|NodeSocketExec)
+
+
+class NE: # Node Editor
+    """Base types, creators, and config for Node Editor.
+        WARNING: You might get quite some ACkNE if writing too much NodeEditor code."""
+    # Define base types as direct aliases
+    Node = _Node
+    NodeExec = _NodeExec
+    Tree = NodeTree
+    TreeExec = NodeTreeExec
+    Socket = NodeSocket
+    SocketExec = NodeSocketExec
+    # Configuration - Wrap original functions in staticmethods with precise signatures
+
+    @staticmethod
+    def add_node_metadata(label: str | None = None, tooltip: str = "", icon: str = 'NONE') -> Callable[[Type[_MetadataNodeTypeVar]], Type[_MetadataNodeTypeVar]]:
+        """Adds metadata to a Node class. Alias for metadata.Node."""
+        return _MetadataNodeFunc(label=label, tooltip=tooltip, icon=icon)
+
+    @staticmethod
+    def add_socket_metadata(label: str | None = None, tooltip: str = "", subtype_label: str = '', color: tuple[float, float, float, float] = (0.5, 0.5, 0.5, 1.0)) -> Callable[[Type[_MetadataNodeSocketTypeVar]], Type[_MetadataNodeSocketTypeVar]]:
+        """Adds metadata to a NodeSocket class. Alias for metadata.NodeSocket."""
+        return _MetadataSocketFunc(label=label, tooltip=tooltip, subtype_label=subtype_label, color=color)
+
+    @staticmethod
+    def add_node_to_category(category: str) -> Callable[[Type[_FlagsNodeT]], Type[_FlagsNodeT]]:
+        """Adds a category to a Node class. Alias for flags.NODE_CATEGORY."""
+        return _NodeCategoryFunc(category=category)
+
+    NodeFlags = flags.NodeFlags
+
+    # Socket Definition
+    SocketTypes = _socket_types_module.SocketTypes
+
+    # Socket Casting
+    SocketCast = ne.SocketCast
+
+    # Explicitly annotate the NodeInput and NodeOutput with proper signatures
+    @staticmethod
+    def InputSocket(socket_type: Type[SocketT], label: str | None = None, multi: bool = False) -> SocketT:
+        """
+        Create an input socket annotation.
+
+        Args:
+            socket_type: The type of node socket (e.g., socket_types.NodeSocketFloat)
+            multi: Whether this is a multi-input socket
+
+        Returns:
+            The actual socket instance (typed as SocketT) when accessed on a node instance.
+        """
+        # Call the correctly typed internal function
+        # The type ignore might still be needed if the IDE struggles with the descriptor protocol
+        return _NodeSocketInput(socket_type, multi, label=label) # type: ignore
+
+    @staticmethod
+    def OutputSocket(socket_type: Type[SocketT], label: str | None = None) -> SocketT:
+        """
+        Create an output socket annotation.
+
+        Args:
+            socket_type: The type of node socket (e.g., socket_types.NodeSocketFloat)
+
+        Returns:
+            The actual socket instance (typed as SocketT) when accessed on a node instance.
+        """
+        # Call the correctly typed internal function
+        # The type ignore might still be needed
+        return _NodeSocketOutput(socket_type, label=label) # type: ignore
@@ -0,0 +1,33 @@
+from typing import Callable, Type, ClassVar
+
+from ..ops import Generic as _GenericOperator # Avoid collision with typing.Generic if used
+from ..ops import Action
+from ..ops import Modal
+from ..metadata import Operator as _MetadataOperatorFunc
+from ..metadata import OperatorTypeVar as _MetadataOperatorTypeVar
+from ..flags import OPERATOR as _FlagsOperatorClass
+from ..flags import MODAL as _FlagsModalClass
+
+
+__all__ = [
+    'Ops',
+]
+
+
+class Ops:
+    """Base types, creators, and config for Operators."""
+    Generic = _GenericOperator
+    Action = Action
+    Modal = Modal
+    # Configuration
+    @staticmethod
+    def add_metadata(label: str | None = None, tooltip: str = "") -> Callable[[Type[_MetadataOperatorTypeVar]], Type[_MetadataOperatorTypeVar]]:
+        """Adds metadata to an Operator class. Alias for metadata.Operator."""
+        return _MetadataOperatorFunc(label=label, tooltip=tooltip)
+
+    # --- Renamed Aliases for Flags/Polling --- 
+    Flags: ClassVar[Type[_FlagsOperatorClass]] = _FlagsOperatorClass
+    ModalFlags: ClassVar[Type[_FlagsModalClass]] = _FlagsModalClass
+    
+    # Other (Example)
+    # register_shortcut = ... # TODO
@@ -0,0 +1,72 @@
+from typing import Callable, Type, ClassVar
+
+from bpy import types as bpy_types
+
+from ..ui import Panel
+from ..ui import Menu
+from ..ui import PieMenu
+from ..ui import Popover
+from ..ui import UIList
+from ..ui.helpers import ui_extend as _ui_extend_func
+from ..ui.helpers import UIOverride as _UIOverride_class
+from ..flags import PANEL as _FlagsPanelEnum
+
+
+__all__ = [
+    'UI',
+]
+
+
+UIDrawFunc = Callable[[bpy_types.Context, bpy_types.UILayout], None]
+
+
+class UI:
+    """Base types, creators, and config for UI elements."""
+    Panel = Panel
+    Menu = Menu
+    PieMenu = PieMenu
+    Popover = Popover
+    UIList = UIList
+    # Configuration
+    # --- Renamed Aliases for Flags/Polling --- 
+    PanelFlags: ClassVar[Type[_FlagsPanelEnum]] = _FlagsPanelEnum
+    # UI Draw Helpers
+    @staticmethod
+    def extend_layout(target_cls: Type[bpy_types.Panel] | Type[bpy_types.Menu], prepend: bool = False) -> Callable[[UIDrawFunc], UIDrawFunc]:
+        """
+        Decorator to register a function to be appended or prepended to a Blender UI class's draw method.
+
+        Usage:
+            @ACK.UI.extend_layout(bpy.types.SOME_PT_panel, prepend=True)
+            def my_draw_func(context, layout):
+                layout.label(text="Hello")
+
+        Args:
+            target_cls: The Blender Panel or Menu class (e.g., bpy.types.OBJECT_MT_context_menu).
+            prepend: Whether to prepend the function instead of appending.
+
+        Returns:
+            Callable: The decorated function with (bpy.types.Context, bpy.types.UILayout) arguments.
+        """
+        return _ui_extend_func(target_cls, prepend)
+
+    @staticmethod
+    def override_layout(target_cls: Type[bpy_types.Panel] | Type[bpy_types.Menu], poll: Callable[[bpy_types.Context], bool]):
+        """
+        Decorator to override the layout of a Blender UI class.
+
+        Usage:
+            @ACK.UI.override_layout(bpy.types.SOME_PT_panel, poll=lambda context: context.scene.some_prop)
+            class OverrideOfSomePanel(bpy.types.Panel):
+                def draw(self, context):
+                    # Method to override from the original 'bpy.types.SOME_PT_panel' class.
+                    self.layout.label(text="Hello")
+
+        Args:
+            target_cls: The Blender Panel or Menu class (e.g., bpy.types.OBJECT_PT_context_menu).
+            poll: A function that returns a boolean indicating if the override should be applied.
+
+        Returns:
+            Callable: The decorated class with the overridden draw method (or any other overriden methods).
+        """
+        return _UIOverride_class.decodecorator(target_cls, poll)
@@ -0,0 +1,44 @@
+import sys
+import importlib
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Tuple
+
+
+__all__ = [
+    'import_lazily',
+    'lazy_exports',
+]
+
+
+def import_lazily(module_name: str, package: str) -> ModuleType:
+    """ ``importlib.import_module`` for the lazy attributes. Once the addon is registered, the ackit modules
+        it imports missed the registration: their ``register`` callbacks are called (``AddonLoader.register_loaded_modules``). """
+    module = importlib.import_module(module_name, package)
+    # Not imported if the addon doesn't use the AddonLoader.
+    if (addon_loader := sys.modules.get(f'{__package__}.core.addon_loader', None)) is not None:
+        addon_loader.AddonLoader.register_loaded_modules()
+    return module
+
+
+def lazy_exports(package: str, module_globals: Dict[str, Any], exports: Dict[str, Tuple[str, str]]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """ Build the module-level ``__getattr__`` and ``__dir__`` (PEP 562) of a package.
+
+        ``exports`` maps each public name to ``(module, attr)``, where ``module`` is relative to ``package``
+        and ``attr`` is the attribute to get from it (or ``None`` to expose the module itself).
+        Resolved names are stored in the package globals, so ``__getattr__`` is only hit once per name. """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module_name, attr_name = exports[name]
+        except KeyError:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'") from None
+        value = import_lazily(module_name, package)
+        if attr_name is not None:
+            value = getattr(value, attr_name)
+        module_globals[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(module_globals) | set(exports))
+
+    return __getattr__, __dir__
@@ -1,10 +1,54 @@
-from .handlers import Handlers
-from .keymaps import RegisterKeymap
-from .timer import new_timer, new_timer_as_decorator
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .async_loop import AsyncLoop
+    from .depsgraph_updates import subscribe_to_depsgraph_updates, unsubscribe_from_depsgraph_updates
+    from .handlers import Handlers
+    from .jobs import Jobs
+    from .keymaps import RegisterKeymap
+    from .playback import PlaybackDispatcher, frame_change_handler
+    from .process_pool import ProcessPool, SharedArray
+    from .render_pipeline import RenderPipeline, render_post_process
+    from .rate_limit import RateLimiter, debounce, throttle, coalesce_per_tick
+    from .timer import new_timer, new_timer_as_decorator
+    from .work_queue import WorkQueue
 
 __all__ = [
+    'AsyncLoop',
+    'subscribe_to_depsgraph_updates',
+    'unsubscribe_from_depsgraph_updates',
     'Handlers',
+    'Jobs',
     'RegisterKeymap',
+    'PlaybackDispatcher',
+    'frame_change_handler',
+    'ProcessPool',
+    'SharedArray',
+    'RenderPipeline',
+    'render_post_process',
+    'RateLimiter',
+    'debounce',
+    'throttle',
+    'coalesce_per_tick',
     'new_timer',
     'new_timer_as_decorator',
-] 
\ No newline at end of file
+    'WorkQueue',
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), {
+    'AsyncLoop': ('.async_loop', 'AsyncLoop'),
+    **{name: ('.depsgraph_updates', name) for name in ('subscribe_to_depsgraph_updates', 'unsubscribe_from_depsgraph_updates')},
+    'Handlers': ('.handlers', 'Handlers'),
+    'Jobs': ('.jobs', 'Jobs'),
+    'RegisterKeymap': ('.keymaps', 'RegisterKeymap'),
+    **{name: ('.playback', name) for name in ('PlaybackDispatcher', 'frame_change_handler')},
+    'ProcessPool': ('.process_pool', 'ProcessPool'),
+    'SharedArray': ('.process_pool', 'SharedArray'),
+    **{name: ('.render_pipeline', name) for name in ('RenderPipeline', 'render_post_process')},
+    **{name: ('.rate_limit', name) for name in ('RateLimiter', 'debounce', 'throttle', 'coalesce_per_tick')},
+    'new_timer': ('.timer', 'new_timer'),
+    'new_timer_as_decorator': ('.timer', 'new_timer_as_decorator'),
+    'WorkQueue': ('.work_queue', 'WorkQueue'),
+})
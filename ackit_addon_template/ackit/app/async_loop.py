@@ -0,0 +1,153 @@
+""" asyncio event loop stepped from a timer, in Blender's main thread.
+
+Each step runs a single iteration of the loop without blocking (ready callbacks, finished I/O,
+due ``call_later``). Steps are frequent while tasks are making progress and back off up to
+``AsyncLoop.max_interval`` while they wait (work scheduled from other threads, such as a finished
+``run_in_thread``, resets it), the timer stops when there are no tasks left. The loop is only the
+running one during a step, the event loop set for the main thread (by another addon...) is kept.
+Since the loop runs in the main thread, coroutines and their done callbacks can use bpy,
+while blocking work is awaited from threads (``AsyncLoop.run_in_thread``), subprocesses, etc.
+
+    async def index_assets(context):
+        listing = await ACK.App.Async.run_in_thread(scan_library, path)
+        context.window_manager.my_assets.update(listing)  # Main thread.
+
+    ACK.App.Async.run(index_assets(bpy.context))
+"""
+
+import sys
+import asyncio
+import traceback
+from typing import Any, Callable, Coroutine, Optional
+
+from ..debug.output import print_debug
+from .timer import new_timer, TimerHandler
+
+
+__all__ = [
+    'AsyncLoop',
+]
+
+
+def _on_timer():
+    return AsyncLoop.step()
+
+
+class _EventLoop(asyncio.ProactorEventLoop if sys.platform == 'win32' else asyncio.SelectorEventLoop):
+    def call_soon_threadsafe(self, callback, *args, context=None):
+        # Used by 'run_in_executor' futures, 'run_coroutine_threadsafe'...
+        AsyncLoop._woken = True
+        return super().call_soon_threadsafe(callback, *args, context=context)
+
+
+class AsyncLoop:
+    """ Addon asyncio event loop, driven by a timer. """
+
+    min_interval: float = 0.01
+    max_interval: float = 0.25
+
+    loop: Optional[asyncio.AbstractEventLoop] = None
+    timer: Optional[TimerHandler] = None
+    interval: float = min_interval
+    _task_count: int = 0
+    # Work was scheduled from another thread since the last step.
+    _woken: bool = False
+
+    @classmethod
+    def get_loop(cls) -> asyncio.AbstractEventLoop:
+        if cls.loop is None or cls.loop.is_closed():
+            cls.loop = _EventLoop()
+            cls.loop.set_exception_handler(cls._exception_handler)
+        return cls.loop
+
+    @classmethod
+    def run(cls, coro: Coroutine, on_done: Optional[Callable[[asyncio.Task], None]] = None) -> asyncio.Task:
+        """ Schedule the coroutine in the addon loop. ``on_done(task)`` is called in the main thread when it finishes. """
+        task = cls.get_loop().create_task(coro)
+        task.add_done_callback(cls._report_task)
+        if on_done is not None:
+            task.add_done_callback(on_done)
+        cls.wake()
+        return task
+
+    @classmethod
+    def run_in_thread(cls, func: Callable[..., Any], *args) -> asyncio.Future:
+        """ Awaitable running ``func(*args)`` in the loop thread pool. """
+        return cls.get_loop().run_in_executor(None, func, *args)
+
+    @classmethod
+    def wake(cls) -> None:
+        """ Step the loop as soon as possible. """
+        cls.interval = cls.min_interval
+        if cls.timer is None:
+            # Persistent: the tasks survive loading a file, and so must the handle.
+            cls.timer = new_timer(_on_timer, first_interval=0, step_interval=cls.min_interval, one_time_only=False, persistent=True)
+
+    @classmethod
+    def run_once(cls) -> None:
+        """ Run a single iteration of the loop without blocking. """
+        loop = cls.get_loop()
+        # 'stop' is a ready callback, so the loop polls its selector without waiting and returns.
+        loop.call_soon(loop.stop)
+        # No 'set_event_loop', it's the running loop meanwhile (coroutines get it from 'get_event_loop' too).
+        loop.run_forever()
+
+    @classmethod
+    def step(cls):
+        """ Timer callback. Returns the delay until the next step, -1 once there are no tasks left. """
+        if cls.loop is None or cls.loop.is_closed():
+            cls.timer = None
+            return -1
+        cls.run_once()
+        woken, cls._woken = cls._woken, False
+        task_count = len(asyncio.all_tasks(cls.loop))
+        if task_count == 0:
+            cls.timer = None
+            return -1
+        if woken or task_count != cls._task_count:
+            # Some task started, finished or got a result from another thread, keep it responsive.
+            cls.interval = cls.min_interval
+        else:
+            cls.interval = min(cls.interval * 1.5, cls.max_interval)
+        cls._task_count = task_count
+        return cls.interval
+
+    @classmethod
+    def stop(cls) -> None:
+        """ Cancel the pending tasks and close the loop. """
+        if cls.timer is not None:
+            cls.timer.stop()
+            cls.timer = None
+        loop = cls.loop
+        if loop is None or loop.is_closed():
+            return
+        tasks = asyncio.all_tasks(loop)
+        for task in tasks:
+            task.cancel()
+        try:
+            if tasks:
+                loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            loop.close()
+            cls.loop = None
+            cls._task_count = 0
+            cls._woken = False
+
+    @staticmethod
+    def _report_task(task: asyncio.Task) -> None:
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            print_debug(f"Async task '{task.get_name()}' failed!")
+            traceback.print_exception(type(exc), exc, exc.__traceback__)
+
+    @staticmethod
+    def _exception_handler(loop: asyncio.AbstractEventLoop, context: dict) -> None:
+        if 'exception' in context and isinstance(context.get('future', None), asyncio.Task):
+            # Already reported by '_report_task'.
+            return
+        loop.default_exception_handler(context)
+
+
+def unregister():
+    AsyncLoop.stop()
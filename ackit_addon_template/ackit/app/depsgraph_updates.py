@@ -0,0 +1,135 @@
+""" Filtered depsgraph update subscriptions.
+
+    @ACK.App.DepsgraphUpdate(id_type='MESH', geometry=True)
+    def on_mesh_edit(context, depsgraph, updates):
+        for update in updates:
+            ...
+
+A single ``DEPSGRAPH_UPDATE_POST`` handler iterates ``depsgraph.updates`` once, indexing the
+updates by ID type and datablock, and only calls the subscribers having matching updates, with
+them. Filters (all optional, combined):
+- ``id_type``: ``ID.id_type`` or set of them ('OBJECT', 'MESH', 'MATERIAL'...).
+- ``datablocks``: IDs to watch (matched by ``session_uid``, so it survives undo). They can be changed
+  later with ``get_depsgraph_subscription(callback).set_datablocks(...)``.
+- ``transform``, ``geometry``, ``shading``: only updates with any of the flagged changes.
+
+Subscribers get ``DepsgraphUpdateSnapshot`` copies (``session_uid``, ``name``, ``id_type``, the
+``is_updated_*`` flags and an ``id`` lookup), as the updates are only valid during the handler call.
+So rate limited subscribers can keep them: their deferred call gets the matches of every trigger, merged.
+"""
+
+import traceback
+from typing import Callable, Dict, Iterable, List, Optional, Set, Union
+
+from bpy.types import ID, Depsgraph
+
+from .handlers import Handlers, keep_persistent, replace_by_key
+from .rate_limit import DepsgraphUpdates, DepsgraphUpdateSnapshot, RateLimiter
+
+
+__all__ = [
+    'DepsgraphSubscription',
+    'get_depsgraph_subscription',
+    'subscribe_to_depsgraph_updates',
+    'unsubscribe_from_depsgraph_updates',
+]
+
+
+class DepsgraphSubscription:
+    def __init__(self, callback: Callable, id_types: Optional[Set[str]], datablocks: Optional[Iterable[ID]],
+                 transform: bool, geometry: bool, shading: bool, persistent: bool) -> None:
+        self.callback = callback
+        self.id_types = id_types
+        self.session_uids: Optional[Set[int]] = None
+        self.transform = transform
+        self.geometry = geometry
+        self.shading = shading
+        self.persistent = persistent
+        if datablocks is not None:
+            self.set_datablocks(datablocks)
+
+    @property
+    def key(self) -> tuple:
+        return (getattr(self.callback, '__module__', ''), getattr(self.callback, '__qualname__', repr(self.callback)))
+
+    @property
+    def has_flags(self) -> bool:
+        return self.transform or self.geometry or self.shading
+
+    def set_datablocks(self, datablocks: Optional[Iterable[ID]]) -> None:
+        """ IDs to watch, None to watch any. """
+        self.session_uids = None if datablocks is None else {datablock.original.session_uid for datablock in datablocks}
+
+    def match_flags(self, update: DepsgraphUpdateSnapshot) -> bool:
+        return (self.transform and update.is_updated_transform) \
+            or (self.geometry and update.is_updated_geometry) \
+            or (self.shading and update.is_updated_shading)
+
+
+subscriptions: List[DepsgraphSubscription] = []
+
+
+def subscribe_to_depsgraph_updates(id_type: Union[str, Iterable[str], None] = None,
+                                   datablocks: Optional[Iterable[ID]] = None,
+                                   transform: bool = False, geometry: bool = False, shading: bool = False,
+                                   persistent: bool = False):
+    ''' Use as a decorator. The target function gets the context, the depsgraph and its matching updates.
+        Rate limit decorators ('debounce', 'throttle', 'coalesce_per_tick') go below this one. '''
+    id_types = None if id_type is None else {id_type} if isinstance(id_type, str) else set(id_type)
+
+    def decorator(decorated_func):
+        replace_by_key(subscriptions, DepsgraphSubscription(decorated_func, id_types, datablocks, transform, geometry, shading, persistent))
+        return decorated_func
+    return decorator
+
+
+def get_depsgraph_subscription(callback: Callable) -> Optional[DepsgraphSubscription]:
+    for subscription in subscriptions:
+        if subscription.callback is callback:
+            return subscription
+    return None
+
+
+def unsubscribe_from_depsgraph_updates(callback: Callable) -> None:
+    RateLimiter.flush_callbacks([callback])
+    subscriptions[:] = [subscription for subscription in subscriptions if subscription.callback is not callback]
+
+
+@Handlers.DEPSGRAPH_UPDATE_POST(persistent=True)
+def _on_depsgraph_update_post(context, scene, depsgraph: Depsgraph):
+    if not subscriptions:
+        return
+
+    # Single pass over the updates, snapshotted.
+    updates = DepsgraphUpdates.from_updates(depsgraph.updates)
+    by_type: Dict[str, List[DepsgraphUpdateSnapshot]] = {}
+    by_uid: Dict[int, List[DepsgraphUpdateSnapshot]] = {}
+    for update in updates:
+        by_type.setdefault(update.id_type, []).append(update)
+        by_uid.setdefault(update.session_uid, []).append(update)
+
+    for subscription in tuple(subscriptions):
+        if subscription.session_uids is not None:
+            matched = DepsgraphUpdates(update for uid in subscription.session_uids for update in by_uid.get(uid, ()))
+            if subscription.id_types is not None:
+                matched = DepsgraphUpdates(update for update in matched if update.id_type in subscription.id_types)
+        elif subscription.id_types is not None:
+            matched = DepsgraphUpdates(update for id_type in subscription.id_types for update in by_type.get(id_type, ()))
+        else:
+            matched = DepsgraphUpdates(updates)
+        if matched and subscription.has_flags:
+            matched = DepsgraphUpdates(update for update in matched if subscription.match_flags(update))
+        if matched:
+            try:
+                subscription.callback(context, depsgraph, matched)
+            except Exception:
+                traceback.print_exc()
+
+
+@Handlers.LOAD_PRE(persistent=True)
+def _on_load_pre(context, *args):
+    keep_persistent(subscriptions)
+
+
+def unregister():
+    RateLimiter.flush_callbacks([subscription.callback for subscription in subscriptions])
@@ -1,15 +1,141 @@
+""" Handlers of ``bpy.app.handlers``.
+
+ACK appends a single dispatcher function per handler list, which calls the registered callbacks
+(``context`` plus the handler arguments) from a prebuilt tuple, fetching the context once.
+Callbacks can be disabled without unregistering them, and their calls are timed (see
+``Handlers.get_stats``). As with bpy handlers, non persistent callbacks are dropped when a file is loaded.
+"""
+
+import time
+import traceback
 from enum import Enum, auto
 from collections import defaultdict
-from functools import wraps
+from typing import Callable, List, Optional
 
 import bpy
 from bpy.app import handlers
 
-from ..debug import debug_context, print_debug
+from ..debug import debug_context
+from .rate_limit import RateLimiter
+
+
+class HandlerCallback:
+    __slots__ = ('function', 'persistent', 'enabled', 'calls', 'total_time', 'max_time')
+
+    def __init__(self, function: Callable, persistent: bool) -> None:
+        self.function = function
+        self.persistent = persistent
+        self.enabled = True
+        self.calls = 0
+        self.total_time = 0.0  # Seconds.
+        self.max_time = 0.0
+
+    @property
+    def name(self) -> str:
+        return getattr(self.function, '__qualname__', repr(self.function))
+
+    @property
+    def module(self) -> str:
+        return getattr(self.function, '__module__', '')
+
+    def reset_stats(self) -> None:
+        self.calls = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+
+class HandlerDispatcher:
+    """ The function in the ``bpy.app.handlers`` list, calling every enabled callback of a handler type. """
+
+    # Whether to time every callback call.
+    collect_stats: bool = True
+
+    def __init__(self, handler_type: str) -> None:
+        self.handler_type = handler_type
+        self.callbacks: List[HandlerCallback] = []
+        self.active: tuple = ()
+
+        def dispatch(*args):
+            self.dispatch(*args)
+        dispatch.__name__ = dispatch.__qualname__ = f'ackit_{handler_type.lower()}_dispatcher'
+        # The dispatcher stays, non persistent callbacks are dropped by the LOAD_PRE one.
+        self.function = handlers.persistent(dispatch)
+
+    @property
+    def handler_list(self) -> list:
+        return getattr(handlers, self.handler_type.lower())
+
+    def update(self) -> None:
+        """ Rebuild the tuple of enabled callbacks and (un)install the dispatcher if needed. """
+        self.active = tuple(callback for callback in self.callbacks if callback.enabled)
+        handler_list = self.handler_list
+        if self.callbacks or self.handler_type == 'LOAD_PRE':
+            if self.function not in handler_list:
+                handler_list.append(self.function)
+        elif self.function in handler_list:
+            handler_list.remove(self.function)
+
+    def dispatch(self, *args) -> None:
+        context = bpy.context
+        if not HandlerDispatcher.collect_stats:
+            for callback in self.active:
+                try:
+                    callback.function(context, *args)
+                except Exception:
+                    traceback.print_exc()
+        else:
+            perf_counter = time.perf_counter
+            for callback in self.active:
+                start = perf_counter()
+                try:
+                    callback.function(context, *args)
+                except Exception:
+                    traceback.print_exc()
+                elapsed = perf_counter() - start
+                callback.calls += 1
+                callback.total_time += elapsed
+                if elapsed > callback.max_time:
+                    callback.max_time = elapsed
+        if self.handler_type == 'LOAD_PRE':
+            _drop_non_persistent()
+
+
+# Declared callbacks (registered or not) and dispatchers, per handler type name.
+to_register_handlers: dict[str, List[HandlerCallback]] = defaultdict(list)
+dispatchers: dict[str, HandlerDispatcher] = {}
+_registered = False
 
 
-to_register_handlers: dict[str, list] = defaultdict(list)
-registered_handlers: dict[str, list] = defaultdict(list)
+def _get_dispatcher(handler_type: str) -> HandlerDispatcher:
+    if (dispatcher := dispatchers.get(handler_type, None)) is None:
+        dispatcher = dispatchers[handler_type] = HandlerDispatcher(handler_type)
+    return dispatcher
+
+
+def keep_persistent(callbacks: list) -> list:
+    """ Same as bpy handlers: only the persistent ones survive loading a file.
+        Filters the list (of items with a ``persistent`` attribute) in place, returns the dropped ones. """
+    dropped = [callback for callback in callbacks if not callback.persistent]
+    if dropped:
+        callbacks[:] = [callback for callback in callbacks if callback.persistent]
+    return dropped
+
+
+def replace_by_key(items: list, item) -> list:
+    """ Append ``item``, replacing the items with its ``key`` (declared by a previous import of its module, on hot reload).
+        Returns the replaced ones. """
+    key = item.key
+    replaced = [_item for _item in items if _item.key == key]
+    if replaced:
+        items[:] = [_item for _item in items if _item.key != key]
+    items.append(item)
+    return replaced
+
+
+def _drop_non_persistent() -> None:
+    for dispatcher in dispatchers.values():
+        if keep_persistent(dispatcher.callbacks):
+            dispatcher.update()
 
 
 class Handlers(Enum):
@@ -47,45 +173,108 @@ class Handlers(Enum):
     SAVE_POST = auto()
 
     def __call__(self, persistent: bool = False):
-        ''' Use as a decorator. Only 1 parameter is required in target function, which is context. '''
+        ''' Use as a decorator. Only 1 parameter is required in target function, which is context.
+            Rate limit decorators ('debounce', 'throttle', 'coalesce_per_tick') go below this one. '''
         def decorator(deco_fun):
-            def callback_deco(_deco_fun):
-                @wraps(_deco_fun)
-                def wrapper(*args, **kwargs):
-                    print_debug(f"{self.name} Handler was called! - '{_deco_fun.__name__}', in module '{_deco_fun.__module__}'") # _deco_fun.handler_type
-                    _deco_fun(bpy.context, *args)
-                    return None
-                return wrapper
-
-            deco_fun = callback_deco(deco_fun)
-            # setattr(deco_fun, 'handler_type', self.name)
-            if persistent:
-                deco_fun = handlers.persistent(deco_fun)
-            # getattr(handlers, self.name.lower()).append(deco_fun)
-            to_register_handlers[self.name].append(deco_fun)
+            callback = HandlerCallback(deco_fun, persistent)
+            to_register_handlers[self.name].append(callback)
+            if _registered:
+                # Declared after registration, e.g. by a module imported on first use.
+                dispatcher = _get_dispatcher(self.name)
+                dispatcher.callbacks.append(callback)
+                dispatcher.update()
             return deco_fun
         return decorator
 
+    def _get_callback(self, function: Callable) -> Optional[HandlerCallback]:
+        for callback in to_register_handlers.get(self.name, ()):
+            if callback.function is function:
+                return callback
+        return None
+
+    def set_enabled(self, function: Callable, enabled: bool) -> None:
+        ''' Enable or disable a callback without unregistering it. '''
+        if (callback := self._get_callback(function)) is None:
+            raise ValueError(f"'{getattr(function, '__qualname__', function)}' is not a {self.name} handler")
+        callback.enabled = enabled
+        if (dispatcher := dispatchers.get(self.name, None)) is not None:
+            dispatcher.update()
+
+    def is_enabled(self, function: Callable) -> bool:
+        callback = self._get_callback(function)
+        return callback is not None and callback.enabled
+
+    def get_stats(self) -> List[HandlerCallback]:
+        ''' Registered callbacks, slowest (cumulative time) first. '''
+        if (dispatcher := dispatchers.get(self.name, None)) is None:
+            return []
+        return sorted(dispatcher.callbacks, key=lambda callback: callback.total_time, reverse=True)
+
+    def reset_stats(self) -> None:
+        if (dispatcher := dispatchers.get(self.name, None)) is not None:
+            for callback in dispatcher.callbacks:
+                callback.reset_stats()
+
     def unregister_all(self):
-        if self.name not in registered_handlers:
+        if (dispatcher := dispatchers.pop(self.name, None)) is None:
             return
-        handler_type = getattr(handlers, self.name.lower())
-        for handler in registered_handlers[self.name]:
-            if handler in handler_type:
-                handler_type.remove(handler)
-        del registered_handlers[self.name]
+        # Run the calls deferred by rate limited ('debounce'...) handlers.
+        RateLimiter.flush_callbacks([callback.function for callback in dispatcher.callbacks])
+        dispatcher.callbacks.clear()
+        if dispatcher.function in dispatcher.handler_list:
+            dispatcher.handler_list.remove(dispatcher.function)
+
+
+@Handlers.LOAD_PRE(persistent=True)
+def _flush_rate_limited(context, *args):
+    # Run the deferred calls while the data of the current file is still valid.
+    RateLimiter.flush()
 
 
 def register():
+    global _registered
+    _registered = True
     with debug_context('Handlers') as _print_debug:
-        for handler_type, handler_funcs in to_register_handlers.items():
+        for handler_type, handler_callbacks in to_register_handlers.items():
             _print_debug(f"{handler_type}:", indent=1, prefix='>')
-            handler_list = getattr(handlers, handler_type.lower())
-            for handler_fun in handler_funcs:
-                handler_list.append(handler_fun)
-                registered_handlers[handler_type].append(handler_fun)
-                _print_debug(f"'{handler_fun.__name__}', in module '{handler_fun.__module__}'", indent=2, prefix='-')
+            dispatcher = _get_dispatcher(handler_type)
+            for callback in handler_callbacks:
+                if callback not in dispatcher.callbacks:
+                    dispatcher.callbacks.append(callback)
+                _print_debug(f"'{callback.name}', in module '{callback.module}'", indent=2, prefix='-')
+            dispatcher.update()
+        _get_dispatcher(Handlers.LOAD_PRE.name).update()
 
 def unregister():
+    global _registered
+    _registered = False
     for handler_type in Handlers:
         handler_type.unregister_all()
+
+
+# Per-module (un)registration, used by the hot reload.
+# ----------------------------------------------------------------
+
+def unregister_module_handlers(module_name: str) -> None:
+    for handler_type, handler_callbacks in to_register_handlers.items():
+        module_callbacks = [callback for callback in handler_callbacks if callback.module == module_name]
+        RateLimiter.flush_callbacks([callback.function for callback in module_callbacks])
+        for callback in module_callbacks:
+            handler_callbacks.remove(callback)
+        if (dispatcher := dispatchers.get(handler_type, None)) is not None:
+            dispatcher.callbacks = [callback for callback in dispatcher.callbacks if callback.module != module_name]
+            dispatcher.update()
+
+
+def register_module_handlers(module_name: str) -> None:
+    for handler_type, handler_callbacks in to_register_handlers.items():
+        module_callbacks = [callback for callback in handler_callbacks if callback.module == module_name]
+        if not module_callbacks:
+            continue
+        dispatcher = _get_dispatcher(handler_type)
+        for callback in module_callbacks:
+            if callback not in dispatcher.callbacks:
+                dispatcher.callbacks.append(callback)
+        # Keep the declaration order.
+        dispatcher.callbacks.sort(key=handler_callbacks.index)
+        dispatcher.update()
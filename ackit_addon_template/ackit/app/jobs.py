@@ -0,0 +1,299 @@
+""" Job system: heavy work in a worker pool, callbacks back in the main thread.
+
+``Jobs.submit(fn, *args)`` queues the call by priority and runs it in a thread pool
+(or the ``ProcessPool`` with ``use_process=True``). Results, errors and progress are pushed to
+a thread-safe queue, drained from a timer within ``Jobs.budget`` seconds per tick, so
+``on_done``/``on_error``/``on_progress`` callbacks can use bpy.
+
+Thread jobs can get their ``Job`` with ``Jobs.current()`` to report progress and check
+their cancellation token:
+
+    def bake(path):
+        job = Jobs.current()
+        for i, item in enumerate(items):
+            job.token.raise_if_cancelled()
+            ...
+            job.report_progress((i + 1) / len(items))
+
+    job = Jobs.submit(bake, path, priority=10, on_done=apply_result, on_progress=update_bar)
+    job.cancel()
+"""
+
+import os
+import time
+import heapq
+import queue
+import threading
+import itertools
+import traceback
+from enum import Enum, auto
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from ..globals import GLOBALS
+from .timer import new_timer, TimerHandler
+
+
+__all__ = [
+    'CancellationToken',
+    'Job',
+    'JobCancelled',
+    'JobState',
+    'Jobs',
+]
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class CancellationToken:
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise JobCancelled()
+
+
+class JobState(Enum):
+    PENDING = auto()
+    RUNNING = auto()
+    DONE = auto()
+    FAILED = auto()
+    CANCELLED = auto()
+
+
+class Job:
+    def __init__(self, fn: Callable, args: tuple, kwargs: Dict[str, Any], priority: int, use_process: bool,
+                 on_done: Optional[Callable[[Any], None]], on_error: Optional[Callable[[BaseException], None]],
+                 on_progress: Optional[Callable[[float, str], None]]) -> None:
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.use_process = use_process
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.token = CancellationToken()
+        self.state = JobState.PENDING
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.progress: float = 0.0
+        self.progress_message: str = ''
+        self._progress_queued = False
+
+    @property
+    def name(self) -> str:
+        return getattr(self.fn, '__qualname__', repr(self.fn))
+
+    @property
+    def is_finished(self) -> bool:
+        return self.state in (JobState.DONE, JobState.FAILED, JobState.CANCELLED)
+
+    def cancel(self) -> None:
+        """ Pending jobs never run, running thread jobs stop at their next token check.
+            Process jobs can't check the token (nor get their ``Job``), once running they run to completion. """
+        self.token.cancel()
+
+    def report_progress(self, progress: float, message: str = '') -> None:
+        """ Thread safe, for thread jobs (process jobs can't get their ``Job``). Only the latest progress reaches 'on_progress'. """
+        self.progress = progress
+        self.progress_message = message
+        if self.on_progress is not None and not self._progress_queued:
+            self._progress_queued = True
+            Jobs._completions.put((self, None))
+
+
+class Jobs:
+    """ Worker pools and main thread completion queue. """
+
+    max_workers: int = max(1, min(8, (os.cpu_count() or 2) - 1))
+    max_processes: int = os.cpu_count() or 1
+    # Max seconds spent running callbacks per timer tick.
+    budget: float = 0.004
+    interval: float = 0.02
+
+    _lock = threading.Lock()
+    _local = threading.local()
+    _counter = itertools.count()
+    _completions: 'queue.SimpleQueue[Tuple[Job, Optional[JobState]]]' = queue.SimpleQueue()
+    # (use_process) -> heap of (-priority, order, job).
+    _pending: Dict[bool, List[Tuple[int, int, Job]]] = {False: [], True: []}
+    _running: Dict[bool, int] = {False: 0, True: 0}
+    _active: Set[Job] = set()
+    _thread_executor: Optional[ThreadPoolExecutor] = None
+    _timer: Optional[TimerHandler] = None
+
+    @classmethod
+    def submit(cls, fn: Callable, *args, priority: int = 0, use_process: bool = False,
+               on_done: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[BaseException], None]] = None,
+               on_progress: Optional[Callable[[float, str], None]] = None,
+               **kwargs) -> Job:
+        """ Run ``fn(*args, **kwargs)`` in a worker, higher ``priority`` first.
+            With ``use_process``, see ``ProcessPool.submit``, ``fn`` can't use ``Jobs.current()`` so no ``on_progress``. """
+        if use_process and on_progress is not None:
+            raise ValueError("Jobs.submit: process jobs can't report progress, 'on_progress' requires a thread job")
+        job = Job(fn, args, kwargs, priority, use_process, on_done, on_error, on_progress)
+        with cls._lock:
+            heapq.heappush(cls._pending[use_process], (-priority, next(cls._counter), job))
+        cls._dispatch(use_process)
+        if cls._timer is None:
+            # Persistent: running jobs survive loading a file, and so must the handle.
+            cls._timer = new_timer(cls._on_timer, first_interval=cls.interval, step_interval=cls.interval, one_time_only=False, persistent=True)
+        return job
+
+    @classmethod
+    def current(cls) -> Optional[Job]:
+        """ Job running in the current worker thread. """
+        return getattr(cls._local, 'job', None)
+
+    # Workers.
+    ########################################################################
+
+    @classmethod
+    def _get_thread_executor(cls) -> ThreadPoolExecutor:
+        if cls._thread_executor is None:
+            cls._thread_executor = ThreadPoolExecutor(max_workers=cls.max_workers, thread_name_prefix=f'{GLOBALS.ADDON_MODULE_SHORT}_job')
+        return cls._thread_executor
+
+    @classmethod
+    def _dispatch(cls, use_process: bool) -> None:
+        """ Hand pending jobs to the pool while it has free workers, so priorities are kept. """
+        limit = cls.max_processes if use_process else cls.max_workers
+        while True:
+            with cls._lock:
+                if cls._running[use_process] >= limit or not cls._pending[use_process]:
+                    return
+                job = heapq.heappop(cls._pending[use_process])[2]
+                if job.token.cancelled:
+                    job.state = JobState.CANCELLED
+                    cls._completions.put((job, JobState.CANCELLED))
+                    continue
+                cls._running[use_process] += 1
+                cls._active.add(job)
+                job.state = JobState.RUNNING
+            try:
+                if use_process:
+                    from .process_pool import ProcessPool
+                    future = ProcessPool.submit(job.fn, *job.args, **job.kwargs)
+                else:
+                    future = cls._get_thread_executor().submit(cls._run_job, job)
+            except Exception as e:
+                # Broken or shut down pool, function without source file...
+                job.error = e
+                with cls._lock:
+                    cls._running[use_process] -= 1
+                    cls._active.discard(job)
+                cls._completions.put((job, JobState.FAILED))
+                continue
+            future.add_done_callback(lambda future, job=job: cls._on_job_finished(job, future))
+
+    @classmethod
+    def _run_job(cls, job: Job) -> Any:
+        cls._local.job = job
+        try:
+            return job.fn(*job.args, **job.kwargs)
+        finally:
+            cls._local.job = None
+
+    @classmethod
+    def _on_job_finished(cls, job: Job, future: Future) -> None:
+        # Worker thread (or the process pool management thread).
+        try:
+            job.result = future.result()
+            state = JobState.DONE
+        except JobCancelled:
+            state = JobState.CANCELLED
+        except BaseException as e:
+            job.error = e
+            state = JobState.FAILED
+        with cls._lock:
+            cls._running[job.use_process] -= 1
+            cls._active.discard(job)
+        cls._completions.put((job, state))
+        cls._dispatch(job.use_process)
+
+    # Main thread.
+    ########################################################################
+
+    @classmethod
+    def drain(cls, budget: Optional[float] = None) -> bool:
+        """ Run the completion callbacks for up to ``budget`` seconds. Returns True if the queue was emptied. """
+        deadline = time.perf_counter() + (cls.budget if budget is None else budget)
+        while True:
+            try:
+                job, state = cls._completions.get_nowait()
+            except queue.Empty:
+                return True
+            try:
+                if state is None:
+                    job._progress_queued = False
+                    if not job.is_finished:
+                        job.on_progress(job.progress, job.progress_message)
+                else:
+                    job.state = state
+                    if state == JobState.DONE and job.on_done is not None:
+                        job.on_done(job.result)
+                    elif state == JobState.FAILED:
+                        if job.on_error is not None:
+                            job.on_error(job.error)
+                        else:
+                            print(f'[{GLOBALS.ADDON_MODULE_UPPER}]', f"Job '{job.name}' failed!")
+                            traceback.print_exception(type(job.error), job.error, job.error.__traceback__)
+            except Exception:
+                traceback.print_exc()
+            if time.perf_counter() >= deadline:
+                return False
+
+    @classmethod
+    def is_idle(cls) -> bool:
+        with cls._lock:
+            return not any(cls._running.values()) and not any(cls._pending.values())
+
+    @classmethod
+    def _on_timer(cls):
+        if not cls.drain():
+            # Over budget, keep draining on the next tick.
+            return cls.interval
+        if cls.is_idle() and cls._completions.empty():
+            cls._timer = None
+            return -1
+        return None
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """ Cancel every job and wait for the running ones. Callbacks are not called anymore. """
+        if cls._timer is not None:
+            cls._timer.stop()
+            cls._timer = None
+        with cls._lock:
+            for pending in cls._pending.values():
+                for _priority, _order, job in pending:
+                    job.cancel()
+                    job.state = JobState.CANCELLED
+                pending.clear()
+            for job in cls._active:
+                job.cancel()
+        if cls._thread_executor is not None:
+            cls._thread_executor.shutdown(wait=True, cancel_futures=True)
+            cls._thread_executor = None
+        # The process pool is shut down by its own module.
+        while True:
+            try:
+                cls._completions.get_nowait()
+            except queue.Empty:
+                break
+
+
+def unregister():
+    Jobs.shutdown()
@@ -0,0 +1,283 @@
+""" Budgeted frame change callbacks, for playback.
+
+    @ACK.App.FrameChange(budget_ms=1.5, priority=2)
+    def update_hud(context, scene, depsgraph):
+        ...
+
+    @ACK.App.FrameChange(critical=True)
+    def drive_rig(context, scene, depsgraph):
+        ...
+
+While the animation is playing, the callbacks run in priority order (critical ones first) and
+share a per-frame budget, ``budget_fraction`` of the scene frame time. A non critical callback
+doesn't run when playback is behind (frames taking longer than the scene fps) or when the
+remaining budget is lower than its declared budget (or measured cost, if higher): it is deferred
+and runs once, for the current frame, when playback stops (or skipped if ``catch_up=False``).
+Out of playback (scrubbing, rendering, ``frame_set``) every callback runs.
+Each frame is recorded (time spent, skipped/deferred callbacks, overrun) in ``PlaybackDispatcher.records``.
+"""
+
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional
+
+import bpy
+from bpy.types import Depsgraph
+
+from .handlers import Handlers, keep_persistent, replace_by_key
+from .timer import new_timer, TimerHandler
+
+
+__all__ = [
+    'FrameCallback',
+    'FrameRecord',
+    'PlaybackDispatcher',
+    'frame_change_handler',
+]
+
+
+class FrameCallback:
+    __slots__ = ('function', 'pre', 'budget', 'priority', 'critical', 'catch_up', 'persistent',
+                 'cost', 'calls', 'overruns', 'skipped', 'deferred', 'pending_args')
+
+    def __init__(self, function: Callable, pre: bool, budget: float, priority: int, critical: bool, catch_up: bool, persistent: bool) -> None:
+        self.function = function
+        self.pre = pre
+        self.budget = budget  # Seconds.
+        self.priority = priority
+        self.critical = critical
+        self.catch_up = catch_up
+        self.persistent = persistent
+        self.cost: Optional[float] = None  # Moving average of its duration.
+        self.calls = 0
+        self.overruns = 0  # Calls taking longer than its budget.
+        self.skipped = 0
+        self.deferred = 0
+        self.pending_args: Optional[tuple] = None
+
+    @property
+    def key(self) -> tuple:
+        return (getattr(self.function, '__module__', ''), getattr(self.function, '__qualname__', repr(self.function)), self.pre)
+
+    def reset_stats(self) -> None:
+        self.cost = None
+        self.calls = self.overruns = self.skipped = self.deferred = 0
+
+
+@dataclass
+class FrameRecord:
+    frame: int
+    budget: float  # Seconds.
+    frame_time: float  # Time since the previous frame change.
+    elapsed: float = 0.0  # Time spent in the callbacks.
+    behind: bool = False
+    skipped: int = 0
+    deferred: int = 0
+
+    @property
+    def overrun(self) -> float:
+        return max(0.0, self.elapsed - self.budget)
+
+
+class PlaybackDispatcher:
+    """ Runs the ``frame_change_handler`` callbacks, within a frame budget during playback. """
+
+    # Share of the scene frame time the callbacks can use.
+    budget_fraction: float = 0.5
+    # Playback is behind when frames take longer than the scene frame time times this.
+    behind_tolerance: float = 1.2
+    catch_up_interval: float = 0.1
+    # Frames kept in 'records', can be changed at any time.
+    history_size: int = 250
+
+    callbacks: List[FrameCallback] = []
+    records: Deque[FrameRecord] = deque(maxlen=history_size)
+    frame_time: Optional[float] = None  # Moving average of the time between frame changes.
+    _last_frame_change: Optional[float] = None
+    _record: Optional[FrameRecord] = None
+    _remaining: float = 0.0
+    _timer: Optional[TimerHandler] = None
+
+    @classmethod
+    def add(cls, callback: FrameCallback) -> None:
+        replace_by_key(cls.callbacks, callback)
+        cls.callbacks.sort(key=lambda _callback: (not _callback.critical, -_callback.priority))
+
+    @classmethod
+    def remove(cls, function: Callable) -> None:
+        cls.callbacks[:] = [callback for callback in cls.callbacks if callback.function is not function]
+
+    @staticmethod
+    def is_playing(context) -> bool:
+        screen = context.screen
+        return screen is not None and screen.is_animation_playing
+
+    @staticmethod
+    def get_target_frame_time(scene) -> float:
+        render = scene.render
+        return render.fps_base / render.fps
+
+    @classmethod
+    def _begin_frame(cls, scene) -> None:
+        now = time.perf_counter()
+        target = cls.get_target_frame_time(scene)
+        delta = target if cls._last_frame_change is None else now - cls._last_frame_change
+        cls._last_frame_change = now
+        if delta > target * 4:
+            # Playback start or a stall, not representative.
+            delta = target
+            cls.frame_time = None
+        cls.frame_time = delta if cls.frame_time is None else cls.frame_time * 0.7 + delta * 0.3
+        budget = target * cls.budget_fraction
+        cls._record = FrameRecord(scene.frame_current, budget, delta, behind=cls.frame_time > target * cls.behind_tolerance)
+        cls._remaining = budget
+        if cls.records.maxlen != cls.history_size:
+            cls.records = deque(cls.records, maxlen=cls.history_size)
+        cls.records.append(cls._record)
+
+    @staticmethod
+    def _call(callback: FrameCallback, context, args: tuple) -> float:
+        start = time.perf_counter()
+        try:
+            callback.function(context, *args)
+        except Exception:
+            traceback.print_exc()
+        elapsed = time.perf_counter() - start
+        callback.calls += 1
+        callback.cost = elapsed if callback.cost is None else callback.cost * 0.8 + elapsed * 0.2
+        if elapsed > callback.budget:
+            callback.overruns += 1
+        return elapsed
+
+    @classmethod
+    def dispatch(cls, pre: bool, context, args: tuple) -> None:
+        if not cls.is_playing(context):
+            cls._last_frame_change = None
+            for callback in cls.callbacks:
+                if callback.pre == pre:
+                    # This call supersedes the deferred one.
+                    callback.pending_args = None
+            cls.catch_up()
+            for callback in cls.callbacks:
+                if callback.pre == pre:
+                    cls._call(callback, context, args)
+            return
+
+        scene = args[0] if args else context.scene
+        if pre or cls._record is None or cls._record.frame != scene.frame_current:
+            cls._begin_frame(scene)
+        record = cls._record
+        for callback in cls.callbacks:
+            if callback.pre != pre:
+                continue
+            if not callback.critical and (record.behind or cls._remaining < max(callback.budget, callback.cost or 0.0)):
+                if callback.catch_up:
+                    callback.pending_args = args
+                    callback.deferred += 1
+                    record.deferred += 1
+                else:
+                    callback.skipped += 1
+                    record.skipped += 1
+                continue
+            # Ran for a later frame, no need to catch up anymore.
+            callback.pending_args = None
+            elapsed = cls._call(callback, context, args)
+            cls._remaining -= elapsed
+            record.elapsed += elapsed
+
+        if record.deferred and cls._timer is None:
+            # Persistent: a file load would cancel it, leaving the handle set.
+            cls._timer = new_timer(cls._on_timer, first_interval=cls.catch_up_interval, step_interval=cls.catch_up_interval,
+                                   one_time_only=False, persistent=True)
+
+    @classmethod
+    def _on_timer(cls):
+        if cls.is_playing(bpy.context):
+            return None
+        cls._timer = None
+        cls._last_frame_change = None
+        cls.catch_up()
+        return -1
+
+    @classmethod
+    def catch_up(cls) -> None:
+        """ Run the deferred callbacks, once each, for the current frame. """
+        pending = [callback for callback in cls.callbacks if callback.pending_args is not None]
+        if not pending:
+            return
+        context = bpy.context
+        for callback in pending:
+            # The depsgraph of the deferred call may not be valid anymore.
+            args = tuple(context.evaluated_depsgraph_get() if isinstance(arg, Depsgraph) else arg for arg in callback.pending_args)
+            callback.pending_args = None
+            cls._call(callback, context, args)
+
+    # Stats.
+    ########################################################################
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, float]:
+        records = list(cls.records)
+        overruns = [record.overrun for record in records if record.overrun > 0]
+        return {
+            'frames': len(records),
+            'frames_behind': sum(record.behind for record in records),
+            'overrun_frames': len(overruns),
+            'max_overrun': max(overruns, default=0.0),
+            'mean_elapsed': sum(record.elapsed for record in records) / len(records) if records else 0.0,
+            'skipped': sum(record.skipped for record in records),
+            'deferred': sum(record.deferred for record in records),
+        }
+
+    @classmethod
+    def reset_stats(cls) -> None:
+        cls.records = deque(maxlen=cls.history_size)
+        for callback in cls.callbacks:
+            callback.reset_stats()
+
+    @classmethod
+    def stop(cls) -> None:
+        """ Run the deferred callbacks and reset the playback state. """
+        if cls._timer is not None:
+            cls._timer.stop()
+            cls._timer = None
+        cls.catch_up()
+        cls._record = None
+        cls._last_frame_change = None
+
+
+def frame_change_handler(budget_ms: float = 2.0, priority: int = 0, critical: bool = False,
+                         catch_up: bool = True, pre: bool = False, persistent: bool = False):
+    ''' Use as a decorator. The target function gets the context, the scene and the depsgraph.
+        Critical callbacks always run, the others within the frame budget during playback. '''
+    def decorator(decorated_func):
+        PlaybackDispatcher.add(FrameCallback(decorated_func, pre, budget_ms / 1000.0, priority, critical, catch_up, persistent))
+        return decorated_func
+    return decorator
+
+
+@Handlers.FRAME_CHANGE_PRE(persistent=True)
+def _on_frame_change_pre(context, *args):
+    if PlaybackDispatcher.callbacks:
+        PlaybackDispatcher.dispatch(True, context, args)
+
+
+@Handlers.FRAME_CHANGE_POST(persistent=True)
+def _on_frame_change_post(context, *args):
+    if PlaybackDispatcher.callbacks:
+        PlaybackDispatcher.dispatch(False, context, args)
+
+
+@Handlers.LOAD_PRE(persistent=True)
+def _on_load_pre(context, *args):
+    keep_persistent(PlaybackDispatcher.callbacks)
+    for callback in PlaybackDispatcher.callbacks:
+        # Deferred for a frame of the previous file.
+        callback.pending_args = None
+    PlaybackDispatcher._record = None
+
+
+def unregister():
+    PlaybackDispatcher.stop()
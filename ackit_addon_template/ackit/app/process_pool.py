@@ -0,0 +1,127 @@
+""" Process pool for CPU-bound pure Python work (parsing, geometry processing, hashing...).
+
+Workers are spawned from ``ProcessPool.python_path`` (``GLOBALS.PYTHON_PATH`` by default,
+Blender's executable is not a Python interpreter) and don't import bpy nor the addon package:
+addon functions are called by source file and name (``call_from_file`` of the worker module),
+so they must live in modules without bpy imports nor relative imports. Large NumPy inputs and
+outputs are passed as ``SharedArray`` (``multiprocessing.shared_memory``) instead of pickled:
+
+    def smooth(points: SharedArray, out: SharedArray, iterations: int):  # In 'my_addon/workers/geo.py'.
+        ...
+        out.array[:] = result
+
+    points = ProcessPool.share(verts)
+    out = ProcessPool.empty(verts.shape, verts.dtype)
+    ProcessPool.submit(smooth, points, out, 10).result()
+    result = out.array.copy()
+    ProcessPool.release(points, out)
+
+Use ``Jobs.submit(fn, ..., use_process=True)`` to get the result in the main thread via callbacks.
+"""
+
+import os
+import sys
+import inspect
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from ..globals import GLOBALS
+from ..debug.output import print_debug
+
+# The worker module is loaded from its file as a top-level one, so worker processes can unpickle it
+# without the addon package. Its name is unique to the addon, other addons may ship another ACK version.
+WORKER_FILEPATH = os.path.join(os.path.dirname(__file__), 'process_worker', 'ackit_process_worker.py')
+WORKER_MODULE = GLOBALS.ADDON_MODULE.replace('.', '_') + '_process_worker'
+# Runs here and as the initializer of the worker processes (no sys.path change needed).
+WORKER_LOADER = f'''
+import sys, importlib.util
+if {WORKER_MODULE!r} not in sys.modules:
+    spec = importlib.util.spec_from_file_location({WORKER_MODULE!r}, {WORKER_FILEPATH!r})
+    module = sys.modules[spec.name] = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+'''
+exec(WORKER_LOADER, {})
+SharedArray = sys.modules[WORKER_MODULE].SharedArray
+call_from_file = sys.modules[WORKER_MODULE].call_from_file
+
+
+__all__ = [
+    'ProcessPool',
+    'SharedArray',
+]
+
+
+class ProcessPool:
+    """ Shared process pool, created on first use. """
+
+    max_workers: int = os.cpu_count() or 1
+    python_path: str = GLOBALS.PYTHON_PATH
+
+    _executor: Optional[ProcessPoolExecutor] = None
+    # Shared arrays created from this process, freed on shutdown if not released before.
+    _owned: Dict[str, SharedArray] = {}
+
+    @classmethod
+    def get_executor(cls) -> ProcessPoolExecutor:
+        if cls._executor is None:
+            mp_context = multiprocessing.get_context('spawn')
+            # NOTE: this is global to the 'spawn' start method, leave it alone unless needed.
+            if cls.python_path != sys.executable and multiprocessing.spawn.get_executable() != cls.python_path:
+                mp_context.set_executable(cls.python_path)
+            cls._executor = ProcessPoolExecutor(max_workers=cls.max_workers, mp_context=mp_context,
+                                                initializer=exec, initargs=(WORKER_LOADER, {}))
+            print_debug(f"Process pool: {cls.max_workers} workers from '{cls.python_path}'")
+        return cls._executor
+
+    @classmethod
+    def submit(cls, fn: Callable, *args, **kwargs) -> Future:
+        """ Run ``fn(*args, **kwargs)`` in a worker process. Arguments and result must be picklable. """
+        module_name = getattr(fn, '__module__', None) or ''
+        if module_name == GLOBALS.ADDON_MODULE or module_name.startswith(GLOBALS.ADDON_MODULE + '.'):
+            filepath = inspect.getsourcefile(fn)
+            return cls.get_executor().submit(call_from_file, filepath, fn.__qualname__, args, kwargs)
+        return cls.get_executor().submit(fn, *args, **kwargs)
+
+    # Shared memory.
+    ########################################################################
+
+    @classmethod
+    def share(cls, array: np.ndarray) -> SharedArray:
+        """ Copy of the array in shared memory. """
+        shared = SharedArray.from_array(array)
+        cls._owned[shared.name] = shared
+        return shared
+
+    @classmethod
+    def empty(cls, shape: Tuple[int, ...], dtype: Any = np.float32) -> SharedArray:
+        """ Uninitialized shared array, e.g. for the workers output. """
+        shared = SharedArray.empty(shape, dtype)
+        cls._owned[shared.name] = shared
+        return shared
+
+    @classmethod
+    def release(cls, *shared_arrays: SharedArray) -> None:
+        for shared in shared_arrays:
+            cls._owned.pop(shared.name, None)
+            shared.release()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=True, cancel_futures=True)
+            cls._executor = None
+        for shared in list(cls._owned.values()):
+            try:
+                shared.release()
+            except BufferError:
+                # Still viewed by some array, the OS frees it on exit.
+                pass
+        cls._owned.clear()
+
+
+def unregister():
+    ProcessPool.shutdown()
+    sys.modules.pop(WORKER_MODULE, None)
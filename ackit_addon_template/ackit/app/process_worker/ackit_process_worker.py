@@ -0,0 +1,99 @@
+""" Process pool worker side.
+
+Loaded from its file as a top-level module with an addon-unique name (by ``ProcessPool`` and
+the initializer of its workers), so worker processes can unpickle it without importing the addon
+package, which needs bpy.
+It must stay self-contained: standard library and NumPy only.
+"""
+
+import sys
+import importlib.util
+from multiprocessing import shared_memory
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+
+__all__ = [
+    'SharedArray',
+    'call_from_file',
+]
+
+
+class SharedArray:
+    """ NumPy array in shared memory. Pickling it only sends its name, shape and dtype.
+        The creator (or whoever receives it last) calls ``release`` once done. Copy the data
+        you want to keep before releasing it, views of ``array`` are invalid after that. """
+
+    def __init__(self, name: str, shape: Tuple[int, ...], dtype: Any, shm: shared_memory.SharedMemory = None) -> None:
+        self.name = name
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype).str
+        self._shm = shm
+
+    @classmethod
+    def empty(cls, shape: Tuple[int, ...], dtype: Any = np.float32) -> 'SharedArray':
+        nbytes = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+        shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        return cls(shm.name, shape, dtype, shm)
+
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> 'SharedArray':
+        shared = cls.empty(array.shape, array.dtype)
+        shared.array[...] = array
+        return shared
+
+    @property
+    def array(self) -> np.ndarray:
+        if self._shm is None:
+            self._shm = shared_memory.SharedMemory(name=self.name)
+        return np.ndarray(self.shape, dtype=self.dtype, buffer=self._shm.buf)
+
+    def close(self) -> None:
+        """ Detach from the shared memory in this process. """
+        if self._shm is not None:
+            self._shm.close()
+            self._shm = None
+
+    def release(self) -> None:
+        """ Detach and free the shared memory. """
+        if self._shm is None:
+            try:
+                self._shm = shared_memory.SharedMemory(name=self.name)
+            except FileNotFoundError:
+                return
+        shm = self._shm
+        self.close()
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __getstate__(self):
+        return self.name, self.shape, self.dtype
+
+    def __setstate__(self, state) -> None:
+        self.name, self.shape, self.dtype = state
+        self._shm = None
+
+    def __repr__(self) -> str:
+        return f'SharedArray({self.name!r}, shape={self.shape}, dtype={self.dtype!r})'
+
+
+_modules: Dict[str, Any] = {}
+
+
+def call_from_file(filepath: str, qualname: str, args: tuple, kwargs: Dict[str, Any]) -> Any:
+    """ Call a function defined in a source file, importing the file as a standalone module
+        (its package is not imported, so relative imports don't work in it). """
+    module = _modules.get(filepath, None)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(f'_ackit_worker_module_{len(_modules)}', filepath)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+        _modules[filepath] = module
+    target = module
+    for attr_name in qualname.split('.'):
+        target = getattr(target, attr_name)
+    return target(*args, **kwargs)
@@ -0,0 +1,339 @@
+""" Debounce, throttle and per-tick coalescing of callbacks.
+
+    @ACK.App.Handler.DEPSGRAPH_UPDATE_POST()
+    @ACK.App.Debounce(250)
+    def export(context, scene, depsgraph):
+        ...
+
+The rate limit decorators go below the registration one (``Handlers``, ``subscribe_to_rna_change``,
+``add_update_callback``...) and can be stacked. Calls are tracked per target (the first
+non-context bpy struct argument: scene, property owner...), and all pending calls share one
+scheduler running on a single timer. The context is fetched again when the deferred call runs,
+as the one of the triggering call may not be valid anymore. So is the depsgraph, and its updates
+are only valid during the handler call: a pending call gets a ``DeferredDepsgraph``, whose
+``updates`` are snapshots of the updates of every trigger since the call was deferred.
+Pending calls are flushed (run) when their handlers, subscriptions or the addon are unregistered,
+and before a file is loaded (``LOAD_PRE``), while their targets are still valid: the structs
+of the previous file must never be used after it, release builds don't invalidate them.
+"""
+
+import time
+import functools
+import traceback
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+import bpy
+from bpy.types import ID, Context, Depsgraph, DepsgraphUpdate
+
+from .timer import new_timer, TimerHandler
+
+
+__all__ = [
+    'DeferredDepsgraph',
+    'DepsgraphUpdateSnapshot',
+    'DepsgraphUpdates',
+    'RateLimited',
+    'RateLimiter',
+    'debounce',
+    'throttle',
+    'coalesce_per_tick',
+    'iter_rate_limited',
+]
+
+
+def _get_target_key(args: tuple) -> Optional[int]:
+    for arg in args:
+        if hasattr(arg, 'as_pointer') and not isinstance(arg, Context):
+            try:
+                return arg.as_pointer()
+            except ReferenceError:
+                return None
+    return None
+
+
+# ID.id_type -> bpy.data collection.
+ID_TYPE_COLLECTIONS = {
+    'ACTION': 'actions', 'ARMATURE': 'armatures', 'BRUSH': 'brushes', 'CAMERA': 'cameras',
+    'COLLECTION': 'collections', 'CURVE': 'curves', 'CURVES': 'hair_curves', 'FONT': 'fonts',
+    'GREASEPENCIL': 'grease_pencils', 'IMAGE': 'images', 'LATTICE': 'lattices', 'LIGHT': 'lights',
+    'LIGHT_PROBE': 'lightprobes', 'MASK': 'masks', 'MATERIAL': 'materials', 'MESH': 'meshes',
+    'META': 'metaballs', 'MOVIECLIP': 'movieclips', 'NODETREE': 'node_groups', 'OBJECT': 'objects',
+    'PARTICLE': 'particles', 'POINTCLOUD': 'pointclouds', 'SCENE': 'scenes', 'SHAPEKEY': 'shape_keys',
+    'SOUND': 'sounds', 'SPEAKER': 'speakers', 'TEXT': 'texts', 'TEXTURE': 'textures',
+    'VOLUME': 'volumes', 'WORLD': 'worlds',
+}
+
+
+class DepsgraphUpdateSnapshot:
+    """ Plain copy of a ``DepsgraphUpdate``, which is only valid during the handler call. """
+
+    __slots__ = ('session_uid', 'name', 'id_type', 'is_updated_transform', 'is_updated_geometry', 'is_updated_shading')
+
+    def __init__(self, session_uid: int, name: str, id_type: str, transform: bool, geometry: bool, shading: bool) -> None:
+        self.session_uid = session_uid
+        self.name = name
+        self.id_type = id_type
+        self.is_updated_transform = transform
+        self.is_updated_geometry = geometry
+        self.is_updated_shading = shading
+
+    @classmethod
+    def from_update(cls, update: DepsgraphUpdate) -> 'DepsgraphUpdateSnapshot':
+        _id = update.id.original
+        return cls(_id.session_uid, _id.name, _id.id_type,
+                   update.is_updated_transform, update.is_updated_geometry, update.is_updated_shading)
+
+    @property
+    def id(self) -> Optional[ID]:
+        """ The original ID, looked up in ``bpy.data``. None if it was removed (or of an unknown type). """
+        collection = getattr(bpy.data, ID_TYPE_COLLECTIONS.get(self.id_type, ''), None)
+        if collection is None:
+            return None
+        _id = collection.get(self.name, None)
+        if _id is not None and _id.session_uid == self.session_uid:
+            return _id
+        # Renamed, or a linked ID with the name of a local one.
+        return next((_id for _id in collection if _id.session_uid == self.session_uid), None)
+
+    def merged(self, other: 'DepsgraphUpdateSnapshot') -> 'DepsgraphUpdateSnapshot':
+        return DepsgraphUpdateSnapshot(
+            self.session_uid, other.name, self.id_type,
+            self.is_updated_transform or other.is_updated_transform,
+            self.is_updated_geometry or other.is_updated_geometry,
+            self.is_updated_shading or other.is_updated_shading,
+        )
+
+    def __repr__(self) -> str:
+        flags = [flag for flag, updated in (('transform', self.is_updated_transform), ('geometry', self.is_updated_geometry),
+                                            ('shading', self.is_updated_shading)) if updated]
+        return f'<DepsgraphUpdateSnapshot {self.id_type} {self.name!r} {"|".join(flags)}>'
+
+
+class DepsgraphUpdates(list):
+    """ ``DepsgraphUpdateSnapshot`` list, one per ID. A pending call merges the ones of every trigger. """
+
+    @classmethod
+    def from_updates(cls, updates: Iterable[DepsgraphUpdate]) -> 'DepsgraphUpdates':
+        return cls(DepsgraphUpdateSnapshot.from_update(update) for update in updates)
+
+    def merge(self, other: 'DepsgraphUpdates') -> 'DepsgraphUpdates':
+        """ New list with the updates of both, the flags of the same ID combined. """
+        merged = DepsgraphUpdates(self)
+        indices = {update.session_uid: index for index, update in enumerate(merged)}
+        for update in other:
+            index = indices.get(update.session_uid, None)
+            if index is None:
+                indices[update.session_uid] = len(merged)
+                merged.append(update)
+            else:
+                merged[index] = merged[index].merged(update)
+        return merged
+
+
+class DeferredDepsgraph:
+    """ Depsgraph argument of a deferred call: ``updates`` are the snapshots of every trigger,
+        anything else is read from the evaluated depsgraph when the call runs. """
+
+    __slots__ = ('updates', 'depsgraph')
+
+    def __init__(self, updates: DepsgraphUpdates) -> None:
+        self.updates = updates
+        self.depsgraph: Optional[Depsgraph] = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self.depsgraph is None:
+            self.depsgraph = bpy.context.evaluated_depsgraph_get()
+        return getattr(self.depsgraph, name)
+
+
+def _capture_args(args: tuple) -> tuple:
+    """ Arguments of a deferred call, without the depsgraph (only valid during the triggering call). """
+    if not any(isinstance(arg, Depsgraph) for arg in args):
+        return args
+    return tuple(DeferredDepsgraph(DepsgraphUpdates.from_updates(arg.updates)) if isinstance(arg, Depsgraph) else arg for arg in args)
+
+
+def _merge_args(pending_args: tuple, args: tuple) -> tuple:
+    """ Last trigger arguments, with the depsgraph updates of both triggers. """
+    if len(pending_args) != len(args):
+        return args
+    merged = []
+    for pending_arg, arg in zip(pending_args, args):
+        if isinstance(pending_arg, DeferredDepsgraph) and isinstance(arg, DeferredDepsgraph):
+            arg = DeferredDepsgraph(pending_arg.updates.merge(arg.updates))
+        elif isinstance(pending_arg, DepsgraphUpdates) and isinstance(arg, DepsgraphUpdates):
+            arg = pending_arg.merge(arg)
+        merged.append(arg)
+    return tuple(merged)
+
+
+def _refresh_args(args: tuple) -> tuple:
+    if not any(isinstance(arg, Context) for arg in args):
+        return args
+    context = bpy.context
+    return tuple(context if isinstance(arg, Context) else arg for arg in args)
+
+
+class _PendingCall:
+    __slots__ = ('limited', 'key', 'args', 'kwargs', 'due')
+
+    def __init__(self, limited: 'RateLimited', key: tuple, args: tuple, kwargs: dict, due: float) -> None:
+        self.limited = limited
+        self.key = key
+        self.args = args
+        self.kwargs = kwargs
+        self.due = due
+
+
+class RateLimiter:
+    """ Scheduler of the deferred calls of every ``RateLimited`` callback. """
+
+    _pending: Dict[tuple, _PendingCall] = {}
+    _timer: Optional[TimerHandler] = None
+    _timer_due: Optional[float] = None
+
+    @classmethod
+    def schedule(cls, limited: 'RateLimited', key: tuple, args: tuple, kwargs: dict, due: float, reset_due: bool) -> None:
+        """ Defer the call, replacing the arguments of a pending one (merging the depsgraph updates).
+            Its due time is kept unless ``reset_due``. """
+        args = _capture_args(args)
+        if (pending := cls._pending.get(key, None)) is not None:
+            pending.args = _merge_args(pending.args, args)
+            pending.kwargs = kwargs
+            if reset_due:
+                pending.due = due
+        else:
+            cls._pending[key] = _PendingCall(limited, key, args, kwargs, due)
+        cls._wake(due if reset_due or pending is None else pending.due)
+
+    @classmethod
+    def is_pending(cls, key: tuple) -> bool:
+        return key in cls._pending
+
+    @classmethod
+    def _wake(cls, due: float) -> None:
+        if cls._timer is not None and (cls._timer.timer is None or cls._timer.timer.cancelled):
+            # Stopped from outside (e.g. unregistering the timers).
+            cls._timer = None
+        if cls._timer is not None and cls._timer_due is not None and cls._timer_due <= due:
+            return
+        if cls._timer is not None:
+            cls._timer.stop()
+        cls._timer_due = due
+        # Persistent, for the calls deferred while a file loads (the previous ones are flushed on LOAD_PRE).
+        cls._timer = new_timer(cls._on_timer, first_interval=max(0.0, due - time.monotonic()), one_time_only=False, persistent=True)
+
+    @classmethod
+    def _on_timer(cls):
+        now = time.monotonic()
+        for pending in sorted((pending for pending in cls._pending.values() if pending.due <= now), key=lambda pending: pending.due):
+            if cls._pending.get(pending.key, None) is pending:
+                del cls._pending[pending.key]
+                cls._run(pending)
+        if not cls._pending:
+            cls._timer = None
+            cls._timer_due = None
+            return -1
+        cls._timer_due = min(pending.due for pending in cls._pending.values())
+        return max(0.0, cls._timer_due - time.monotonic())
+
+    @staticmethod
+    def _run(pending: _PendingCall) -> None:
+        try:
+            pending.limited._fire(pending.key, pending.args, pending.kwargs)
+        except ReferenceError:
+            # The target (object, scene...) was removed meanwhile.
+            pass
+        except Exception:
+            traceback.print_exc()
+
+    @classmethod
+    def flush(cls, predicate: Optional[Callable[['RateLimited'], bool]] = None) -> None:
+        """ Run the pending calls now (the ones of the rate limited callbacks matching ``predicate``). """
+        flushed = [pending for pending in cls._pending.values() if predicate is None or predicate(pending.limited)]
+        for pending in sorted(flushed, key=lambda pending: pending.due):
+            if cls._pending.pop(pending.key, None) is pending:
+                cls._run(pending)
+        if not cls._pending and cls._timer is not None:
+            cls._timer.stop()
+            cls._timer = None
+            cls._timer_due = None
+
+    @classmethod
+    def flush_callbacks(cls, callbacks) -> None:
+        """ Flush the pending calls of these callbacks (or of the rate limited callbacks they wrap). """
+        limited = {id(_limited) for callback in callbacks for _limited in iter_rate_limited(callback)}
+        if limited:
+            cls.flush(lambda _limited: id(_limited) in limited)
+
+
+class RateLimited:
+    """ Callback wrapper deferring the calls to ``func`` according to its policy. """
+
+    DEBOUNCE = 'DEBOUNCE'
+    THROTTLE = 'THROTTLE'
+    COALESCE = 'COALESCE'
+
+    def __init__(self, func: Callable, policy: str, interval: float = 0.0) -> None:
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.policy = policy
+        self.interval = interval
+        # Time of the last call, per target.
+        self._last_calls: Dict[tuple, float] = {}
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return functools.partial(self, instance)
+
+    def __call__(self, *args, **kwargs) -> None:
+        key = (id(self), _get_target_key(args))
+        now = time.monotonic()
+        if self.policy == RateLimited.DEBOUNCE:
+            RateLimiter.schedule(self, key, args, kwargs, now + self.interval, reset_due=True)
+        elif self.policy == RateLimited.THROTTLE:
+            last_call = self._last_calls.get(key, None)
+            if (last_call is None or now - last_call >= self.interval) and not RateLimiter.is_pending(key):
+                # Leading call.
+                self._fire(key, args, kwargs, refresh=False)
+            else:
+                RateLimiter.schedule(self, key, args, kwargs, (last_call or now) + self.interval, reset_due=False)
+        else:
+            RateLimiter.schedule(self, key, args, kwargs, now, reset_due=False)
+
+    def _fire(self, key: tuple, args: tuple, kwargs: dict, refresh: bool = True) -> Any:
+        self._last_calls[key] = time.monotonic()
+        return self.func(*(_refresh_args(args) if refresh else args), **kwargs)
+
+    def __repr__(self) -> str:
+        return f'<RateLimited {self.policy} {self.interval * 1000:.0f}ms {self.func!r}>'
+
+
+def iter_rate_limited(callback: Callable) -> Iterator[RateLimited]:
+    """ The ``RateLimited`` wrappers of a callback, outermost first (callbacks wrapped with 'functools.wraps' are followed). """
+    while callback is not None:
+        if isinstance(callback, RateLimited):
+            yield callback
+            callback = callback.func
+        else:
+            callback = getattr(callback, '__wrapped__', None)
+
+
+def debounce(ms: float) -> Callable[[Callable], RateLimited]:
+    """ Call once ``ms`` milliseconds after the last trigger, with the last trigger arguments. """
+    return lambda func: RateLimited(func, RateLimited.DEBOUNCE, ms / 1000.0)
+
+
+def throttle(ms: float) -> Callable[[Callable], RateLimited]:
+    """ Call at most once every ``ms`` milliseconds: right away, then with the last arguments at the end of the interval. """
+    return lambda func: RateLimited(func, RateLimited.THROTTLE, ms / 1000.0)
+
+
+def coalesce_per_tick(func: Callable) -> RateLimited:
+    """ Call once on the next timer tick, however many times it was triggered meanwhile. """
+    return RateLimited(func, RateLimited.COALESCE)
+
+
+def unregister():
+    RateLimiter.flush()
@@ -0,0 +1,295 @@
+""" Render output post-processing off the render path.
+
+    @ACK.App.RenderPostProcess(max_concurrency=2)
+    def make_preview(output: RenderOutput):
+        # Worker thread: no bpy here, only the snapshot.
+        convert(output.filepath, output.filepath + '.jpg')
+
+The ``RENDER_WRITE`` (or ``RENDER_POST``) handler only snapshots the output of the frame (file
+path, format, resolution... plus the dict returned by the optional ``snapshot(context, scene)``)
+and queues the stage function, which runs in a pool of ``max_concurrency`` threads per stage.
+Unlike ``Jobs``, no main thread timer is needed, so it also works with blocking and background
+renders. Once the render is complete (or cancelled) and its tasks finished, a ``RenderReport`` is
+written as JSON to ``GLOBALS.USER_CONFIG_DIR`` and passed to the ``RenderPipeline.on_report``
+listeners, from the thread that finished it.
+"""
+
+import os
+import json
+import time
+import threading
+import traceback
+from pathlib import Path
+from dataclasses import dataclass, field, asdict, replace
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..globals import GLOBALS
+from ..debug.output import print_debug
+from .handlers import Handlers, replace_by_key
+
+
+__all__ = [
+    'PostProcessStage',
+    'RenderOutput',
+    'RenderPipeline',
+    'RenderReport',
+    'render_post_process',
+]
+
+
+@dataclass
+class RenderOutput:
+    frame: int
+    filepath: str
+    file_format: str
+    scene: str
+    resolution: Tuple[int, int]
+    fps: float
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class TaskRecord:
+    stage: str
+    frame: int
+    filepath: str
+    queued: float  # Seconds since the render start.
+    duration: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class RenderReport:
+    scene: str
+    started: float  # time.time()
+    render_end: Optional[float] = None
+    finished: Optional[float] = None
+    cancelled: bool = False
+    pending: int = 0  # Queued or running tasks.
+    tasks: List[TaskRecord] = field(default_factory=list)
+
+    @property
+    def failed(self) -> List[TaskRecord]:
+        return [task for task in self.tasks if task.error is not None]
+
+    @property
+    def tail(self) -> float:
+        """ Post-processing time after the render was complete. """
+        return 0.0 if self.render_end is None or self.finished is None else max(0.0, self.finished - self.render_end)
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data['tail'] = self.tail
+        data['post_process_time'] = sum(task.duration for task in self.tasks)
+        return data
+
+
+class PostProcessStage:
+    def __init__(self, function: Callable[[RenderOutput], Any], handler: str, max_concurrency: int,
+                 snapshot: Optional[Callable[[Any, Any], Dict[str, Any]]]) -> None:
+        self.function = function
+        self.handler = handler
+        self.max_concurrency = max(1, max_concurrency)
+        self.snapshot = snapshot
+        self.executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def name(self) -> str:
+        return getattr(self.function, '__qualname__', repr(self.function))
+
+    @property
+    def key(self) -> tuple:
+        return (getattr(self.function, '__module__', ''), self.name)
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix=f'{GLOBALS.ADDON_MODULE_SHORT}_render')
+        return self.executor
+
+    def shutdown(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+
+class RenderPipeline:
+    """ Post-processing stages of the render outputs, and the report of the current render. """
+
+    stages: List[PostProcessStage] = []
+    # Called with the RenderReport, from a worker thread (or the render one).
+    on_report: List[Callable[[RenderReport], None]] = []
+    write_report: bool = True
+
+    report: Optional[RenderReport] = None
+    last_report: Optional[RenderReport] = None
+    _pending: int = 0
+    _lock = threading.Lock()
+    _idle = threading.Event()
+    _idle.set()
+
+    @classmethod
+    def add(cls, stage: PostProcessStage) -> None:
+        for _stage in replace_by_key(cls.stages, stage):
+            _stage.shutdown()
+
+    @staticmethod
+    def snapshot_output(scene) -> RenderOutput:
+        render = scene.render
+        scale = render.resolution_percentage / 100
+        return RenderOutput(
+            frame=scene.frame_current,
+            filepath=render.frame_path(frame=scene.frame_current),
+            file_format=render.image_settings.file_format,
+            scene=scene.name,
+            resolution=(int(render.resolution_x * scale), int(render.resolution_y * scale)),
+            fps=render.fps / render.fps_base,
+        )
+
+    @classmethod
+    def begin(cls, scene) -> None:
+        with cls._lock:
+            cls.report = RenderReport(scene.name, time.time())
+
+    @classmethod
+    def queue(cls, handler: str, context, scene) -> None:
+        stages = [stage for stage in cls.stages if stage.handler == handler]
+        if not stages:
+            return
+        if cls.report is None:
+            # Render started before the addon was registered.
+            cls.begin(scene)
+        output = cls.snapshot_output(scene)
+        for stage in stages:
+            stage_output = output
+            if stage.snapshot is not None:
+                stage_output = replace(output, metadata=stage.snapshot(context, scene) or {})
+            task = TaskRecord(stage.name, output.frame, output.filepath, time.time() - cls.report.started)
+            with cls._lock:
+                cls.report.tasks.append(task)
+                cls.report.pending += 1
+                cls._pending += 1
+                cls._idle.clear()
+            stage.get_executor().submit(cls._run_task, stage, stage_output, task, cls.report)
+
+    @classmethod
+    def _run_task(cls, stage: PostProcessStage, output: RenderOutput, task: TaskRecord, report: RenderReport) -> None:
+        start = time.perf_counter()
+        try:
+            stage.function(output)
+        except Exception as e:
+            task.error = f'{type(e).__name__}: {e}'
+            traceback.print_exc()
+        task.duration = time.perf_counter() - start
+        with cls._lock:
+            cls._pending -= 1
+            report.pending -= 1
+            finished = report.pending == 0 and report.render_end is not None and report.finished is None
+            if finished:
+                report.finished = time.time()
+            if cls._pending == 0:
+                cls._idle.set()
+        if finished:
+            cls._finish(report)
+
+    @classmethod
+    def end(cls, cancelled: bool) -> None:
+        with cls._lock:
+            report = cls.report
+            if report is None:
+                return
+            cls.report = None
+            report.render_end = time.time()
+            report.cancelled = cancelled
+            finished = report.pending == 0
+            if finished:
+                report.finished = report.render_end
+        if finished:
+            cls._finish(report)
+
+    @classmethod
+    def _finish(cls, report: RenderReport) -> None:
+        cls.last_report = report
+        if not report.tasks:
+            return
+        print_debug(f"Render post-processing: {len(report.tasks)} tasks, {len(report.failed)} failed, "
+                    f"{report.tail:.2f} s after the render")
+        if cls.write_report:
+            cls.write_json(report)
+        for callback in cls.on_report:
+            try:
+                callback(report)
+            except Exception:
+                traceback.print_exc()
+
+    @staticmethod
+    def get_filepath() -> Path:
+        return Path(GLOBALS.USER_CONFIG_DIR) / f'{GLOBALS.ADDON_MODULE_SHORT}_render_report.json'
+
+    @classmethod
+    def write_json(cls, report: RenderReport, filepath: Optional[Path] = None) -> Optional[Path]:
+        filepath = Path(filepath) if filepath is not None else cls.get_filepath()
+        try:
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            tmp_filepath = filepath.with_suffix('.tmp')
+            with tmp_filepath.open('w', encoding='utf-8') as f:
+                json.dump(report.to_dict(), f, indent=2)
+            os.replace(tmp_filepath, filepath)
+        except OSError as e:
+            print_debug(f"Render report: could not be written! {e}")
+            return None
+        return filepath
+
+    @classmethod
+    def wait(cls, timeout: Optional[float] = None) -> bool:
+        """ Block until every queued task finished. Returns False on timeout. """
+        return cls._idle.wait(timeout)
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """ Wait for the queued tasks and stop the workers. """
+        for stage in cls.stages:
+            stage.shutdown()
+
+
+def render_post_process(max_concurrency: int = 2, handler: Handlers = Handlers.RENDER_WRITE,
+                        snapshot: Optional[Callable[[Any, Any], Dict[str, Any]]] = None):
+    ''' Use as a decorator. The target function runs in a worker thread with the RenderOutput of each frame.
+        ``snapshot(context, scene)`` runs in the handler, its dict goes to ``RenderOutput.metadata``. '''
+    if handler not in (Handlers.RENDER_WRITE, Handlers.RENDER_POST):
+        raise ValueError(f"render_post_process: expected RENDER_WRITE or RENDER_POST, got {handler.name}")
+
+    def decorator(decorated_func):
+        RenderPipeline.add(PostProcessStage(decorated_func, handler.name, max_concurrency, snapshot))
+        return decorated_func
+    return decorator
+
+
+@Handlers.RENDER_INIT(persistent=True)
+def _on_render_init(context, scene, *args):
+    if RenderPipeline.stages:
+        RenderPipeline.begin(scene)
+
+
+@Handlers.RENDER_WRITE(persistent=True)
+def _on_render_write(context, scene, *args):
+    RenderPipeline.queue(Handlers.RENDER_WRITE.name, context, scene)
+
+
+@Handlers.RENDER_POST(persistent=True)
+def _on_render_post(context, scene, *args):
+    RenderPipeline.queue(Handlers.RENDER_POST.name, context, scene)
+
+
+@Handlers.RENDER_COMPLETE(persistent=True)
+def _on_render_complete(context, *args):
+    RenderPipeline.end(cancelled=False)
+
+
+@Handlers.RENDER_CANCEL(persistent=True)
+def _on_render_cancel(context, *args):
+    RenderPipeline.end(cancelled=True)
+
+
+def unregister():
+    RenderPipeline.shutdown()
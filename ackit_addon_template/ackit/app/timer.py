@@ -1,42 +1,60 @@
-import functools
-from time import time
+from bpy.app import timers, handlers
 
-from bpy.app import timers
+from .timer_wheel import TimerEntry, TimerWheel
 
 
 to_register_timers = []
-registered_timers = []
+
+# Every ACK timer runs on this wheel, driven by a single bpy timer ('_run_wheel').
+wheel = TimerWheel()
+_wheel_running = False
+_next_wakeup: float | None = None
 
 
 class TimerHandler:
-    def __init__(self, timer_callback):
-        self.timer = timer_callback
+    def __init__(self, timer_entry: TimerEntry):
+        self.timer = timer_entry
 
     def stop(self):
-        if self.timer and timers.is_registered(self.timer):
-            self.timer.stop = True
-            timers.unregister(self.timer)
+        if self.timer:
+            self.timer.cancel()
             self.timer = None
         del self
 
 
-def timer_callback_decorator(decorated_callback):
-    def wrapper(*args, **kwargs):
-        if hasattr(decorated_callback, 'timeout') and decorated_callback.timeout is not None:
-            if time() > decorated_callback.timeout:
-                return None
-        if hasattr(decorated_callback, 'stop') and decorated_callback.stop:
-            return None
-        if res := decorated_callback(*args, **kwargs):
-            if res == -1:
-                return None
-            return res
-        if hasattr(decorated_callback, 'one_time_only') and decorated_callback.one_time_only:
-            return None
-        # ret = getattr(decorated_callback, 'step_interval', None)
-        # print_debug(decorated_callback.__name__, ret)
-        return getattr(decorated_callback, 'step_interval', None)
-    return wrapper
+def _run_wheel():
+    global _wheel_running, _next_wakeup
+    _wheel_running = True
+    try:
+        delay = wheel.run()
+    finally:
+        _wheel_running = False
+    _next_wakeup = None if delay is None else wheel.clock() + delay
+    return delay
+
+
+@handlers.persistent
+def _on_load_pre(*args):
+    # Same as bpy timers: only the persistent ones survive loading a file.
+    wheel.cancel_all(lambda entry: not entry.persistent)
+
+
+def _wake_wheel():
+    """ Make sure the bpy timer runs by the next deadline of the wheel. """
+    global _next_wakeup
+    if _wheel_running:
+        # '_run_wheel' returns the next delay once the current callbacks finish.
+        return
+    if (next_deadline := wheel.get_next_deadline()) is None:
+        return
+    if _next_wakeup is not None and _next_wakeup <= next_deadline and timers.is_registered(_run_wheel):
+        return
+    if timers.is_registered(_run_wheel):
+        timers.unregister(_run_wheel)
+    if _on_load_pre not in handlers.load_pre:
+        handlers.load_pre.append(_on_load_pre)
+    _next_wakeup = next_deadline
+    timers.register(_run_wheel, first_interval=max(0.0, next_deadline - wheel.clock()), persistent=True)
 
 
 def new_timer(callback: callable,
@@ -50,29 +68,19 @@ def new_timer(callback: callable,
     ''' - 'step_interval' and 'timeout' work only if 'one_time_only' is False.
         - If 'timeout' is 0, then won't use it.
         - NOTE: return -1 whenever you want to stop your callback from repeating...
+        - Returning a number sets the delay until the next call, as with bpy timers.
     '''
-    if args or kwargs:
-        deco_callback = functools.partial(deco_callback, *args, **kwargs)
-    if one_time_only:
-        deco_callback = callback
-        timer_handler = None
-    else:
-        setattr(callback, 'one_time_only', one_time_only)
-        setattr(callback, 'timeout', (time()+timeout+first_interval) if timeout > 0 else None)
-        setattr(callback, 'step_interval', step_interval)
-        setattr(callback, 'stop', False)
-        deco_callback = timer_callback_decorator(callback)
-        timer_handler = TimerHandler(deco_callback)
-    if args or kwargs:
-        # TODO: functools partial.
-        timers.register(
-            deco_callback,
-            first_interval=first_interval,
-            persistent=persistent)
-    else:
-        timers.register(deco_callback, first_interval=first_interval, persistent=persistent)
-    registered_timers.append(deco_callback)
-    return timer_handler
+    timer_entry = wheel.schedule(
+        callback,
+        delay=first_interval,
+        interval=None if one_time_only else step_interval,
+        timeout=0 if one_time_only else timeout,
+        persistent=persistent,
+        args=args,
+        kwargs=kwargs
+    )
+    _wake_wheel()
+    return None if one_time_only else TimerHandler(timer_entry)
 
 
 def new_timer_as_decorator(
@@ -101,7 +109,24 @@ def register():
 
 
 def unregister():
-    for timer in registered_timers:
-        if timers.is_registered(timer):
-            timers.unregister(timer)
-    registered_timers.clear()
+    global _next_wakeup
+    wheel.cancel_all()
+    if timers.is_registered(_run_wheel):
+        timers.unregister(_run_wheel)
+    _next_wakeup = None
+    if _on_load_pre in handlers.load_pre:
+        handlers.load_pre.remove(_on_load_pre)
+
+
+# Per-module (un)registration, used by the hot reload.
+# ----------------------------------------------------------------
+
+def unregister_module_timers(module_name: str) -> None:
+    wheel.cancel_all(lambda entry: getattr(entry.callback, '__module__', None) == module_name)
+    to_register_timers[:] = [timer_data for timer_data in to_register_timers if timer_data[0].__module__ != module_name]
+
+
+def register_module_timers(module_name: str) -> None:
+    for timer_data in to_register_timers:
+        if timer_data[0].__module__ == module_name:
+            new_timer(*timer_data)
@@ -0,0 +1,232 @@
+""" Hierarchical timer wheel, so every ACK timer runs on a single Blender timer.
+
+Time is split in ticks of ``TimerWheel.resolution`` seconds. Level 0 has a slot per tick,
+each upper level has slots spanning a whole turn of the level below it (64 slots per level,
+4 levels: ~46 hours at 10 ms). Scheduling and cancelling are O(1): an entry is appended to the
+slot of its deadline, cancelled entries are only flagged and dropped when their slot is visited.
+When level 0 completes a turn, the current slot of the level above is cascaded (re-inserted)
+into the lower levels. ``get_next_deadline`` gives the exact time of the closest entry, so the
+Blender timer sleeps until then instead of polling. Pure Python, no bpy involved.
+"""
+
+import time
+import traceback
+from typing import Any, Callable, Dict, List, Optional
+
+
+__all__ = [
+    'TimerEntry',
+    'TimerWheel',
+]
+
+
+SLOT_BITS = 6
+SLOTS = 1 << SLOT_BITS
+SLOT_MASK = SLOTS - 1
+LEVELS = 4
+
+
+class TimerEntry:
+    """ A scheduled callback. The callback return value works as with ``bpy.app.timers``:
+        a number is the delay until the next call, None repeats after ``interval`` (or stops if it is None),
+        -1 always stops. """
+
+    __slots__ = ('callback', 'args', 'kwargs', 'interval', 'timeout', 'persistent', 'deadline', 'tick', 'cancelled', 'wheel')
+
+    def __init__(self, callback: Callable, args: tuple, kwargs: Dict[str, Any], interval: Optional[float], timeout: Optional[float], persistent: bool) -> None:
+        self.callback = callback
+        self.args = args
+        self.kwargs = kwargs
+        self.interval = interval
+        self.timeout = timeout  # Absolute time, or None.
+        self.persistent = persistent
+        self.deadline: float = 0.0
+        self.tick: int = 0
+        self.cancelled: bool = False
+        self.wheel: Optional['TimerWheel'] = None
+
+    @property
+    def is_active(self) -> bool:
+        return not self.cancelled and self.wheel is not None
+
+    def cancel(self) -> None:
+        if self.cancelled:
+            return
+        # Also while its callback runs (out of the wheel), so it isn't re-scheduled.
+        self.cancelled = True
+        if self.wheel is not None:
+            self.wheel.count -= 1
+            self.wheel = None
+
+
+class TimerWheel:
+    def __init__(self, resolution: float = 0.01, clock: Callable[[], float] = time.monotonic) -> None:
+        self.resolution = resolution
+        self.clock = clock
+        self.origin = clock()
+        self.current_tick = 0
+        self.count = 0
+        self.levels: List[List[List[TimerEntry]]] = [[[] for _ in range(SLOTS)] for _ in range(LEVELS)]
+
+    def _to_tick(self, t: float) -> int:
+        # Round up, an entry never runs before its deadline.
+        return max(0, -int((self.origin - t) // self.resolution))
+
+    def _insert(self, entry: TimerEntry, cascading: bool = False) -> None:
+        delta = entry.tick - self.current_tick
+        if delta < 0 or (delta == 0 and not cascading):
+            # Late: run on the next tick.
+            entry.tick = self.current_tick + 1
+            delta = 1
+        for level in range(LEVELS):
+            if delta < 1 << (SLOT_BITS * (level + 1)) or level == LEVELS - 1:
+                # Beyond the last level horizon the entry is re-inserted when its slot comes.
+                self.levels[level][(entry.tick >> (SLOT_BITS * level)) & SLOT_MASK].append(entry)
+                return
+
+    # Scheduling.
+    ########################################################################
+
+    def schedule(self, callback: Callable, delay: float = 0.0, interval: Optional[float] = None, timeout: float = 0.0,
+                 persistent: bool = False, args: tuple = (), kwargs: Dict[str, Any] = {}) -> TimerEntry:
+        """ Call ``callback(*args, **kwargs)`` in ``delay`` seconds, then every ``interval`` seconds if given.
+            ``timeout`` (seconds, 0 to disable) stops the calls after that time. """
+        now = self.clock()
+        entry = TimerEntry(callback, args, kwargs, interval, (now + delay + timeout) if timeout > 0 else None, persistent)
+        self._schedule_at(entry, now + delay)
+        return entry
+
+    def _schedule_at(self, entry: TimerEntry, deadline: float) -> None:
+        entry.deadline = deadline
+        entry.tick = self._to_tick(deadline)
+        entry.cancelled = False
+        entry.wheel = self
+        self.count += 1
+        self._insert(entry)
+
+    def cancel_all(self, predicate: Optional[Callable[[TimerEntry], bool]] = None) -> None:
+        for level in self.levels:
+            for slot in level:
+                for entry in slot:
+                    if predicate is None or predicate(entry):
+                        entry.cancel()
+                slot[:] = [entry for entry in slot if not entry.cancelled]
+
+    def iter_entries(self):
+        for level in self.levels:
+            for slot in level:
+                for entry in slot:
+                    if not entry.cancelled:
+                        yield entry
+
+    # Advance.
+    ########################################################################
+
+    def get_next_deadline(self) -> Optional[float]:
+        """ Deadline of the closest active entry, None if there's none. """
+        next_tick = self._get_next_tick()
+        return None if next_tick is None else self.origin + next_tick * self.resolution
+
+    def _get_next_tick(self) -> Optional[int]:
+        if self.count == 0:
+            return None
+        best: Optional[int] = None
+        for level, slots in enumerate(self.levels):
+            shift = SLOT_BITS * level
+            start = (self.current_tick >> shift) & SLOT_MASK
+            for offset in range(SLOTS):
+                slot = slots[(start + offset) & SLOT_MASK]
+                if slot:
+                    slot[:] = [entry for entry in slot if not entry.cancelled]
+                if slot:
+                    slot_best = min(entry.tick for entry in slot)
+                    if best is None or slot_best < best:
+                        best = slot_best
+                    # Later level 0 slots only hold later deadlines. Upper level slots are few,
+                    # they are all checked (entries beyond the horizon wrap around the last level).
+                    if level == 0:
+                        break
+        return best
+
+    def _cascade(self, level: int) -> None:
+        slot_index = (self.current_tick >> (SLOT_BITS * level)) & SLOT_MASK
+        slot = self.levels[level][slot_index]
+        self.levels[level][slot_index] = []
+        for entry in slot:
+            if not entry.cancelled:
+                # Entries of the current tick go to the level 0 slot that is about to run.
+                self._insert(entry, cascading=True)
+
+    def _step(self) -> List[TimerEntry]:
+        """ Advance one tick, returning the entries that expire on it. """
+        self.current_tick += 1
+        tick = self.current_tick
+        # Cascade from the upper levels down, at the end of each lower level turn.
+        for level in range(LEVELS - 1, 0, -1):
+            if tick & ((1 << (SLOT_BITS * level)) - 1) == 0:
+                self._cascade(level)
+        slot_index = tick & SLOT_MASK
+        slot = self.levels[0][slot_index]
+        self.levels[0][slot_index] = []
+        expired = []
+        for entry in slot:
+            if entry.cancelled:
+                continue
+            if entry.tick > tick:
+                # Beyond the horizon when scheduled.
+                self._insert(entry)
+            else:
+                expired.append(entry)
+        return expired
+
+    def _jump(self, tick: int) -> None:
+        """ Move to ``tick`` without stepping every tick in between. No entry expires before it. """
+        self.current_tick = tick
+        for level in range(LEVELS - 1, 0, -1):
+            self._cascade(level)
+
+    def advance(self, now: Optional[float] = None) -> List[TimerEntry]:
+        """ Move the wheel to the current time, returning the expired entries in deadline order. """
+        # Ticks already started (deadlines are rounded up to a tick, so none runs early).
+        now_tick = int(((self.clock() if now is None else now) - self.origin) / self.resolution + 1e-6)
+        expired: List[TimerEntry] = []
+        while self.current_tick < now_tick:
+            if self.count == 0:
+                self.current_tick = now_tick
+                break
+            next_tick = self._get_next_tick()
+            target = now_tick if next_tick is None else min(now_tick, next_tick)
+            if target > self.current_tick + 1:
+                self._jump(target - 1)
+            expired.extend(self._step())
+        expired.sort(key=lambda entry: entry.deadline)
+        for entry in expired:
+            entry.wheel = None
+            self.count -= 1
+        return expired
+
+    def run(self, now: Optional[float] = None) -> Optional[float]:
+        """ Call the expired entries and re-schedule the repeating ones.
+            Returns the seconds until the next deadline, None if the wheel is empty. """
+        for entry in self.advance(now):
+            if entry.timeout is not None and self.clock() > entry.timeout:
+                continue
+            try:
+                result = entry.callback(*entry.args, **entry.kwargs)
+            except Exception:
+                # As with bpy timers, a failing callback is not called again.
+                traceback.print_exc()
+                continue
+            if entry.wheel is not None or entry.cancelled:
+                # Re-scheduled or cancelled by the callback itself.
+                continue
+            if result == -1:
+                continue
+            interval = result if result is not None else entry.interval
+            if interval is None:
+                continue
+            self._schedule_at(entry, self.clock() + max(0.0, interval))
+        next_deadline = self.get_next_deadline()
+        if next_deadline is None:
+            return None
+        return max(0.0, next_deadline - self.clock())
@@ -0,0 +1,174 @@
+""" Cooperative work queue: generators resumed from a timer, within a per-tick time budget.
+
+    def rebuild_index(objects):
+        for i, obj in enumerate(objects):
+            index[obj.name] = compute(obj)
+            yield i / len(objects)  # Yield often, optionally a progress in [0, 1].
+        return index
+
+    WorkQueue.submit(rebuild_index, list(bpy.data.objects), priority=5, on_done=set_index)
+
+Each tick, the highest priority items are resumed in slices until the budget is spent. An item's
+priority grows while it waits (``aging``), so low priority work is never starved. The budget
+adapts to the measured time between ticks: the longer the rest of the frame takes, the less
+time the queue gets, between ``min_budget`` and ``max_budget``. Everything runs in the main
+thread, so generators can use bpy.
+"""
+
+import time
+import itertools
+import traceback
+from types import GeneratorType
+from typing import Any, Callable, Generator, List, Optional, Union
+
+from ..globals import GLOBALS
+from .timer import new_timer, TimerHandler
+
+
+__all__ = [
+    'WorkItem',
+    'WorkQueue',
+]
+
+
+class WorkItem:
+    def __init__(self, generator: Generator, priority: int, name: str,
+                 on_done: Optional[Callable[[Any], None]], on_error: Optional[Callable[[BaseException], None]], order: int) -> None:
+        self.generator = generator
+        self.priority = priority
+        self.name = name
+        self.on_done = on_done
+        self.on_error = on_error
+        self.order = order
+        self.progress: Optional[float] = None
+        self.finished = False
+        self.cancelled = False
+        self.last_run = time.perf_counter()
+        # Seconds spent running it.
+        self.elapsed = 0.0
+
+    def get_effective_priority(self, now: float) -> float:
+        return self.priority + (now - self.last_run) * WorkQueue.aging
+
+    def cancel(self) -> None:
+        if not self.finished:
+            self.cancelled = True
+            self.finished = True
+            self.generator.close()
+
+
+class WorkQueue:
+    """ Frame budgeted generators driver. """
+
+    # Target time between UI redraws, in seconds.
+    target_frame_time: float = 1 / 30
+    min_budget: float = 0.001
+    max_budget: float = 0.008
+    # Max time an item runs before letting others run, in seconds.
+    slice: float = 0.002
+    # Priority gained per second of waiting.
+    aging: float = 1.0
+    interval: float = 0.01
+
+    items: List[WorkItem] = []
+    budget: float = min_budget
+    frame_time: Optional[float] = None  # Moving average of the time between ticks.
+    _last_tick: Optional[float] = None
+    _used: float = 0.0
+    _counter = itertools.count()
+    _timer: Optional[TimerHandler] = None
+
+    @classmethod
+    def submit(cls, work: Union[Callable[..., Generator], Generator], *args, priority: int = 0,
+               on_done: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[BaseException], None]] = None, **kwargs) -> WorkItem:
+        """ Queue a generator (or a generator function and its arguments). Its return value is passed to ``on_done``. """
+        generator = work if isinstance(work, GeneratorType) else work(*args, **kwargs)
+        if not isinstance(generator, GeneratorType):
+            raise TypeError(f"WorkQueue.submit: expected a generator, got {type(generator).__name__}")
+        name = getattr(work, '__qualname__', None) or generator.__qualname__
+        item = WorkItem(generator, priority, name, on_done, on_error, next(cls._counter))
+        cls.items.append(item)
+        if cls._timer is None:
+            cls._last_tick = None
+            # Persistent: queued work survives loading a file, and so must the handle.
+            cls._timer = new_timer(cls._on_timer, first_interval=0, step_interval=cls.interval, one_time_only=False, persistent=True)
+        return item
+
+    @classmethod
+    def _update_budget(cls, now: float) -> None:
+        if cls._last_tick is not None:
+            delta = now - cls._last_tick
+            cls.frame_time = delta if cls.frame_time is None else cls.frame_time * 0.8 + delta * 0.2
+            # Time the rest of the frame takes (drawing, other handlers...), without our work.
+            others = max(0.0, cls.frame_time - cls._used - cls.interval)
+            cls.budget = min(cls.max_budget, max(cls.min_budget, cls.target_frame_time - others - cls.interval))
+        cls._last_tick = now
+
+    @classmethod
+    def _pick(cls, now: float) -> Optional[WorkItem]:
+        cls.items[:] = [item for item in cls.items if not item.finished]
+        if not cls.items:
+            return None
+        return max(cls.items, key=lambda item: (item.get_effective_priority(now), -item.order))
+
+    @classmethod
+    def _run_slice(cls, item: WorkItem, end: float) -> None:
+        start = time.perf_counter()
+        try:
+            while True:
+                value = next(item.generator)
+                if isinstance(value, float):
+                    item.progress = value
+                if time.perf_counter() >= end:
+                    break
+        except StopIteration as stop:
+            item.finished = True
+            item.progress = 1.0
+            if item.on_done is not None:
+                try:
+                    item.on_done(stop.value)
+                except Exception:
+                    traceback.print_exc()
+        except Exception as e:
+            item.finished = True
+            if item.on_error is not None:
+                try:
+                    item.on_error(e)
+                except Exception:
+                    traceback.print_exc()
+            else:
+                print(f'[{GLOBALS.ADDON_MODULE_UPPER}]', f"Work '{item.name}' failed!")
+                traceback.print_exc()
+        now = time.perf_counter()
+        item.elapsed += now - start
+        item.last_run = now
+
+    @classmethod
+    def _on_timer(cls):
+        start = time.perf_counter()
+        cls._update_budget(start)
+        deadline = start + cls.budget
+        while (now := time.perf_counter()) < deadline:
+            if (item := cls._pick(now)) is None:
+                break
+            cls._run_slice(item, min(deadline, now + cls.slice))
+        cls._used = time.perf_counter() - start
+        if not any(not item.finished for item in cls.items):
+            cls.items.clear()
+            cls._timer = None
+            return -1
+        return None
+
+    @classmethod
+    def cancel_all(cls) -> None:
+        for item in cls.items:
+            item.cancel()
+        cls.items.clear()
+        if cls._timer is not None:
+            cls._timer.stop()
+            cls._timer = None
+
+
+def unregister():
+    WorkQueue.cancel_all()
@@ -1,7 +1,5 @@
-from .ops import generate_ops_py
-from .icons import generate_icons_py
-from .types import generate_types_py
-from .nodes import generate_nodes_py
+# Generators are imported when called, they pull heavy dependencies (numpy, gpu, ast...)
+# that an addon shouldn't pay for at import time.
 
 __all__ = ['AutoCode']
 
@@ -10,19 +8,23 @@ class AutoCode:
     @staticmethod
     def OPS(filename: str = 'ops'):
         ''' Generate a {filename}.py file with typed operator classes. '''
+        from .ops import generate_ops_py
         generate_ops_py(filename)
 
     @staticmethod
     def ICONS(filename: str = 'icons'):
         ''' Generate a {filename}.py file with an Icon class to get icons to draw in Blender interface or custom interfaces. '''
+        from .icons import generate_icons_py
         generate_icons_py(filename)
         
     @staticmethod
     def TYPES(filename: str = 'types'):
         ''' Generate a {filename}.py file with typed PropertyGroup classes, as well as AddonPreferences and extended bpy.types. '''
+        from .types import generate_types_py
         generate_types_py(filename)
 
     @staticmethod
     def NODES(filename: str = 'nodes'):
         ''' Generate a {filename}.py file with Node classes. '''
+        from .nodes import generate_nodes_py
         generate_nodes_py(filename)
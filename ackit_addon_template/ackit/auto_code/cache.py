@@ -0,0 +1,135 @@
+""" Fingerprints of the AutoCode generator inputs, to skip the generation when nothing changed.
+
+Each generator hashes what its output depends on (classes, property definitions, idnames,
+icon files...) together with its own source code. The fingerprints are stored in
+``GLOBALS.USER_CONFIG_DIR``, and the generated files are only written (atomically) if their
+contents change, so file watchers, the startup manifest and bytecode caches stay untouched.
+"""
+
+import os
+import json
+import threading
+import inspect
+import hashlib
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..globals import GLOBALS
+from ..debug.output import print_debug
+
+
+__all__ = [
+    'compute_fingerprint',
+    'get_class_fingerprint',
+    'is_up_to_date',
+    'set_fingerprint',
+    'write_if_changed',
+]
+
+
+_fingerprints: Optional[Dict[str, str]] = None
+# Deferred AutoCode sets fingerprints from a worker thread.
+_lock = threading.Lock()
+
+
+def _get_filepath() -> Path:
+    return Path(GLOBALS.USER_CONFIG_DIR) / f'{GLOBALS.ADDON_MODULE_SHORT}_autocode.json'
+
+
+def _load_fingerprints() -> Dict[str, str]:
+    global _fingerprints
+    with _lock:
+        if _fingerprints is None:
+            try:
+                with _get_filepath().open('r', encoding='utf-8') as f:
+                    _fingerprints = json.load(f)
+            except (OSError, ValueError):
+                _fingerprints = {}
+    return _fingerprints
+
+
+def _stable_repr(value: Any) -> str:
+    """ repr() without memory addresses, so the same inputs give the same fingerprint across sessions. """
+    if isinstance(value, dict):
+        return '{' + ', '.join(f'{_stable_repr(k)}: {_stable_repr(v)}' for k, v in sorted(value.items(), key=lambda item: str(item[0]))) + '}'
+    if isinstance(value, (list, tuple)):
+        return '[' + ', '.join(_stable_repr(v) for v in value) + ']'
+    if isinstance(value, (set, frozenset)):
+        return '{' + ', '.join(sorted(_stable_repr(v) for v in value)) + '}'
+    if isinstance(value, Enum):
+        return f'{type(value).__qualname__}.{value.name}'
+    if isinstance(value, type) or callable(value):
+        return f'{getattr(value, "__module__", "")}.{getattr(value, "__qualname__", type(value).__qualname__)}'
+    value_repr = repr(value)
+    if ' at 0x' in value_repr:
+        return type(value).__qualname__
+    return value_repr
+
+
+def get_class_fingerprint(cls: type) -> str:
+    """ Source code of the class (or its qualified name if not available) plus its current naming attributes. """
+    try:
+        source = inspect.getsource(cls)
+    except (OSError, TypeError):
+        source = ''
+    return '\n'.join((
+        f'{cls.__module__}.{cls.__qualname__}',
+        cls.__name__,
+        str(getattr(cls, 'bl_idname', '')),
+        str(getattr(cls, 'bl_label', '')),
+        str(getattr(cls, 'bl_description', '')),
+        source,
+    ))
+
+
+def compute_fingerprint(generator_file: str, *inputs: Any) -> str:
+    """ Hash of the generator source file and the given inputs. """
+    sha1 = hashlib.sha1()
+    try:
+        sha1.update(Path(generator_file).read_bytes())
+    except OSError:
+        pass
+    for value in inputs:
+        sha1.update(b'\0')
+        sha1.update((value if isinstance(value, str) else _stable_repr(value)).encode('utf-8', 'surrogatepass'))
+    return sha1.hexdigest()
+
+
+def is_up_to_date(output_path: Path, fingerprint: str) -> bool:
+    """ Whether the output file exists and was generated from the same inputs. """
+    return output_path.exists() and _load_fingerprints().get(str(output_path), None) == fingerprint
+
+
+def set_fingerprint(output_path: Path, fingerprint: str) -> None:
+    fingerprints = _load_fingerprints()
+    with _lock:
+        if fingerprints.get(str(output_path), None) == fingerprint:
+            return
+        fingerprints[str(output_path)] = fingerprint
+        filepath = _get_filepath()
+        try:
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            tmp_filepath = filepath.with_suffix('.tmp')
+            with tmp_filepath.open('w', encoding='utf-8') as f:
+                json.dump(fingerprints, f, indent=1)
+            os.replace(tmp_filepath, filepath)
+        except OSError as e:
+            print_debug(f"AutoCode: fingerprints could not be written! {e}")
+
+
+def write_if_changed(output_path: Path, content: str) -> bool:
+    """ Write the file atomically, only if its contents change. Returns True if the file was written. """
+    output_path = Path(output_path)
+    data = content.encode('utf-8')
+    try:
+        if output_path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    with tmp_path.open('wb') as f:
+        f.write(data)
+    os.replace(tmp_path, output_path)
+    print_debug(f"AutoCode: '{output_path.name}' generated")
+    return True
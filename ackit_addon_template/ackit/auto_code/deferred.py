@@ -0,0 +1,146 @@
+""" Deferred AutoCode: generate the files in a worker thread, after registration.
+
+bpy data is not thread safe, so the class metadata the generators read (operators, property
+groups...) is snapshotted in the main thread. Rendering the sources and writing the files runs
+in a worker thread, one generator after another, and the results are reported from a timer.
+Generators without a snapshot step (``AutoCode.NODES``, custom functions) run in the main thread.
+"""
+
+import time
+import queue
+import threading
+import functools
+import traceback
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from ..globals import GLOBALS
+from ..debug.output import print_debug
+from ..debug.timings import StartupTimings
+from ..app.timer import new_timer, TimerHandler
+from . import AutoCode
+
+
+__all__ = [
+    'DeferredAutoCode',
+]
+
+
+def _snapshot_ops(filename: str = 'ops'):
+    from .ops import snapshot_ops_py, write_ops_py
+    snapshot = snapshot_ops_py(filename)
+    return None if snapshot is None else functools.partial(write_ops_py, snapshot)
+
+
+def _snapshot_types(filename: str = 'types', *args, **kwargs):
+    from .types import snapshot_types_py, write_types_py
+    snapshot = snapshot_types_py(filename, *args, **kwargs)
+    return None if snapshot is None else functools.partial(write_types_py, snapshot)
+
+
+def _snapshot_icons(filename: str = 'icons'):
+    # Only reads the icons directory, no bpy data involved.
+    from .icons import generate_icons_py
+    return functools.partial(generate_icons_py, filename)
+
+
+# AutoCode generator -> function taking its snapshot in the main thread.
+# It returns the job to run in the worker thread, or None if the file is up to date.
+SNAPSHOT_FUNCTIONS = {
+    AutoCode.OPS: _snapshot_ops,
+    AutoCode.TYPES: _snapshot_types,
+    AutoCode.ICONS: _snapshot_icons,
+}
+
+
+def _unwrap(generator: Callable) -> Tuple[Callable, tuple, dict]:
+    if isinstance(generator, functools.partial):
+        return generator.func, generator.args, generator.keywords
+    return generator, (), {}
+
+
+def _on_timer():
+    return DeferredAutoCode.poll()
+
+
+class DeferredAutoCode:
+    """ Run the AutoCode generators in a background thread. """
+
+    poll_interval: float = 0.1
+
+    jobs: List[Tuple[str, Callable[[], None]]] = []
+    thread: Optional[threading.Thread] = None
+    results: 'queue.SimpleQueue[Tuple[str, float, Optional[str]]]' = queue.SimpleQueue()
+    pending: int = 0
+    timer: Optional[TimerHandler] = None
+
+    @classmethod
+    def prepare(cls, generators: Iterable[Callable[[], None]]) -> None:
+        """ Snapshot the generators inputs. Must be called from the main thread. """
+        cls.jobs.clear()
+        for generator in generators:
+            func, args, kwargs = _unwrap(generator)
+            name = getattr(func, '__qualname__', repr(func))
+            with StartupTimings.measure('auto_code', name):
+                if (snapshot_func := SNAPSHOT_FUNCTIONS.get(func, None)) is None:
+                    generator()
+                    continue
+                job = snapshot_func(*args, **kwargs)
+            if job is not None:
+                cls.jobs.append((name, job))
+
+    @classmethod
+    def start(cls) -> None:
+        """ Run the prepared jobs in a worker thread and poll their results from a timer. """
+        if not cls.jobs:
+            return
+        cls.stop()
+        jobs = cls.jobs[:]
+        cls.jobs.clear()
+        cls.pending = len(jobs)
+        cls.thread = threading.Thread(
+            target=cls._run_jobs, args=(jobs, cls.results),
+            name=f'{GLOBALS.ADDON_MODULE_SHORT}_autocode', daemon=True
+        )
+        cls.thread.start()
+        cls.timer = new_timer(_on_timer, first_interval=cls.poll_interval, step_interval=cls.poll_interval, one_time_only=False)
+
+    @classmethod
+    def stop(cls) -> None:
+        """ Wait for the running jobs (if any) to finish. """
+        if cls.timer is not None:
+            cls.timer.stop()
+            cls.timer = None
+        if cls.thread is not None:
+            cls.thread.join()
+            cls.thread = None
+        cls.poll()
+
+    @staticmethod
+    def _run_jobs(jobs: List[Tuple[str, Callable[[], None]]], results: queue.SimpleQueue) -> None:
+        for name, job in jobs:
+            start = time.perf_counter()
+            try:
+                job()
+                error = None
+            except Exception:
+                error = traceback.format_exc()
+            results.put((name, time.perf_counter() - start, error))
+
+    @classmethod
+    def poll(cls):
+        """ Report the finished jobs. Returns -1 (stops the timer) once all of them finished. """
+        while True:
+            try:
+                name, duration, error = cls.results.get_nowait()
+            except queue.Empty:
+                break
+            cls.pending -= 1
+            if error is not None:
+                print(f'[{GLOBALS.ADDON_MODULE_UPPER}]', f"AutoCode: '{name}' failed!\n{error}")
+            else:
+                print_debug(f"AutoCode: '{name}' finished in background ({duration * 1000:.2f} ms)")
+        if cls.pending <= 0:
+            cls.pending = 0
+            cls.timer = None
+            return -1
+        return None
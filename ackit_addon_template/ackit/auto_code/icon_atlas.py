@@ -0,0 +1,154 @@
+""" Icon texture atlas: every icon of an ``IconsEnum`` collection packed into a single RGBA texture.
+
+Icons are scaled to the same size (``GPUTEX_ICON_SIZE``), so they are packed in a grid.
+Each cell has its icon plus a border of repeated edge pixels, so linear filtering doesn't
+bleed between neighbours. Packing and pixel assembly are plain NumPy (``pack_grid`` and
+``assemble_atlas`` don't need bpy nor a GPU), only the texture creation and drawing do.
+Icons are decoded by ``IconDecoder`` in a thread pool (``IconAtlas.from_files_async`` builds the
+whole atlas off the main thread), the texture is uploaded when first used, in the main thread.
+"""
+
+import math
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .icon_decode import IconDecoder, load_icon_pixels_bpy
+
+if TYPE_CHECKING:
+    from gpu.types import GPUTexture
+
+
+__all__ = [
+    'IconAtlas',
+    'pack_grid',
+    'assemble_atlas',
+]
+
+
+UVRect = Tuple[float, float, float, float]  # u0, v0, u1, v1.
+
+
+def pack_grid(count: int, cell_size: Tuple[int, int], padding: int = 1) -> Tuple[np.ndarray, Tuple[int, int], int]:
+    """ Cell origins (count, 2) in pixels, atlas (width, height) and number of columns,
+        for ``count`` cells of ``cell_size`` plus ``padding`` pixels on every side, in a nearly square grid. """
+    cell_w, cell_h = cell_size[0] + padding * 2, cell_size[1] + padding * 2
+    cols = max(1, math.ceil(math.sqrt(count)))
+    rows = max(1, math.ceil(count / cols))
+    index = np.arange(count)
+    origins = np.stack((index % cols * cell_w, index // cols * cell_h), axis=1)
+    return origins, (cols * cell_w, rows * cell_h), cols
+
+
+def assemble_atlas(pixels: np.ndarray, padding: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+    """ Pack ``pixels`` (count, height, width, 4), rows bottom to top as in Blender images,
+        into an atlas (atlas_height, atlas_width, 4). Returns the atlas and the UV rects (count, 4) of the icons. """
+    count, height, width, channels = pixels.shape
+    if count == 0:
+        return np.zeros((1, 1, channels), dtype=np.float32), np.empty((0, 4), dtype=np.float32)
+    origins, (atlas_w, atlas_h), cols = pack_grid(count, (width, height), padding)
+    rows = atlas_h // (height + padding * 2)
+
+    cells = np.pad(pixels, ((0, rows * cols - count), (padding, padding), (padding, padding), (0, 0)), mode='edge')
+    if rows * cols > count:
+        cells[count:] = 0
+    # (rows, cols, cell_h, cell_w, 4) -> (rows, cell_h, cols, cell_w, 4) -> (atlas_h, atlas_w, 4).
+    atlas = cells.reshape(rows, cols, height + padding * 2, width + padding * 2, channels) \
+                 .transpose(0, 2, 1, 3, 4) \
+                 .reshape(atlas_h, atlas_w, channels)
+
+    inner = origins + padding
+    uv_rects = np.empty((count, 4), dtype=np.float32)
+    uv_rects[:, 0] = inner[:, 0] / atlas_w
+    uv_rects[:, 1] = inner[:, 1] / atlas_h
+    uv_rects[:, 2] = (inner[:, 0] + width) / atlas_w
+    uv_rects[:, 3] = (inner[:, 1] + height) / atlas_h
+    return np.ascontiguousarray(atlas, dtype=np.float32), uv_rects
+
+
+class IconAtlas:
+    """ Texture with all the icons of a collection and the UV rect of each icon. """
+
+    def __init__(self, identifiers: List[str], atlas: np.ndarray, uv_rects: np.ndarray) -> None:
+        self.uv_rects: Dict[str, UVRect] = {identifier: tuple(uv_rect.tolist()) for identifier, uv_rect in zip(identifiers, uv_rects)}
+        self.pixels: Optional[np.ndarray] = atlas
+        self.size: Tuple[int, int] = (atlas.shape[1], atlas.shape[0])
+        # (identifier, filepath) of the icons to load with bpy (main thread) before the upload.
+        self.pending_icons: List[Tuple[str, str]] = []
+        self._texture: Optional['GPUTexture'] = None
+
+    @classmethod
+    def from_files(cls, icons: Iterable[Tuple[str, Optional[str]]], size: Tuple[int, int], padding: int = 1) -> 'IconAtlas':
+        """ Build the atlas from (identifier, filepath) pairs, every icon scaled to ``size``. """
+        icons = list(icons)
+        identifiers = [identifier for identifier, _filepath in icons]
+        filepaths = [filepath for _identifier, filepath in icons]
+        pixels, failed = IconDecoder.decode_many(filepaths, size)
+        atlas = cls(identifiers, *assemble_atlas(pixels, padding))
+        atlas.pending_icons = [icons[index] for index in failed]
+        return atlas
+
+    @classmethod
+    def from_files_async(cls, icons: Iterable[Tuple[str, Optional[str]]], size: Tuple[int, int], padding: int = 1) -> 'Future[IconAtlas]':
+        """ Same as ``from_files`` in a background thread. """
+        icons = list(icons)
+        future = Future()
+
+        def _build():
+            try:
+                future.set_result(cls.from_files(icons, size, padding))
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=_build, name='icon_atlas', daemon=True).start()
+        return future
+
+    def _load_pending_icons(self) -> None:
+        width, height = self.size
+        for identifier, filepath in self.pending_icons:
+            u0, v0, u1, v1 = self.uv_rects[identifier]
+            x, y = round(u0 * width), round(v0 * height)
+            icon_w, icon_h = round(u1 * width) - x, round(v1 * height) - y
+            try:
+                self.pixels[y:y + icon_h, x:x + icon_w] = load_icon_pixels_bpy(filepath, (icon_w, icon_h))
+            except RuntimeError as e:
+                print(f"Icon atlas: can't load '{filepath}' ({e})")
+        self.pending_icons.clear()
+
+    @property
+    def texture(self) -> 'GPUTexture':
+        """ GPU texture, created on first use (needs a GPU context). """
+        if self._texture is None:
+            from gpu.types import GPUTexture, Buffer as GPUBuffer
+            self._load_pending_icons()
+            self._texture = GPUTexture(
+                self.size,
+                layers=0,
+                is_cubemap=False,
+                format='RGBA16F',
+                data=GPUBuffer('FLOAT', self.pixels.size, self.pixels.ravel())
+            )
+            # The GPU has its own copy now.
+            self.pixels = None
+        return self._texture
+
+    def get_uv_rect(self, identifier: str) -> Optional[UVRect]:
+        return self.uv_rects.get(identifier, None)
+
+    def draw(self, identifier: str, x: float, y: float, w: float, h: float) -> None:
+        if (uv_rect := self.uv_rects.get(identifier, None)) is not None:
+            from ..gpu.imm import images_2d
+            images_2d(self.texture, ((x, y, w, h),), (uv_rect,))
+
+    def draw_many(self, items: Iterable[Tuple[str, float, float, float, float]]) -> None:
+        """ Draw several icons, (identifier, x, y, w, h) each, binding the atlas once in a single batch. """
+        rects, uv_rects = [], []
+        for identifier, x, y, w, h in items:
+            if (uv_rect := self.uv_rects.get(identifier, None)) is not None:
+                rects.append((x, y, w, h))
+                uv_rects.append(uv_rect)
+        if rects:
+            from ..gpu.imm import images_2d
+            images_2d(self.texture, rects, uv_rects)
@@ -0,0 +1,164 @@
+""" Persistent cache of the decoded and scaled icon pixels.
+
+Pixels are stored as float16 RGBA blobs in a single binary file under ``GLOBALS.USER_CONFIG_DIR``,
+with a JSON index keyed by icon path and target size (plus the icon mtime, to detect changes).
+The binary file is read through ``numpy.memmap``, so a warm start maps the pixels instead of
+decoding them. New entries are written on ``save``, which also evicts the entries whose source
+file is gone or changed.
+"""
+
+import os
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from ..globals import GLOBALS
+from ..debug.output import print_debug
+
+
+__all__ = [
+    'IconPixelCache',
+]
+
+
+CACHE_VERSION = 1
+
+
+def _get_key(filepath: str, size: Tuple[int, int]) -> str:
+    return f'{os.path.normcase(os.path.abspath(filepath))}|{size[0]}x{size[1]}'
+
+
+class IconPixelCache:
+    """ Icon pixels cache, thread safe. """
+
+    enabled: bool = True
+
+    _lock = threading.Lock()
+    # key -> {'path', 'mtime', 'offset', 'shape'}, offset in float16 values.
+    _index: Optional[Dict[str, dict]] = None
+    _memmap: Optional[np.memmap] = None
+    # key -> (entry, pixels) not saved yet.
+    _new: Dict[str, Tuple[dict, np.ndarray]] = {}
+
+    @staticmethod
+    def get_filepaths() -> Tuple[Path, Path]:
+        basepath = Path(GLOBALS.USER_CONFIG_DIR) / f'{GLOBALS.ADDON_MODULE_SHORT}_icons_cache'
+        return basepath.with_suffix('.json'), basepath.with_suffix('.bin')
+
+    @classmethod
+    def _load(cls) -> Dict[str, dict]:
+        # Called with the lock held.
+        if cls._index is None:
+            index_path, blob_path = cls.get_filepaths()
+            try:
+                with index_path.open('r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version', None) != CACHE_VERSION:
+                    raise ValueError("outdated version")
+                cls._index = data['entries']
+                cls._memmap = np.memmap(blob_path, dtype=np.float16, mode='r') if cls._index else None
+            except (OSError, ValueError, KeyError):
+                cls._index = {}
+                cls._memmap = None
+        return cls._index
+
+    @classmethod
+    def get(cls, filepath: str, size: Tuple[int, int]) -> Optional[np.ndarray]:
+        """ Cached pixels (height, width, 4) as float32, or None if missing or outdated. """
+        if not cls.enabled:
+            return None
+        key = _get_key(filepath, size)
+        try:
+            mtime = os.stat(filepath).st_mtime_ns
+        except OSError:
+            return None
+        with cls._lock:
+            if (new := cls._new.get(key, None)) is not None:
+                entry, pixels = new
+            elif (entry := cls._load().get(key, None)) is not None and cls._memmap is not None:
+                count = int(np.prod(entry['shape']))
+                pixels = cls._memmap[entry['offset']:entry['offset'] + count].reshape(entry['shape'])
+            else:
+                return None
+        if entry['mtime'] != mtime:
+            return None
+        return pixels.astype(np.float32)
+
+    @classmethod
+    def put(cls, filepath: str, size: Tuple[int, int], pixels: np.ndarray) -> None:
+        if not cls.enabled:
+            return
+        try:
+            mtime = os.stat(filepath).st_mtime_ns
+        except OSError:
+            return
+        entry = {'path': os.path.abspath(filepath), 'mtime': mtime, 'offset': 0, 'shape': list(pixels.shape)}
+        with cls._lock:
+            cls._new[_get_key(filepath, size)] = (entry, pixels.astype(np.float16))
+
+    @classmethod
+    def save(cls) -> None:
+        """ Write the new entries, dropping the ones whose source file is gone or changed. """
+        with cls._lock:
+            index = cls._load()
+            evicted = [key for key, entry in index.items() if key not in cls._new and not cls._is_valid(entry)]
+            if not cls._new and not evicted:
+                return
+
+            blobs = []
+            new_index = {}
+            offset = 0
+            for key, entry in index.items():
+                if key in cls._new or key in evicted:
+                    continue
+                count = int(np.prod(entry['shape']))
+                blobs.append(np.array(cls._memmap[entry['offset']:entry['offset'] + count]))
+                new_index[key] = dict(entry, offset=offset)
+                offset += count
+            for key, (entry, pixels) in cls._new.items():
+                blobs.append(pixels.ravel())
+                new_index[key] = dict(entry, offset=offset)
+                offset += pixels.size
+
+            # The mapped file has to be closed before replacing it (Windows).
+            cls._memmap = None
+            index_path, blob_path = cls.get_filepaths()
+            try:
+                index_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_blob_path = blob_path.with_suffix('.bin.tmp')
+                (np.concatenate(blobs) if blobs else np.empty(0, dtype=np.float16)).astype(np.float16).tofile(tmp_blob_path)
+                os.replace(tmp_blob_path, blob_path)
+                tmp_index_path = index_path.with_suffix('.json.tmp')
+                with tmp_index_path.open('w', encoding='utf-8') as f:
+                    json.dump({'version': CACHE_VERSION, 'entries': new_index}, f)
+                os.replace(tmp_index_path, index_path)
+            except OSError as e:
+                print_debug(f"Icon cache: could not be written! {e}")
+                cls._index = None
+                return
+            print_debug(f"Icon cache: {len(cls._new)} new entries, {len(evicted)} evicted")
+            cls._new.clear()
+            cls._index = None
+
+    @staticmethod
+    def _is_valid(entry: dict) -> bool:
+        try:
+            return os.stat(entry['path']).st_mtime_ns == entry['mtime']
+        except OSError:
+            return False
+
+    @classmethod
+    def clear(cls) -> None:
+        """ Remove the cache files. """
+        with cls._lock:
+            cls._index = None
+            cls._memmap = None
+            cls._new.clear()
+            for filepath in cls.get_filepaths():
+                try:
+                    filepath.unlink()
+                except OSError:
+                    pass
@@ -0,0 +1,283 @@
+""" Icon decoding and resampling, off the main thread.
+
+Files are decoded with Pillow if it is installed, else PNG files are decoded with ``zlib`` and
+NumPy (8/16 bits, non interlaced, every color type). Pixels are resampled to the requested
+size with NumPy, so no bpy is involved and ``IconDecoder`` runs the files in a thread pool.
+Files that can't be decoded this way are reported back, to be loaded with ``load_icon_pixels_bpy``
+in the main thread. Both loaders go through the on-disk ``IconPixelCache``.
+"""
+
+import os
+import zlib
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .icon_cache import IconPixelCache
+
+
+__all__ = [
+    'IconDecodeError',
+    'IconDecoder',
+    'decode_png',
+    'decode_image',
+    'resample',
+    'load_icon_pixels',
+    'load_icon_pixels_bpy',
+]
+
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+# PNG color type -> channels.
+PNG_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+
+class IconDecodeError(ValueError):
+    pass
+
+
+# PNG.
+# ----------------------------------------------------------------
+
+def _unfilter_wavefront(filters: np.ndarray, rows: np.ndarray, bpp: int) -> np.ndarray:
+    # Average and Paeth depend on the left output pixel, so they can't be vectorized per row.
+    # Each pixel only depends on its left, up and up-left ones though: pixels of an anti-diagonal
+    # (y + x constant) are independent and are unfiltered at once. The image is skewed so that
+    # each anti-diagonal is a column (skewed[y + 1, y + x + 1] = pixel[y, x]) and sliced without copies.
+    height, stride = rows.shape
+    width = stride // bpp
+    ys, xs = np.indices((height, width))
+    raw = np.zeros((height, height + width, bpp), dtype=np.int16)
+    raw[ys, ys + xs] = rows.reshape(height, width, bpp)
+    out = np.zeros((height + 1, height + width + 1, bpp), dtype=np.int16)
+    types = np.unique(filters)
+    single = int(types[0]) if len(types) == 1 else None
+    filters = filters.astype(np.int16)[:, None]
+    for d in range(height + width - 1):
+        y0, y1 = max(0, d - width + 1), min(height - 1, d) + 1
+        a = out[y0 + 1:y1 + 1, d]
+        b = out[y0:y1, d]
+        c = out[y0:y1, d - 1] if d else out[y0:y1, -1]
+        if single == 3:
+            pred = (a + b) >> 1
+        else:
+            pa = np.abs(b - c)
+            pb = np.abs(a - c)
+            pc = np.abs(a + b - 2 * c)
+            pred = np.where((pa <= pb) & (pa <= pc), a, np.where(pb <= pc, b, c))
+            if single is None:
+                ft = filters[y0:y1]
+                pred = np.where(ft == 4, pred, np.where(ft == 3, (a + b) >> 1, np.where(ft == 2, b, np.where(ft == 1, a, 0))))
+        out[y0 + 1:y1 + 1, d + 1] = (raw[y0:y1, d] + pred) & 0xFF
+    return out[ys + 1, ys + xs + 1].astype(np.uint8).reshape(height, stride)
+
+
+def _unfilter(filters: np.ndarray, rows: np.ndarray, bpp: int) -> np.ndarray:
+    if np.any(filters > 4):
+        raise IconDecodeError(f"invalid PNG filter type {int(filters.max())}")
+    if np.any(filters >= 3):
+        return _unfilter_wavefront(filters, rows, bpp)
+    out = np.empty_like(rows)
+    prior = np.zeros(rows.shape[1], dtype=np.uint8)
+    for y in range(rows.shape[0]):
+        filter_type = int(filters[y])
+        row = rows[y]
+        if filter_type == 0:
+            out[y] = row
+        elif filter_type == 1:
+            # Sub: running sum per channel, modulo 256.
+            out[y] = np.cumsum(row.reshape(-1, bpp), axis=0, dtype=np.uint8).ravel()
+        else:
+            out[y] = row + prior
+        prior = out[y]
+    return out
+
+
+def decode_png(data: bytes) -> np.ndarray:
+    """ RGBA float32 pixels (height, width, 4), rows top to bottom. """
+    if not data.startswith(PNG_SIGNATURE):
+        raise IconDecodeError("not a PNG file")
+    header = palette = transparency = None
+    idat = []
+    pos = len(PNG_SIGNATURE)
+    while pos + 8 <= len(data):
+        length, chunk_type = struct.unpack_from('>I4s', data, pos)
+        chunk = data[pos + 8:pos + 8 + length]
+        pos += length + 12
+        if chunk_type == b'IHDR':
+            header = struct.unpack('>IIBBBBB', chunk)
+        elif chunk_type == b'PLTE':
+            palette = np.frombuffer(chunk, dtype=np.uint8).reshape(-1, 3)
+        elif chunk_type == b'tRNS':
+            transparency = np.frombuffer(chunk, dtype=np.uint8)
+        elif chunk_type == b'IDAT':
+            idat.append(chunk)
+        elif chunk_type == b'IEND':
+            break
+    if header is None:
+        raise IconDecodeError("PNG without header")
+
+    width, height, bit_depth, color_type, _compression, _filter, interlace = header
+    if interlace or bit_depth not in (8, 16) or color_type not in PNG_CHANNELS or (color_type == 3 and palette is None):
+        raise IconDecodeError(f"unsupported PNG (bit depth {bit_depth}, color type {color_type}, interlace {interlace})")
+
+    channels = PNG_CHANNELS[color_type]
+    bpp = channels * bit_depth // 8
+    stride = width * bpp
+    try:
+        raw = np.frombuffer(zlib.decompress(b''.join(idat)), dtype=np.uint8)
+    except zlib.error as e:
+        raise IconDecodeError(f"corrupted PNG data ({e})") from None
+    if raw.size < height * (stride + 1):
+        raise IconDecodeError("truncated PNG data")
+    raw = raw[:height * (stride + 1)].reshape(height, stride + 1)
+    rows = _unfilter(raw[:, 0], raw[:, 1:], bpp)
+
+    if color_type == 3:
+        rgba = np.full((len(palette), 4), 255, dtype=np.uint8)
+        rgba[:, :3] = palette
+        if transparency is not None:
+            rgba[:len(transparency), 3] = transparency[:len(rgba)]
+        return rgba[rows.reshape(height, width)].astype(np.float32) / 255.0
+
+    if bit_depth == 16:
+        samples = rows.reshape(height, width, channels, 2)
+        values = (samples[..., 0].astype(np.float32) * 256.0 + samples[..., 1]) / 65535.0
+    else:
+        values = rows.reshape(height, width, channels).astype(np.float32) / 255.0
+
+    pixels = np.ones((height, width, 4), dtype=np.float32)
+    if channels <= 2:
+        pixels[..., :3] = values[..., :1]
+    else:
+        pixels[..., :3] = values[..., :3]
+    if channels in (2, 4):
+        pixels[..., 3] = values[..., -1]
+    return pixels
+
+
+def decode_image(filepath: str) -> np.ndarray:
+    """ RGBA float32 pixels (height, width, 4), rows top to bottom.
+        Pillow is used if installed (it decodes without holding the GIL), else PNG files are decoded with NumPy. """
+    try:
+        from PIL import Image
+    except ImportError:
+        Image = None
+    if Image is not None:
+        try:
+            with Image.open(filepath) as image:
+                return np.asarray(image.convert('RGBA'), dtype=np.float32) / 255.0
+        except (OSError, ValueError):
+            pass
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    if data.startswith(PNG_SIGNATURE):
+        return decode_png(data)
+    raise IconDecodeError(f"can't decode '{os.path.basename(filepath)}'" + ('' if Image is not None else " without Pillow"))
+
+
+# Resampling.
+# ----------------------------------------------------------------
+
+def _sample_coords(src: int, dst: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    coords = np.clip((np.arange(dst, dtype=np.float32) + 0.5) * (src / dst) - 0.5, 0, src - 1)
+    index0 = np.floor(coords).astype(np.intp)
+    index1 = np.minimum(index0 + 1, src - 1)
+    return index0, index1, coords - index0
+
+
+def resample(pixels: np.ndarray, size: Tuple[int, int]) -> np.ndarray:
+    """ Resize RGBA pixels (height, width, 4) to ``size`` (width, height).
+        Integer box filter first when downscaling 2x or more (no aliasing), then bilinear, in premultiplied alpha. """
+    width, height = size
+    src_h, src_w = pixels.shape[:2]
+    if (src_w, src_h) == (width, height):
+        return pixels
+
+    pixels = pixels.copy()
+    pixels[..., :3] *= pixels[..., 3:]
+
+    factor_y, factor_x = max(1, src_h // height), max(1, src_w // width)
+    if factor_y > 1 or factor_x > 1:
+        src_h, src_w = src_h // factor_y, src_w // factor_x
+        pixels = pixels[:src_h * factor_y, :src_w * factor_x] \
+            .reshape(src_h, factor_y, src_w, factor_x, 4) \
+            .mean(axis=(1, 3))
+
+    y0, y1, wy = _sample_coords(src_h, height)
+    x0, x1, wx = _sample_coords(src_w, width)
+    wx = wx[None, :, None]
+    top = pixels[y0][:, x0] * (1 - wx) + pixels[y0][:, x1] * wx
+    bottom = pixels[y1][:, x0] * (1 - wx) + pixels[y1][:, x1] * wx
+    out = top * (1 - wy[:, None, None]) + bottom * wy[:, None, None]
+
+    alpha = out[..., 3:]
+    np.divide(out[..., :3], alpha, out=out[..., :3], where=alpha > 0)
+    return out.astype(np.float32, copy=False)
+
+
+def load_icon_pixels(filepath: str, size: Tuple[int, int]) -> np.ndarray:
+    """ Decoded and resampled icon pixels (height, width, 4), rows bottom to top as in Blender images. Thread safe. """
+    if (pixels := IconPixelCache.get(filepath, size)) is not None:
+        return pixels
+    pixels = np.ascontiguousarray(resample(decode_image(filepath), size)[::-1])
+    IconPixelCache.put(filepath, size, pixels)
+    return pixels
+
+
+def load_icon_pixels_bpy(filepath: str, size: Tuple[int, int]) -> np.ndarray:
+    """ Same as ``load_icon_pixels`` through ``bpy.data.images``, for any format Blender reads. Main thread only. """
+    if (pixels := IconPixelCache.get(filepath, size)) is not None:
+        return pixels
+    import bpy
+    pixels = np.empty((size[1], size[0], 4), dtype=np.float32)
+    image = bpy.data.images.load(filepath)
+    image.scale(*size)
+    image.pixels.foreach_get(pixels.ravel())
+    bpy.data.images.remove(image)
+    IconPixelCache.put(filepath, size, pixels)
+    return pixels
+
+
+# Thread pool.
+# ----------------------------------------------------------------
+
+class IconDecoder:
+    """ Decode icons in a thread pool. """
+
+    max_workers: int = min(8, os.cpu_count() or 1)
+
+    _executor: Optional[ThreadPoolExecutor] = None
+
+    @classmethod
+    def get_executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(max_workers=cls.max_workers, thread_name_prefix='icon_decoder')
+        return cls._executor
+
+    @classmethod
+    def decode_many(cls, filepaths: Sequence[Optional[str]], size: Tuple[int, int]) -> Tuple[np.ndarray, List[int]]:
+        """ Pixels (count, height, width, 4) of the files (transparent if None), and the indices of the files
+            that couldn't be decoded, to load with ``load_icon_pixels_bpy``. Blocks until every file is decoded. """
+        pixels = np.zeros((len(filepaths), size[1], size[0], 4), dtype=np.float32)
+
+        def _decode(index: int) -> bool:
+            try:
+                pixels[index] = load_icon_pixels(filepaths[index], size)
+            except (OSError, IconDecodeError):
+                return False
+            return True
+
+        indices = [index for index, filepath in enumerate(filepaths) if filepath is not None]
+        decoded = cls.get_executor().map(_decode, indices)
+        failed = [index for index, ok in zip(indices, decoded) if not ok]
+        IconPixelCache.save()
+        return pixels, failed
+
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=True)
+            cls._executor = None
@@ -2,24 +2,31 @@
 
 from pathlib import Path
 import os
+import sys
 import platform
-import shelve
 from string import Template
 from enum import Enum
-import numpy as np
 import inspect
+from typing import TYPE_CHECKING
 
 import bpy
-from bpy.types import Image as BlImage, UILayout
-from gpu.types import GPUTexture, Buffer as GPUBuffer
+from bpy.types import UILayout
+if TYPE_CHECKING:
+    # numpy and gpu are imported where used: the generated icons module imports
+    # this one at addon import time, while textures are only created on first draw.
+    from gpu.types import GPUTexture
+    from .icon_atlas import IconAtlas
 from bpy.utils import previews
 
 from ..globals import GLOBALS
 from ..debug.output import print_debug
+from .cache import compute_fingerprint, is_up_to_date, set_fingerprint, write_if_changed
 
 
 icon_previews = {}
 icon_gputex = {}
+icon_atlases = {}
+icon_atlas_futures = {}
 icon_sizes = {}
 
 GPUTEX_ICON_SIZE = 100, 100
@@ -76,29 +83,31 @@ class IconsEnum(Enum):
         return collection.load(self.identifier, filepath, 'IMAGE', force_reload=True).icon_id
 
     @property
-    def gputex(self) -> GPUTexture:
+    def gputex(self) -> 'GPUTexture':
         collection: dict = icon_gputex.get(self.collection, None)
         if collection is None:
             icon_gputex[self.collection] = {}
         elif gputex := collection.get(self.identifier, None):
             return gputex
 
+        from gpu.types import GPUTexture, Buffer as GPUBuffer
+        from .icon_decode import IconDecodeError, load_icon_pixels, load_icon_pixels_bpy
+
         # Load GPUTexture.
         filepath = self.filepath
         if filepath is None:
             print("Invalid file path... bad gputex")
             return None
 
-        image: BlImage = bpy.data.images.load(filepath)
-        image.scale(*GPUTEX_ICON_SIZE)
-        px_count: int = len(image.pixels)
-        pixels = np.empty(shape=px_count, dtype=np.float32)
-        image.pixels.foreach_get(pixels)
+        try:
+            pixels = load_icon_pixels(filepath, GPUTEX_ICON_SIZE)
+        except (OSError, IconDecodeError):
+            pixels = load_icon_pixels_bpy(filepath, GPUTEX_ICON_SIZE)
 
         buff: GPUBuffer = GPUBuffer(
             'FLOAT',
-            px_count,
-            pixels
+            pixels.size,
+            pixels.ravel()
         )
 
         gputex: GPUTexture = GPUTexture(
@@ -109,23 +118,97 @@ class IconsEnum(Enum):
             data=buff
         )
 
-        bpy.data.images.remove(image)
-        del image
-
         # Cache GPUTexture.
         icon_gputex[self.collection][self.identifier] = gputex
         return gputex
 
+    @property
+    def atlas(self) -> 'IconAtlas | None':
+        """ Atlas texture with every icon of the collection, prefer it to 'gputex' when drawing many icons.
+            None while the icons are decoded in background (the first access starts it), see 'build_atlas'. """
+        if (atlas := icon_atlases.get(self.collection, None)) is None:
+            self.preload_atlas()
+        return atlas
+
+    @classmethod
+    def build_atlas(cls) -> 'IconAtlas':
+        """ Build the atlas of the collection now, blocking. Only for when it can't wait (offscreen renders...). """
+        collection = cls.__name__
+        if atlas := icon_atlases.get(collection, None):
+            return atlas
+        if future := icon_atlas_futures.pop(collection, None):
+            atlas = future.result()
+        else:
+            from .icon_atlas import IconAtlas
+            atlas = IconAtlas.from_files(((icon.identifier, icon.filepath) for icon in cls), GPUTEX_ICON_SIZE)
+        icon_atlases[collection] = atlas
+        return atlas
+
+    @classmethod
+    def preload_atlas(cls) -> None:
+        """ Decode the icons of the collection and build its atlas in background threads.
+            The texture is uploaded from a timer once ready, redrawing the interface. """
+        collection = cls.__name__
+        if collection in icon_atlases or collection in icon_atlas_futures:
+            return
+        from .icon_atlas import IconAtlas
+        from ..app.timer import new_timer
+        icon_atlas_futures[collection] = IconAtlas.from_files_async(((icon.identifier, icon.filepath) for icon in cls), GPUTEX_ICON_SIZE)
+        if len(icon_atlas_futures) == 1:
+            new_timer(_poll_icon_atlases, first_interval=0.05, step_interval=0.05, one_time_only=False)
+
+    @property
+    def uv_rect(self) -> tuple[float, float, float, float] | None:
+        """ None while the atlas is loading. """
+        atlas = self.atlas
+        return None if atlas is None else atlas.get_uv_rect(self.identifier)
+
+    def draw(self, x: float, y: float, w: float, h: float) -> bool:
+        """ Draw the icon from the collection atlas (POST_PIXEL draw handlers...).
+            The first call starts building the atlas in background and draws nothing (returns False) until it is ready. """
+        if (atlas := icon_atlases.get(self.collection, None)) is None:
+            self.preload_atlas()
+            return False
+        atlas.draw(self.identifier, x, y, w, h)
+        return True
+
     def draw_in_layout(self, layout: UILayout, scale: float = 2.0):
         if icon_id := self.icon_id:
             layout.template_icon(icon_id, scale=scale)
 
 
+def _poll_icon_atlases():
+    for collection, future in list(icon_atlas_futures.items()):
+        if not future.done():
+            continue
+        del icon_atlas_futures[collection]
+        try:
+            atlas = future.result()
+        except Exception as e:
+            print_debug(f"Icon atlas of '{collection}' failed! {e}")
+            continue
+        # Upload in the main thread.
+        atlas.texture
+        icon_atlases[collection] = atlas
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                area.tag_redraw()
+    if not icon_atlas_futures:
+        return -1
+    return None
+
+
 def unregister():
     for collection in icon_previews.values():
         previews.remove(collection)
     icon_previews.clear()
     icon_gputex.clear()
+    icon_atlases.clear()
+    icon_atlas_futures.clear()
+    # Only if any icon was decoded.
+    if (icon_decode := sys.modules.get(__package__ + '.icon_decode', None)) is not None:
+        icon_decode.IconDecoder.shutdown()
+        icon_decode.IconPixelCache.save()
 
 
 
@@ -149,8 +232,11 @@ ${icons}
 """)
 
 
+ICON_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+
 class IconData:
-    def __init__(self, icon_path: Path):
+    def __init__(self, icon_path: Path, date: float | None = None, size: int = 0, mtime_ns: int = 0):
         idname = icon_path.stem
         if idname.startswith('[') and ']' in idname:
             idname = idname[idname.index(']')+1:]
@@ -166,7 +252,9 @@ class IconData:
         self.idname = idname.upper()
         self.name = icon_path.name
         self.ext = icon_path.suffix
-        self.date = creation_date(str(icon_path))
+        self.date = creation_date(str(icon_path)) if date is None else date
+        self.size = size
+        self.mtime_ns = mtime_ns
 
     @property
     def filepath(self) -> str:
@@ -190,6 +278,39 @@ def creation_date(path_to_file):
             return stat.st_mtime
 
 
+def _scan_icons(icons_path: Path) -> dict[str, list[IconData]]:
+    """ Icons per category (subdirectories are categories), in a single os.scandir pass reusing the DirEntry stats. """
+    icons_per_category: dict[str, list[IconData]] = {}
+    pending = [(str(icons_path), 'MAIN')]
+    while pending:
+        dirpath, category_name = pending.pop()
+        with os.scandir(dirpath) as entries:
+            entries = sorted(entries, key=lambda entry: entry.name)
+        _icons = []
+        for entry in entries:
+            if entry.is_dir():
+                pending.append((entry.path, Path(entry.name).stem.upper().replace(' ', '_')))
+            elif entry.name.endswith(ICON_EXTENSIONS):
+                stat = entry.stat()
+                icon = IconData(Path(entry.path), date=stat.st_mtime, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+                icon.name = os.path.relpath(entry.path, icons_path).replace(os.sep, '/')
+                _icons.append(icon)
+        if _icons:
+            icons_per_category.setdefault(category_name, []).extend(_icons)
+    return icons_per_category
+
+
+# Files of the icon database of previous versions, change detection is done by the AutoCode fingerprint.
+LEGACY_ICONS_DATA_FILES = ('icons_data', 'icons_data.db', 'icons_data.dat', 'icons_data.dir', 'icons_data.bak')
+
+
+def _remove_legacy_icons_data(icons_path: Path) -> None:
+    for filename in LEGACY_ICONS_DATA_FILES:
+        try:
+            os.remove(icons_path / filename)
+        except OSError:
+            pass
+
 
 def generate_icons_py(filename: str = 'icons.py'):
     ''' Generates the icons.py file in the root directory of your addon,
@@ -203,57 +324,26 @@ def generate_icons_py(filename: str = 'icons.py'):
     icons_path: Path = GLOBALS.ICONS_PATH
     icons_output_py: Path = GLOBALS.ADDON_SOURCE_PATH / f'{filename}.py'
 
-    # Suppose addon_utils is a direct submodule of the addon module.
-    icons: list[IconData] = []
-    icons_per_category: dict[str, list[IconData]] = {} # defaultdict(list)
-
     print_debug("Searching icons from...", str(icons_path))
     if not os.path.exists(icons_path):
         print_debug("No icons found at path '%s'" % icons_path)
         return
 
-    def _add_icons_from_directory(dirpath: Path, category_name: str = 'MAIN', is_subdir: bool = False):
-        _icons = []
-        for icon_path in dirpath.iterdir():
-            if icon_path.is_file():
-                if icon_path.suffix in {'.png', '.jpg', '.jpeg'}:
-                    icon = IconData(icon_path)
-                    if is_subdir:
-                        icon.name = icon_path.parent.name + '/' + icon.name
-                    _icons.append(icon)
-            elif icon_path.is_dir():
-                new_cat_name: str = icon_path.stem.upper().replace(' ', '_')
-                _add_icons_from_directory(icon_path, category_name=new_cat_name, is_subdir=True)
-        if _icons != []:
-            icons.extend(_icons)
-            icons_per_category[category_name] = _icons
-
-    _add_icons_from_directory(icons_path, category_name='MAIN')
-
-    if not icons:
-        print_debug("No icons found!")
+    icons_per_category = _scan_icons(icons_path)
+    listing = {icon.name: [icon.size, icon.mtime_ns] for icons in icons_per_category.values() for icon in icons}
+
+    # Skip the generation if the icons directory listing didn't change since the last one.
+    fingerprint = compute_fingerprint(__file__, sorted(listing.items()), str(icons_path.relative_to(GLOBALS.ADDON_SOURCE_PATH)))
+    if is_up_to_date(icons_output_py, fingerprint):
         return
 
-    icons_data_file = icons_path / 'icons_data'
-    modified_icons: list[IconData] = []
-
-    with shelve.open(str(icons_data_file)) as icons_db:
-        # Check icons that changed since last generation.
-        for icon in icons:
-            if saved_icon := icons_db.get(icon.idname, None):
-                if icon.date != saved_icon.date:
-                    # Modified icon.
-                    icons_db[icon.idname] = icon
-                    modified_icons.append(icon)
-            else:
-                # New Icon.
-                icons_db[icon.idname] = icon
-                modified_icons.append(icon)
-
-    if not modified_icons:
-        print_debug("No modified icons found!")
+    if not listing:
+        print_debug("No icons found!")
         return
 
+    _remove_legacy_icons_data(icons_path)
+    print_debug(f"{len(listing)} icons found")
+
     # Generate icons.py file.
     icons_py_code = template_icons_py.substitute(
         # get relative package path to ackit module.
@@ -269,5 +359,5 @@ def generate_icons_py(filename: str = 'icons.py'):
             ]
         )
     )
-    with icons_output_py.open('w') as f:
-        f.write(icons_py_code)
+    write_if_changed(icons_output_py, icons_py_code)
+    set_fingerprint(icons_output_py, fingerprint)
@@ -10,6 +10,7 @@ from ..globals import GLOBALS
 from ..ne.btypes.node import Node
 from ..ne.btypes.node_exec import NodeExec
 from ..data.props_typed import WrappedPropertyDescriptor
+from .cache import write_if_changed
 
 
 TEMPLATE_NODE_TYPE = Template("""
@@ -204,17 +205,18 @@ def generate_nodes_py(filename: str = 'nodes'):
 
     # --- Write to file --- 
     try:
-        with open(output_filepath, 'w') as f:
-            f.write("# --- Auto-generated Script by ackit.auto_code.nodes --- \n")
-            f.write("# --- Edits will be overwritten! --- \n\n")
+        header = (
+            "# --- Auto-generated Script by ackit.auto_code.nodes --- \n"
+            "# --- Edits will be overwritten! --- \n\n"
             # Add necessary imports for dataclasses and WrappedPropertyDescriptor
-            f.write("from dataclasses import dataclass\n")
-            f.write("from typing import Any, Set # Add other common types if needed\n")
+            "from dataclasses import dataclass\n"
+            "from typing import Any, Set # Add other common types if needed\n"
             # Assuming WrappedTypedPropertyTypes is accessible, adjust if necessary
-            f.write("from ackit.data.props_typed import WrappedTypedPropertyTypes as WPT, WrappedPropertyDescriptor\n")
-            f.write("from ackit.ne.btypes.node_exec import NodeExec # Base class for generated dataclasses\n\n")
-            f.write(script_content)
-        print(f"Successfully generated {output_filepath}")
+            "from ackit.data.props_typed import WrappedTypedPropertyTypes as WPT, WrappedPropertyDescriptor\n"
+            "from ackit.ne.btypes.node_exec import NodeExec # Base class for generated dataclasses\n\n"
+        )
+        if write_if_changed(output_filepath, header + script_content):
+            print(f"Successfully generated {output_filepath}")
     except IOError as e:
         print(f"Error writing to {output_filepath}: {e}")
     except Exception as e:
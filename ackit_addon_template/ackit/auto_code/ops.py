@@ -1,11 +1,12 @@
 # Operator code generation
 
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional
 
 from ..globals import GLOBALS
 from ..core.btypes import BTypes
 from ..data.props_typed import WrappedPropertyDescriptor
+from .cache import compute_fingerprint, is_up_to_date, set_fingerprint, write_if_changed
 
 def _get_property_type_hint(prop: 'WrappedPropertyDescriptor') -> str:
     """Get the appropriate type hint for a property descriptor"""
@@ -37,14 +38,50 @@ def _format_prop_docstring(name: str, prop: 'WrappedPropertyDescriptor') -> str:
     description = prop.kwargs.get('description', '')
     return f"        - `{name}` ({type_hint}): {description}"
 
-def generate_ops_py(filename: str = 'ops.py'):
-    """Generate an {prefix}_ops.py file with typed operator classes"""
+class _OperatorEntry:
+    """ Data of an operator class needed to write its typed class. """
+    def __init__(self, op_cls) -> None:
+        self.class_name: str = op_cls.__name__  # bl_idname.split('.')[-1].title()
+        self.bl_idname: str = op_cls.bl_idname
+        self.bl_label: str = op_cls.bl_label
+        self.bl_description: str = op_cls.bl_description
+        # Get properties from class
+        self.properties: Dict[str, 'WrappedPropertyDescriptor'] = {
+            name: value for name, value in op_cls.__dict__.items()
+            if isinstance(value, WrappedPropertyDescriptor)
+        }
 
+
+class OpsSnapshot:
+    """ Operators data to render the ops file. Must be taken in the main thread, rendering it can run in any thread. """
+    def __init__(self, filepath: Path, fingerprint: str, operators: List[_OperatorEntry]) -> None:
+        self.filepath = filepath
+        self.fingerprint = fingerprint
+        self.operators = operators
+
+
+def snapshot_ops_py(filename: str = 'ops.py') -> Optional[OpsSnapshot]:
+    """ Collect the operators data to generate the ops file. Returns None if it is up to date. """
     output_path = GLOBALS.ADDON_SOURCE_PATH / f'{filename}.py'
 
     # Get all operator classes
-    operator_classes = BTypes.Operator.get_classes()
-    
+    operators = [_OperatorEntry(op_cls) for op_cls in BTypes.Operator.get_classes()]
+
+    # Skip the generation if no operator (nor its properties) changed since the last one.
+    fingerprint = compute_fingerprint(__file__, [
+        (
+            op.class_name, op.bl_idname, op.bl_label, op.bl_description,
+            [(name, prop.property_type.__name__, prop.kwargs) for name, prop in op.properties.items()]
+        )
+        for op in operators
+    ])
+    if is_up_to_date(output_path, fingerprint):
+        return None
+    return OpsSnapshot(output_path, fingerprint, operators)
+
+
+def render_ops_py(snapshot: OpsSnapshot) -> str:
+    """ Render the ops file source from a snapshot. Pure Python, safe to call from a worker thread. """
     # Template for the output file
     output = [
         "from typing import Any, Tuple, Optional, ClassVar",
@@ -98,15 +135,11 @@ def generate_ops_py(filename: str = 'ops.py'):
         "",
     ]
 
-    for op_cls in operator_classes:
-        # Get properties from class
-        properties: Dict[str, 'WrappedPropertyDescriptor'] = {
-            name: value for name, value in op_cls.__dict__.items() 
-            if isinstance(value, WrappedPropertyDescriptor)
-        }
+    for op_cls in snapshot.operators:
+        properties = op_cls.properties
 
         # Generate class
-        class_name = op_cls.__name__  # bl_idname.split('.')[-1].title()
+        class_name = op_cls.class_name
         
         output.extend([
             "",
@@ -208,6 +241,16 @@ def generate_ops_py(filename: str = 'ops.py'):
             "",
         ])
 
-    # Write to file
-    output_path = Path(output_path)
-    output_path.write_text('\n'.join(output))
+    return '\n'.join(output)
+
+
+def write_ops_py(snapshot: OpsSnapshot) -> None:
+    write_if_changed(snapshot.filepath, render_ops_py(snapshot))
+    set_fingerprint(snapshot.filepath, snapshot.fingerprint)
+
+
+def generate_ops_py(filename: str = 'ops.py'):
+    """Generate an {prefix}_ops.py file with typed operator classes"""
+    snapshot = snapshot_ops_py(filename)
+    if snapshot is not None:
+        write_ops_py(snapshot)
@@ -2,6 +2,7 @@ from string import Template
 from collections import defaultdict
 from pathlib import Path
 import inspect
+import io
 import re
 
 import bpy
@@ -9,6 +10,7 @@ from bpy.types import AnyType, PropertyGroup, BlenderRNA
 from bpy.props import _PropertyDeferred
 
 from ..globals import GLOBALS
+from .cache import compute_fingerprint, get_class_fingerprint, is_up_to_date, set_fingerprint, write_if_changed
 
 
 class RootPropertyGroup:
@@ -93,18 +95,63 @@ def prop_type_to_py_type(prop) -> str:
     return 'None'
 
 
-def generate_types_py(filename: str, filter_module: str | None = None, types_alias: str = GLOBALS.ADDON_MODULE_SHORT) -> None:
-    """Generates the Typing for PropertyGroup types."""
+class _PGEntry:
+    """ Data of a PropertyGroup class needed to write its typing. """
+    def __init__(self, pg, parent_classes: set) -> None:
+        self.cls = pg
+        self.class_name: str = pg.original_idname if hasattr(pg, 'original_idname') else pg.__name__
+        self.has_rna: bool = hasattr(pg, 'bl_rna')
+        self.is_parent: bool = pg in parent_classes
+        self.is_root: bool = hasattr(pg, 'is_root') and pg.is_root
+        self.bpy_type_name: str | None = pg.bpy_type.__name__ if self.is_root else None
+        self.data_path: str | None = pg.data_path if self.is_root else None
+        self.original_idname: str | None = getattr(pg, 'original_idname', None)
+        # (idname, python type) of the RNA properties.
+        self.rna_props: list[tuple[str, str]] = []
+        self.first_prop_idname: str | None = None
+        if self.has_rna:
+            for prop_idname, prop in pg.bl_rna.properties.items():
+                if prop_idname in {'rna_type'}:
+                    continue
+                self.rna_props.append((prop_idname, prop_type_to_py_type(prop)))
+                if self.first_prop_idname is None and prop_idname != 'name':
+                    self.first_prop_idname = prop_idname
+        # Python class to get the methods and properties from.
+        ori_pg = getattr(pg, 'original_cls', None)
+        if ori_pg is None and self.is_parent:
+            ori_pg = pg
+        self.ori_pg = ori_pg
+
+
+class TypesSnapshot:
+    """ Everything needed to render the types file, read from the classes and their RNA.
+        Must be taken in the main thread, rendering it is pure Python and can run in any thread. """
+    def __init__(self, filepath: Path, fingerprint: str, filter_module, types_alias: str) -> None:
+        self.filepath = filepath
+        self.fingerprint = fingerprint
+        self.filter_module = filter_module
+        self.types_alias = types_alias
+        self.pg_classes: set = set()
+        self.pg_class_names: set[str] = set()
+        self.entries: list[_PGEntry] = []
+        self.classes_used_as_collection: list[str] = []
+        self.import_bpy_types: list[str] = []
+        # {bpy type name: [(property idname, python type)]}
+        self.extended_types: dict[str, list[tuple[str, str]]] = {}
+
+
+def snapshot_types_py(filename: str, filter_module: str | None = None, types_alias: str = GLOBALS.ADDON_MODULE_SHORT) -> TypesSnapshot | None:
+    """ Collect the PropertyGroup data to generate the types file. Returns None if there's nothing to generate or it is up to date. """
     # Get PropertyGroup classes in the proper order.
     from ..core.btypes import BTypes
-    pg_classes = BTypes.PropertyGroup.get_classes()
+    pg_classes = list(BTypes.PropertyGroup.get_classes())
     prefs_classes = BTypes.AddonPreferences.get_classes()
     if prefs_classes != []:
         pg_classes.append(prefs_classes[0])
 
     if pg_classes == []:
         # SAD. No PropertyGroup classes to process... :-(
-        return
+        return None
 
     parent_classes = set()
     for pg_cls in pg_classes:
@@ -119,14 +166,36 @@ def generate_types_py(filename: str, filter_module: str | None = None, types_ali
             parent_classes.add(parent_cls)
 
     if parent_classes != set():
-        pg_classes.extend(list(parent_classes))
+        # Sorted so the generated file doesn't change between sessions.
+        pg_classes.extend(sorted(parent_classes, key=lambda cls: (cls.__module__, cls.__qualname__)))
+
+    # Skip the generation if no PropertyGroup (nor property registered to bpy.types) changed since the last one.
+    from ..data.helpers import to_register_properties
+    types_filepath = GLOBALS.ADDON_SOURCE_PATH / f"{filename}.py"
+    fingerprint = compute_fingerprint(
+        __file__,
+        [get_class_fingerprint(cls) for cls in pg_classes],
+        {
+            bpy_type.__name__: {
+                idname: (prop_wrapper.property_type.__name__, prop_wrapper.kwargs)
+                for idname, prop_wrapper in props_wrappers.items()
+            }
+            for bpy_type, props_wrappers in to_register_properties.items()
+        },
+        filter_module,
+        types_alias,
+        GLOBALS.ADDON_MODULE,
+        GLOBALS.BLENDER_VERSION,
+    )
+    if is_up_to_date(types_filepath, fingerprint):
+        return None
 
     from ..core.reg_utils import get_ordered_pg_classes_to_register
     pg_sorted_classes: list[PropertyGroup] = get_ordered_pg_classes_to_register(pg_classes)
 
-    pg_classes: set[PropertyGroup] = set(pg_classes)
-    # pg_names: set[str] = {pg.__name__ for pg in pg_sorted_classes}
-    pg_class_names: set[str] = {pg.__name__ for pg in pg_sorted_classes}
+    snapshot = TypesSnapshot(types_filepath, fingerprint, filter_module, types_alias)
+    snapshot.pg_classes = set(pg_classes)
+    snapshot.pg_class_names = {pg.__name__ for pg in pg_sorted_classes}
 
     if filter_module is not None:
         if callable(filter_module):
@@ -139,7 +208,6 @@ def generate_types_py(filename: str, filter_module: str | None = None, types_ali
             ]
 
     # Search for PropertyGroup used as CollectionProperty inside other PropertyGroup class.
-    classes_used_as_collection = []
     for pg in pg_sorted_classes:
         if not hasattr(pg, 'bl_rna'):
             continue
@@ -148,16 +216,35 @@ def generate_types_py(filename: str, filter_module: str | None = None, types_ali
                 continue
             if 'Collection' not in type(prop).__name__:
                 continue
-            classes_used_as_collection.append(prop.fixed_type.original_idname)
-
-
-    # WRITE TO FILE. ---------------------------
-    types_filepath = GLOBALS.ADDON_SOURCE_PATH / f"{filename}.py"
-    addon_module_name = GLOBALS.ADDON_MODULE
-
-    with types_filepath.open('w') as f:
+            snapshot.classes_used_as_collection.append(prop.fixed_type.original_idname)
+
+    snapshot.entries = [_PGEntry(pg, parent_classes) for pg in pg_sorted_classes]
+
+    if filter_module is None:
+        import_bpy_types = {'Context'}
+        for bpy_type, props_wrappers in to_register_properties.items():
+            import_bpy_types.add(bpy_type.__name__)
+            extended_props = snapshot.extended_types[bpy_type.__name__] = []
+            for prop_idname, prop_wrapper in props_wrappers.items():
+                # Calling the bpy.props function gives the deferred property, without registering anything.
+                prop_type = prop_type_to_py_type(prop_wrapper.property_type(**prop_wrapper.kwargs))
+                extended_props.append((prop_idname, prop_type))
+                if hasattr(bpy.types, prop_type):
+                    import_bpy_types.add(prop_type)
+        snapshot.import_bpy_types = sorted(import_bpy_types)
+
+    return snapshot
+
+
+def render_types_py(snapshot: TypesSnapshot) -> str:
+    """ Render the types file source from a snapshot. Pure Python, safe to call from a worker thread. """
+    filter_module = snapshot.filter_module
+    types_alias = snapshot.types_alias
+    pg_classes = snapshot.pg_classes
+    pg_class_names = snapshot.pg_class_names
+
+    with io.StringIO() as f:
         f.write('""" File generated automatically by ackit (Addon Creator Kit). """\n')
-        # f.write('import bpy\n')#from {addon_module_name}.addon_utils.prop import PGType\n\n')
         f.write(f'import numpy\n')
         f.write(f'import typing\n')
         f.write(f'from typing import List, Set, Tuple, Dict, Any\n\n')
@@ -167,60 +254,39 @@ def generate_types_py(filename: str, filter_module: str | None = None, types_ali
             f.write("import bl_ext\n")
 
         if filter_module is None:
-            from ..data.helpers import to_register_properties
-            import_bpy_types = {'Context'}
-            for bpy_type, props_wrappers in to_register_properties.items():
-                import_bpy_types.add(bpy_type.__name__)
-                for prop_wrapper in props_wrappers:
-                    if isinstance(prop_wrapper.property, _PropertyDeferred):
-                        prop_type = prop_type_to_py_type(prop_wrapper.property)
-                        # print(prop_type, prop_type.__name__)
-                        if hasattr(bpy.types, prop_type):
-                            import_bpy_types.add(prop_type)
-
-            f.write(f'from bpy.types import {", ".join(import_bpy_types)}\n\n')
-
-        if len(classes_used_as_collection) != 0:
+            f.write(f'from bpy.types import {", ".join(snapshot.import_bpy_types)}\n\n')
+
+        if len(snapshot.classes_used_as_collection) != 0:
             f.write('\n""" Util classes to have CollectionProperty types typing: """')
             # Write the CollectionProperty classes we found with a nice template.
-            for coll_cls_name in classes_used_as_collection:
+            for coll_cls_name in snapshot.classes_used_as_collection:
                 f.write(
                     coll_class_wrapper_template.substitute(
                         class_name=coll_cls_name,
                     )
                 )
 
-        # Just to store some PropertyGroup to use for the example code.
-        example_pg_prop = None
-
         # For the Data Enumerator utility.
-        root_pg_classes: list[RootPropertyGroup] = []
+        root_entries: list[_PGEntry] = []
 
         # Write to file the property groups.
         f.write('\n""" Addon-Defined PropertyGroup: """')
-        for pg in pg_sorted_classes:
-            # print(pg, pg.bl_rna.properties)
-            # is_root = pg.is_root
-            is_root: bool = hasattr(pg, 'is_root') and pg.is_root
-
-            if hasattr(pg, 'bl_rna'):
+        for entry in snapshot.entries:
+            if entry.has_rna:
                 f.write(
                     pg_class_wrapper_template.substitute(
-                        class_name=pg.original_idname if hasattr(pg, 'original_idname') else pg.__name__,
-                        comment=f'\n\t# Root PG, attached to bpy.types.{pg.bpy_type.__name__}' if is_root else '',
+                        class_name=entry.class_name,
+                        comment=f'\n\t# Root PG, attached to bpy.types.{entry.bpy_type_name}' if entry.is_root else '',
                         property_defs='\n'.join([
-                            f'\t{prop_idname}: {prop_type_to_py_type(prop)}'
-                                for prop_idname, prop in pg.bl_rna.properties.items() # pg.__annotations__.items()
-                                if prop_idname not in {'rna_type'}
-                                #if isinstance(prop, _PropertyDeferred) and prop_idname not in {'rna_type'}
+                            f'\t{prop_idname}: {prop_type}' for prop_idname, prop_type in entry.rna_props
                         ]),
 
                     )
                 )
-            elif pg in parent_classes:
+            elif entry.is_parent:
                 f.write(
                     pg_class_wrapper_template.substitute(
-                        class_name=pg.__name__,
+                        class_name=entry.cls.__name__,
                         comment='',
                         property_defs=''
 
@@ -229,9 +295,7 @@ def generate_types_py(filename: str, filter_module: str | None = None, types_ali
             else:
                 continue
 
-            ori_pg = getattr(pg, 'original_cls', None)
-            if ori_pg is None and pg in parent_classes:
-                ori_pg = pg
+            ori_pg = entry.ori_pg
             if ori_pg is not None:
                 addon_type_pattern = f'{GLOBALS.ADDON_MODULE}\.[\w._]+'
 
@@ -239,9 +303,7 @@ def generate_types_py(filename: str, filter_module: str | None = None, types_ali
                 for method_name, method in ori_pg.__dict__.items():
                     if (inspect.isfunction(method) or inspect.ismethod(method)) and not method_name.startswith("__"):
                         method_signature = str(inspect.signature(method))
-                        # print(">>>>>>>>>>>>>>>>>>>", method_signature)
                         matches: list[str] = re.findall(addon_type_pattern, method_signature)
-                        # print("HELLO", ret_signature, matches)
                         for match in matches:
                             pg_cls_name = match.split('.')[-1]
                             if pg_cls_name in pg_class_names:
@@ -249,17 +311,6 @@ def generate_types_py(filename: str, filter_module: str | None = None, types_ali
 
                         f.write(f"\tdef {method_name}{method_signature}:\n\t\tpass\n\n")
 
-                        # if '->' in method_signature:
-                        #     params, ret = method_signature.split(' -> ')
-                        #     if ret.startswith(GLOBALS.ADDON_MODULE):
-                        #         _type = ret.split('.')[-1]
-                        #         if _type in pg_class_names:
-                        #             ret = _type
-                        # else:
-                        #     params = method_signature
-                        #     ret = 'None'
-                        # f.write(f"\tdef {method_name}{params} -> {ret}:\n\t\tpass\n\n")
-
                 def _fix_ret_annot(f_signature, ret_annot) -> str:
                     if ret_annot in pg_classes:
                         pg_cls_name = ret_annot.__name__
@@ -267,7 +318,6 @@ def generate_types_py(filename: str, filter_module: str | None = None, types_ali
                     elif f'{GLOBALS.ADDON_MODULE}.' in str(ret_annot): # isinstance(ret_annot, UnionType) and
                         ret_signature = str(ret_annot)
                         matches: list[str] = re.findall(addon_type_pattern, ret_signature)
-                        # print("HELLO", ret_signature, matches)
                         for match in matches:
                             pg_cls_name = match.split('.')[-1]
                             ret_signature = ret_signature.replace(match, pg_cls_name)
@@ -281,7 +331,6 @@ def generate_types_py(filename: str, filter_module: str | None = None, types_ali
                             fget_signature = inspect.signature(prop.fget)
                             if ret_annot := fget_signature.return_annotation:
                                 fget_signature = _fix_ret_annot(fget_signature, ret_annot)
-                                # print("ret annot:", ret_annot)
                             f.write(f"\t@property\n")
                             f.write(f"\tdef {prop_name}{fget_signature}: pass\n\n")
                         if prop.fset:
@@ -293,71 +342,59 @@ def generate_types_py(filename: str, filter_module: str | None = None, types_ali
 
             # If it's a root PropertyGroup, we need to add a get_path() class method
             # to it to get the corresponding data with typing!.
-            if is_root:
-                pg: RootPropertyGroup
-                bpy_type_context, pg_data_idname = pg.data_path.split('.')
+            if entry.is_root:
+                bpy_type_context, pg_data_idname = entry.data_path.split('.')
                 f.write(
                     pg_class_get_data_template.substitute(
-                        class_name=pg.original_idname if hasattr(pg, 'original_idname') else pg.__name__,
+                        class_name=entry.class_name,
                         pg_data_idname=pg_data_idname,
-                        bpy_type=pg.bpy_type.__name__,
+                        bpy_type=entry.bpy_type_name,
                         bpy_type_context=bpy_type_context
                     )
                 )
 
-                root_pg_classes.append(pg)
-
-        # Write the extended bpy type classes.
-        # pack root PG types by its root bpy_type.
-        # pg_types_per_bpy_type: dict[AnyType, list[RootPropertyGroup]] = defaultdict(list)
-        # for root_pg_cls in root_pg_classes:
-        #     pg_types_per_bpy_type[root_pg_cls.bpy_type].append(root_pg_cls)
-        # for bpy_type, pg_types in pg_types_per_bpy_type.items():
-        #     f.write(f'\n\nclass {bpy_type.__name__}:')
-        #     for pg_type in pg_types:
-        #         f.write(f'\n\t{pg_type.prop_name}: {pg_type.original_idname}')
+                root_entries.append(entry)
 
         if filter_module is None:
             f.write("\n\n# ++++++++++++++++++++++++++++++++++++++++++++++++++\n")
             f.write('""" Extended bpy.types classes by the addon: """')
-            for bpy_type, props_wrappers in to_register_properties.items():
-                f.write(f'\n\nclass Extended{bpy_type.__name__}({bpy_type.__name__}):')
-                for prop_wrapper in props_wrappers:
-                    # print(prop_wrapper.property, prop_type_to_py_type(prop_wrapper.property))
-                    f.write(f'\n\t{prop_wrapper.prop_name}: {prop_type_to_py_type(prop_wrapper.property)}')
+            for bpy_type_name, extended_props in snapshot.extended_types.items():
+                f.write(f'\n\nclass Extended{bpy_type_name}({bpy_type_name}):')
+                for prop_idname, prop_type in extended_props:
+                    f.write(f'\n\t{prop_idname}: {prop_type}')
 
-            if to_register_properties:
+            if snapshot.extended_types:
                 f.write('\n\nclass ExtendedTypes:')
-                for bpy_type in to_register_properties.keys():
-                    f.write(f'\n\t{bpy_type.__name__} = Extended{bpy_type.__name__}')
+                for bpy_type_name in snapshot.extended_types.keys():
+                    f.write(f'\n\t{bpy_type_name} = Extended{bpy_type_name}')
 
         # Write the Data enumerator.
         f.write("\n\n# ++++++++++++++++++++++++++++++++++++++++++++++++++\n")
         f.write('""" Root PropertyGroups (linked directly to any bpy.types): """\n')
         f.write('class RootPG:')
         f.write(prefs_getter_template.substitute(cls_name=f"{GLOBALS.ADDON_MODULE_UPPER}_AddonPreferences", package_name=GLOBALS.ADDON_MODULE))
-        if len(root_pg_classes) == 0:
-            pass
-        else:
-            skip_root_properties = {f'{GLOBALS.ADDON_MODULE_SHORT}_ui_panel_toggles'}
-            for root_pg_cls in root_pg_classes:
-                bpy_type_context, pg_data_idname = root_pg_cls.data_path.split('.')
-                if pg_data_idname in skip_root_properties:
-                    continue
-                if bpy_type_context == 'scene':
-                    bpy_type_context = 'SCN'
-                elif bpy_type_context == 'window_manager':
-                    bpy_type_context = 'WM'
 
-                if example_pg_prop is None:
-                    if not hasattr(pg, 'bl_rna'):
-                        continue
-                    for prop_idname in pg.bl_rna.properties.keys():
-                        if prop_idname not in {'rna_type', 'name'}:
-                            example_pg_prop = (pg, bpy_type_context, prop_idname)
-                            break
+        # Just to store some PropertyGroup to use for the example code.
+        example_pg_prop = None
+        # NOTE: the example uses the last PropertyGroup class.
+        last_entry = snapshot.entries[-1] if snapshot.entries else None
+        skip_root_properties = {f'{GLOBALS.ADDON_MODULE_SHORT}_ui_panel_toggles'}
+        for root_entry in root_entries:
+            bpy_type_context, pg_data_idname = root_entry.data_path.split('.')
+            if pg_data_idname in skip_root_properties:
+                continue
+            if bpy_type_context == 'scene':
+                bpy_type_context = 'SCN'
+            elif bpy_type_context == 'window_manager':
+                bpy_type_context = 'WM'
+
+            if example_pg_prop is None:
+                if last_entry is None or not last_entry.has_rna:
+                    continue
+                if last_entry.first_prop_idname is not None:
+                    example_pg_prop = (last_entry, bpy_type_context, last_entry.first_prop_idname)
 
-                f.write(f'\n\t{bpy_type_context} = {root_pg_cls.original_idname}.get_data')
+            f.write(f'\n\t{bpy_type_context} = {root_entry.original_idname}.get_data')
 
         f.write(f'\n\n# Alias:\n{types_alias}_types = RootPG')
 
@@ -365,13 +402,27 @@ def generate_types_py(filename: str, filter_module: str | None = None, types_ali
         if filter_module is None:
             f.write("\n\n# ++++++++++++++++++++++++++++++++++++++++++++++++++\n")
             if example_pg_prop is not None:
-                pg, bpy_type, prop_idname = example_pg_prop
+                _entry, bpy_type, prop_idname = example_pg_prop
                 f.write(
                     example_typing_template.substitute(
                         addon_module=GLOBALS.ADDON_MODULE,
                         alias_name=types_alias,
-                        pg_name=bpy_type, # pg.original_idname,
+                        pg_name=bpy_type,
                         pg_name_lower=bpy_type.lower(),
                         prop_name=prop_idname
                     )
                 )
+
+        return f.getvalue()
+
+
+def write_types_py(snapshot: TypesSnapshot) -> None:
+    write_if_changed(snapshot.filepath, render_types_py(snapshot))
+    set_fingerprint(snapshot.filepath, snapshot.fingerprint)
+
+
+def generate_types_py(filename: str, filter_module: str | None = None, types_alias: str = GLOBALS.ADDON_MODULE_SHORT) -> None:
+    """Generates the Typing for PropertyGroup types."""
+    snapshot = snapshot_types_py(filename, filter_module, types_alias)
+    if snapshot is not None:
+        write_types_py(snapshot)
@@ -1,13 +1,16 @@
 import sys
-from typing import Callable, Set
+import importlib
+from contextlib import nullcontext
+from typing import Callable, ContextManager, Optional, Set
 
 from bpy.utils import register_class, unregister_class
 
 from ..globals import GLOBALS
-from .reg_utils import get_all_submodules
-from .reg_utils import get_ordered_classes_to_register
+from .reg_utils import get_all_submodules, get_loaded_submodules
+from .reg_utils import get_register_deps_dict, toposort
+from .manifest import StartupManifest
 from ..utils.callback import CallbackDict
-from ..debug import print_debug
+from ..debug.output import print_debug
 
 
 __all__ = [
@@ -15,9 +18,36 @@ __all__ = [
 ]
 
 
+# ackit package, e.g. 'my_addon.ackit'.
+ACKIT_PACKAGE = __package__.rpartition('.')[0]
+
+# ackit modules that are always part of the addon modules, whatever ACK namespaces the addon uses.
+ACKIT_CORE_MODULES = (
+    '.globals',
+    '.core.base_type',
+    '.core.btypes',
+    '.app.handlers',
+    '.app.timer',
+    '.app.keymaps',
+)
+
 callback_ids = ['init', 'late_init', 'register', 'late_register', 'unregister', 'late_unregister']
 
 
+def _get_startup_timings() -> Optional[type]:
+    """ ``StartupTimings`` if it records: in development, or once enabled (setting ``StartupTimings.enabled`` imports it). """
+    timings = sys.modules.get(f'{ACKIT_PACKAGE}.debug.timings', None)
+    if timings is None:
+        if not GLOBALS.check_in_development():
+            return None
+        timings = importlib.import_module('.debug.timings', ACKIT_PACKAGE)
+    return timings.StartupTimings if timings.StartupTimings.is_enabled() else None
+
+
+def _measure(category: str, name: str) -> ContextManager[None]:
+    return nullcontext() if (timings := _get_startup_timings()) is None else timings.measure(category, name)
+
+
 class AddonLoader:
     """# AddonLoader
     Utility class for automatically fetching and registering ACKit classes.
@@ -35,37 +65,103 @@ class AddonLoader:
     
     - In the modules of your addon you can add ``register()``, ``late_register()``, ``unregister()`` and ``late_unregister()`` methods
     that will be automatically called by the ``AddonLoader`` when addon registering and unregistering events occur.
+
+    ## MODULE DISCOVERY:
+    - Every module of the addon is imported, except the ackit package itself.
+    - ackit subsystems are imported on demand (``ACK.NE``, ``ACK.UI``...), only the ackit modules
+    that the addon modules imported (plus the core ones) take part in the registration.
+
+    ## STARTUP MANIFEST:
+    - The module list and the class registration order are cached in a manifest file (``GLOBALS.USER_CONFIG_DIR``).
+    - While no source file changes, the next starts skip the module discovery and the dependency resolution.
+    - Use ``init_modules(use_manifest=False)`` to always run the full discovery.
+
+    ## HOT RELOAD:
+    - With ``init_modules(use_hot_reload=True)`` and in development, the addon source files are watched.
+    - Changed modules (and the modules importing from them) are reloaded, and only their changed classes are registered again.
+
+    ## LAZY SUBSYSTEMS:
+    - ackit modules imported once registered (first use of ``ACK.App.Jobs``...) get their ``register`` and ``late_register`` callbacks called then.
+
+    ## DEFERRED AUTOCODE:
+    - With ``init_modules(auto_code={...}, auto_code_deferred=True)``, the AutoCode inputs are snapshotted in the main thread.
+    - ``ops.py``, ``types.py`` and ``icons.py`` are rendered and written in a worker thread once registered, completion is reported from a timer.
+
+    ## STARTUP TIMINGS:
+    - In development, phases, module imports, callbacks, AutoCode and ``register_class`` calls are timed (``StartupTimings``).
+    - After registering, a JSON report is written to ``GLOBALS.USER_CONFIG_DIR`` and slow entries are warned about.
+    - Tweak ``StartupTimings.slow_threshold`` and ``StartupTimings.budget`` (seconds) before calling ``init_modules``.
     """
 
     modules = None
     registered = False
     use_autoload = False
+    use_hot_reload = False
+    auto_code_deferred = False
     ordered_classes = None  # If using AutoLoad.
     module_callbacks = CallbackDict()
 
     @classmethod
-    def init_modules(cls, use_autoload: bool = False, auto_code: Set[Callable[[], None]] = set()):
+    def init_modules(cls, use_autoload: bool = False, auto_code: Set[Callable[[], None]] = set(), use_manifest: bool = True, use_hot_reload: bool = False, auto_code_deferred: bool = False):
         print_debug("Initializing...")
         cls.use_autoload = use_autoload
+        cls.use_hot_reload = use_hot_reload
+        cls.auto_code_deferred = auto_code_deferred and bool(auto_code)
 
         if cls.modules is not None:
             print_debug("Cleaning old modules!")
             cls.cleanse_modules()
 
-        cls.modules = get_all_submodules(GLOBALS.ADDON_SOURCE_PATH)
-        cls.fetch_module_callbacks()
-
-        if cls.use_autoload:
-            cls.ordered_classes = get_ordered_classes_to_register(cls.modules)
-
-        cls.registered = False
-
-        cls.module_callbacks.call_callbacks('init')
-        cls.module_callbacks.call_callbacks('late_init')
+        if (timings := _get_startup_timings()) is not None:
+            timings.clear()
+        with _measure('phase', 'init_modules'):
+            with _measure('phase', 'discover_modules'):
+                manifest = StartupManifest.load() if use_manifest else None
+                if manifest is not None:
+                    print_debug("Using startup manifest")
+                    cls.modules = manifest.import_modules()
+                else:
+                    cls.modules = cls.discover_modules()
+                cls.fetch_module_callbacks()
+
+            with _measure('phase', 'resolve_classes'):
+                if cls.use_autoload:
+                    cls.ordered_classes = manifest.get_ordered_classes() if manifest is not None else None
+                    if cls.ordered_classes is None:
+                        deps_dict = get_register_deps_dict(cls.modules)
+                        cls.ordered_classes = toposort(deps_dict)
+                        if use_manifest:
+                            StartupManifest.build(cls.modules, cls.ordered_classes, deps_dict).write()
+                elif manifest is None and use_manifest:
+                    StartupManifest.build(cls.modules).write()
+
+            cls.registered = False
+
+            cls.call_module_callbacks('init')
+            cls.call_module_callbacks('late_init')
+
+            if auto_code:
+                with _measure('phase', 'auto_code'):
+                    if auto_code_deferred:
+                        from ..auto_code.deferred import DeferredAutoCode
+                        DeferredAutoCode.prepare(auto_code)
+                    else:
+                        for auto_code_func in auto_code:
+                            with _measure('auto_code', auto_code_func.__qualname__):
+                                auto_code_func()
 
-        if auto_code:
-            for auto_code_func in auto_code:
-                auto_code_func()
+    @classmethod
+    def discover_modules(cls) -> list:
+        for module_name in ACKIT_CORE_MODULES:
+            importlib.import_module(module_name, ACKIT_PACKAGE)
+
+        ackit_dirname = ACKIT_PACKAGE[len(GLOBALS.ADDON_MODULE) + 1:]
+        modules = get_all_submodules(GLOBALS.ADDON_SOURCE_PATH, exclude={ackit_dirname})
+        # Importing the addon modules is what pulls the ackit subsystems in use.
+        modules.extend(get_loaded_submodules(ACKIT_PACKAGE))
+        # Keep the callbacks call order by module name.
+        modules.sort(key=lambda module: module.__name__)
+        return modules
 
     @classmethod
     def register_modules(cls):
@@ -78,15 +174,30 @@ class AddonLoader:
             print_debug("Trying to register but it is already registered!")
             return
 
-        if cls.use_autoload:
-            for cls in cls.ordered_classes:
-                if not hasattr(cls, 'bl_rna'):
-                    register_class(cls)
+        with _measure('phase', 'register_modules'):
+            if cls.use_autoload:
+                with _measure('phase', 'register_classes'):
+                    for _cls in cls.ordered_classes:
+                        if not hasattr(_cls, 'bl_rna'):
+                            with _measure('register_class', _cls.__name__):
+                                register_class(_cls)
 
-        cls.module_callbacks.call_callbacks('register')
-        cls.module_callbacks.call_callbacks('late_register')
+            cls.call_module_callbacks('register')
+            cls.call_module_callbacks('late_register')
 
         cls.registered = True
+        # ackit modules imported by the register callbacks.
+        cls.register_loaded_modules()
+        if (timings := _get_startup_timings()) is not None:
+            timings.report()
+
+        if cls.auto_code_deferred:
+            from ..auto_code.deferred import DeferredAutoCode
+            DeferredAutoCode.start()
+
+        if cls.use_hot_reload and GLOBALS.check_in_development():
+            from .hot_reload import HotReload
+            HotReload.start()
 
     @classmethod
     def unregister_modules(cls):
@@ -96,11 +207,19 @@ class AddonLoader:
             print_debug("Trying to unregister but it is not registered!")
             return
 
+        if cls.use_hot_reload and (hot_reload := sys.modules.get(f'{__package__}.hot_reload', None)) is not None:
+            hot_reload.HotReload.stop()
+        if cls.auto_code_deferred:
+            from ..auto_code.deferred import DeferredAutoCode
+            DeferredAutoCode.stop()
+
         if cls.use_autoload:
-            for cls in reversed(cls.ordered_classes):
-                if hasattr(cls, 'bl_rna'):
-                    unregister_class(cls)
+            for _cls in reversed(cls.ordered_classes):
+                if hasattr(_cls, 'bl_rna'):
+                    unregister_class(_cls)
 
+        # ackit subsystems imported since init (first use of 'ACK.App.Jobs'...) have to shut down too.
+        cls.collect_loaded_modules()
         cls.module_callbacks.call_callbacks('unregister')
         cls.module_callbacks.call_callbacks('late_unregister')
 
@@ -113,8 +232,41 @@ class AddonLoader:
                 if hasattr(module, callback_id):
                     cls.module_callbacks.add_callback(callback_id, getattr(module, callback_id))
 
+    @classmethod
+    def collect_loaded_modules(cls) -> list:
+        """ Add the ackit modules imported after init (lazily, see '_LazyAttr') to the addon modules, with their callbacks. """
+        known = {module.__name__ for module in cls.modules}
+        new_modules = [module for module in get_loaded_submodules(ACKIT_PACKAGE) if module.__name__ not in known]
+        if new_modules:
+            cls.modules = sorted([*cls.modules, *new_modules], key=lambda module: module.__name__)
+            # Keep the callbacks call order by module name.
+            cls.module_callbacks.clear_callbacks()
+            cls.fetch_module_callbacks()
+        return new_modules
+
+    @classmethod
+    def register_loaded_modules(cls) -> None:
+        """ Once registered, call the ``register`` and ``late_register`` callbacks of the ackit modules imported since
+            (lazily, see '_LazyAttr'), as the addon registration didn't. """
+        if not cls.registered:
+            return
+        new_modules = cls.collect_loaded_modules()
+        for callback_id in ('register', 'late_register'):
+            for module in new_modules:
+                if (callback := getattr(module, callback_id, None)) is not None:
+                    callback()
+
+    @classmethod
+    def call_module_callbacks(cls, callback_id: str):
+        """ Call the module callbacks of the given type, timing each one of them. """
+        with _measure('phase', callback_id):
+            for callback in cls.module_callbacks.callbacks[callback_id].callbacks:
+                with _measure('callback', f'{callback.__module__}.{callback.__name__}'):
+                    callback()
+
     @classmethod
     def cleanse_modules(cls):
+        cls.collect_loaded_modules()
         cls.module_callbacks.clear_callbacks()
 
         # Based on https://devtalk.blender.org/t/plugin-hot-reload-by-cleaning-sys-modules/20040
@@ -1,10 +1,11 @@
 import re
-from typing import Type, List
+from functools import lru_cache
+from typing import Iterable, List, Tuple, Type
 
 import bpy
 
 from ..globals import GLOBALS
-from ..debug.output import print_debug
+from ..debug.output import print_debug_lazy
 from .reg_utils import get_subclasses_recursive
 from .btypes import BTypes
 
@@ -31,6 +32,15 @@ type_key_per_bpy_type = {
 
 NODE_EDITOR_TYPES = {}
 
+# Words of a class name, used to build idnames, labels and class names.
+_NAME_WORD_PATTERN = re.compile(r'[A-Z]?[a-z]+|[A-Z]+|\d+')
+
+
+@lru_cache(maxsize=None)
+def get_name_keywords(name: str) -> Tuple[str, ...]:
+    """ Split a class name into words, e.g. 'MyCustom_Node2' -> ('My', 'Custom', 'Node', '2'). """
+    return tuple(word for part in name.split('_') for word in _NAME_WORD_PATTERN.findall(part) if word)
+
 
 class BaseType(object):
     bl_idname: str
@@ -66,8 +76,7 @@ class BaseType(object):
 
         # Identify the words at the original class name,
         # useful to create unique identifiers in the correct naming convention.
-        pattern = r'[A-Z]?[a-z]+|[A-Z]+|\d+'
-        keywords = [word for part in cls.__name__.split('_') for word in re.findall(pattern, part) if word]
+        keywords = get_name_keywords(cls.__name__)
         idname: str = '_'.join([word.lower() for word in keywords])
 
         if bpy_type == bpy.types.Operator:
@@ -97,8 +106,7 @@ class BaseType(object):
             new_cls_name = f'{GLOBALS.ADDON_MODULE_UPPER}_AddonPreferences'
         elif type_key is not None:
             # Identify the words in the class name for label generation
-            pattern = r'[A-Z]?[a-z]+|[A-Z]+|\d+'
-            keywords = [word for part in original_name.split('_') for word in re.findall(pattern, part) if word] # Use original name for label generation
+            keywords = get_name_keywords(original_name) # Use original name for label generation
             
             # Set bl_label if not already set
             if not hasattr(cls, 'bl_label') or not cls.bl_label:
@@ -135,7 +143,7 @@ class BaseType(object):
             if hasattr(value, 'create_property'):
                 value.create_property(name, cls)
 
-        print_debug(f"--> Tag-Register class '{original_name}' (renamed to '{cls.__name__}') of type '{bpy_type.__name__}' --> Package: {cls.__module__}'")
+        print_debug_lazy("--> Tag-Register class '%s' (renamed to '%s') of type '%s' --> Package: %s'", original_name, cls.__name__, bpy_type.__name__, cls.__module__)
 
         # Add to BTypes registry
         btype: BTypes = getattr(BTypes, bpy_type.__name__)
@@ -148,28 +156,48 @@ class BaseType(object):
         return cls
 
 
+def _build_node_tree_trie() -> dict:
+    """ Trie of the package parts of the NodeTree modules. The NodeTree classes of a package are stored at its node, under the key None. """
+    trie = {}
+    for node_tree_type in NODE_EDITOR_TYPES.keys():
+        node = trie
+        for part in node_tree_type.__module__.split('.')[:-1]:
+            node = node.setdefault(part, {})
+        node.setdefault(None, []).append(node_tree_type)
+    return trie
+
+
+def link_node_tree_types(node_classes: Iterable[Type]) -> None:
+    """ Link each node class to the NodeTree classes of the deepest package containing the node module. """
+    trie = _build_node_tree_trie()
+    for node_class in node_classes:
+        node = trie
+        node_tree_types = node.get(None, None)
+        for part in node_class.__module__.split('.'):
+            node = node.get(part, None)
+            if node is None:
+                break
+            node_tree_types = node.get(None, node_tree_types)
+        if not node_tree_types:
+            continue
+        for node_tree_type in node_tree_types:
+            NODE_EDITOR_TYPES[node_tree_type].add(node_class)
+        node_class._node_tree_type = node_tree_types[-1]
+
+
 # ----------------------------------------------------------------
 
 def init():
     for subcls in BaseType.__subclasses_recursive__():
         if 'btypes' in subcls.__module__:
-           # SKIP: IF THE SUBCLASS IS INSIDE THE some of the ackit module 'btypes' submodules where base types are at.
-           print(f"INFO! SKIP: {subcls.__name__} - {subcls.__module__}")
-           continue
-        # print(f"INFO! tag register: {subcls.__name__} - {subcls.__module__}")
+            # SKIP: IF THE SUBCLASS IS INSIDE THE some of the ackit module 'btypes' submodules where base types are at.
+            continue
         subcls.tag_register()
 
     # Add _node_tree_type attribute to the node classes.
     # It should be done after tag_Register all the classes as the order of registering (first NodeTree classes, then Node classes) is not guaranteed.
     # We could also do this in the BTypes area, but here it's more straightforward.
-    for node_class in BTypes.Node.get_classes():
-        for node_tree_type in NODE_EDITOR_TYPES.keys():
-            print(f"INFO! {node_class.__name__} - {node_class.__module__} - {node_tree_type.__name__} - {node_tree_type.__module__}")
-            if node_class.__module__.startswith('.'.join(node_tree_type.__module__.split('.')[:-1])):
-                print("INFO! ADDED")
-                NODE_EDITOR_TYPES[node_tree_type].add(node_class)
-                node_class._node_tree_type = node_tree_type
-
-    print("****************************** NODE_EDITOR_TYPES ******************************")
-    print(NODE_EDITOR_TYPES)
-    print("****************************** NODE_EDITOR_TYPES ******************************")
+    link_node_tree_types(BTypes.Node.get_classes())
+
+    for node_tree_type, node_classes in NODE_EDITOR_TYPES.items():
+        print_debug_lazy("NodeTree '%s': %d node classes", node_tree_type.__name__, len(node_classes))
@@ -7,7 +7,8 @@ from typing import Dict, List, Type, Callable
 from collections import defaultdict
 from dataclasses import dataclass
 
-from ..debug.output import print_debug
+from ..debug.output import print_debug, print_debug_lazy
+from ..debug.timings import StartupTimings
 from .reg_utils import get_ordered_pg_classes_to_register
 
 __all__ = [
@@ -49,30 +50,32 @@ class BTypes(Enum):
         classes_per_type[self] = filter(self.get_classes())
 
     def add_class(self, cls) -> None:
-        print_debug(f"New {self.name} class : {cls.__name__}")
+        print_debug_lazy("New %s class : %s", self.name, cls.__name__)
         classes_per_type[self].append(cls)
 
     def register_classes(self) -> None:
-        print_debug(f"BTypes.register_classes() <--- {self.name}")
+        print_debug_lazy("BTypes.register_classes() <--- %s", self.name)
         if reg_factory := register_factory.get(self, None):
-            print_debug(f"Register {self.name} classes")
-            reg_factory.register()
+            print_debug_lazy("Register %s classes", self.name)
+            with StartupTimings.measure('register_class', f'<{self.name} classes factory>'):
+                reg_factory.register()
         else:
             for cls in classes_per_type[self]:
                 if "bl_rna" in cls.__dict__:
                     continue
-                print_debug(f"Register {self.name} class: {cls.__name__}")
-                register_class(cls)
+                print_debug_lazy("Register %s class: %s", self.name, cls.__name__)
+                with StartupTimings.measure('register_class', cls.__name__):
+                    register_class(cls)
 
     def unregister_classes(self) -> None:
-        print_debug(f"BTypes.unregister_classes() <--- {self.name}")
+        print_debug_lazy("BTypes.unregister_classes() <--- %s", self.name)
         if reg_factory := register_factory.get(self, None):
             reg_factory.unregister()
         else:
             for cls in classes_per_type[self]:
                 if not "bl_rna" in cls.__dict__:
                     continue
-                print_debug(f"UNRegister {self.name} class: {cls.__name__}")
+                print_debug_lazy("UNRegister %s class: %s", self.name, cls.__name__)
                 unregister_class(cls)
 
     def create_classes_factory(self):
@@ -0,0 +1,318 @@
+""" Development hot reload: reload only the addon modules that changed, and their importers.
+
+Source mtimes are polled from a timer. When some module changes, it is reloaded
+(``importlib.reload``) together with the modules that import from it, in dependency order.
+Classes whose source didn't change (nor any of their bases or register dependencies) keep
+their registered class object, the rest of the ``BTypes`` classes of those modules are
+unregistered and registered again, together with the classes of the module they reference
+(``PointerProperty(type=...)``, ``bl_parent_id``, bases). The ackit package itself is not
+watched, edits to it need a full reload.
+"""
+
+import os
+import sys
+import inspect
+import hashlib
+import linecache
+import importlib
+import traceback
+from types import ModuleType
+from typing import Dict, List, Optional, Set
+
+from bpy.types import Node, NodeTree
+from bpy.utils import register_class, unregister_class
+
+from ..globals import GLOBALS
+from ..debug.output import print_debug
+from ..app.handlers import register_module_handlers, unregister_module_handlers
+from ..app.timer import new_timer, register_module_timers, unregister_module_timers, TimerHandler
+from .btypes import BTypes, classes_per_type
+from .base_type import BaseType, NODE_EDITOR_TYPES, link_node_tree_types
+from .reg_utils import toposort, iter_my_register_deps, DependencyCycleError
+
+
+__all__ = [
+    'HotReload',
+]
+
+
+# Module callbacks to call on the reloaded modules, before and after reloading them.
+UNLOAD_CALLBACK_IDS = ('unregister', 'late_unregister')
+LOAD_CALLBACK_IDS = ('init', 'late_init', 'register', 'late_register')
+
+
+def _get_mtime(module: ModuleType) -> Optional[int]:
+    try:
+        return os.stat(module.__file__).st_mtime_ns
+    except (OSError, TypeError):
+        return None
+
+
+def _get_class_fingerprint(cls: type) -> Optional[str]:
+    try:
+        return hashlib.sha1(inspect.getsource(cls).encode('utf-8')).hexdigest()
+    except (OSError, TypeError):
+        return None
+
+
+def _iter_module_classes(module: ModuleType):
+    """ BaseType classes defined in the module, with the attribute name they have in it. """
+    module_name = module.__name__
+    for attr_name, value in list(module.__dict__.items()):
+        if inspect.isclass(value) and issubclass(value, BaseType) and value.__module__ == module_name:
+            yield attr_name, value
+
+
+def _get_module_deps(module: ModuleType, module_names: Set[str]) -> Set[str]:
+    """ Names of the given modules that the module imports (either the module or classes/functions from it). """
+    deps = set()
+    for value in module.__dict__.values():
+        if isinstance(value, ModuleType):
+            dep = value.__name__
+        elif inspect.isclass(value) or inspect.isfunction(value):
+            dep = value.__module__
+        else:
+            continue
+        if dep in module_names:
+            deps.add(dep)
+    deps.discard(module.__name__)
+    return deps
+
+
+def _order_by_deps(deps_dict: Dict) -> list:
+    try:
+        return toposort(deps_dict)
+    except DependencyCycleError as e:
+        print_debug(f"Hot reload: {e}, using the name order")
+        return sorted(deps_dict, key=str)
+
+
+class HotReload:
+    """ Poll the addon source files and reload the changed modules. Only enabled in development. """
+
+    interval: float = 1.0
+
+    timer: Optional[TimerHandler] = None
+    mtimes: Dict[str, Optional[int]] = {}
+    fingerprints: Dict[type, Optional[str]] = {}
+
+    @staticmethod
+    def get_watched_modules() -> Dict[str, ModuleType]:
+        from .addon_loader import AddonLoader, ACKIT_PACKAGE
+        ackit_prefix = ACKIT_PACKAGE + '.'
+        return {
+            module.__name__: module
+            for module in (AddonLoader.modules or ())
+            if not module.__name__.startswith(ackit_prefix)
+        }
+
+    @classmethod
+    def start(cls, interval: Optional[float] = None) -> None:
+        if not GLOBALS.check_in_development():
+            return
+        if interval is not None:
+            cls.interval = interval
+        cls.stop()
+        cls.snapshot(cls.get_watched_modules().values())
+        cls.timer = new_timer(cls._on_timer, first_interval=cls.interval, step_interval=cls.interval, one_time_only=False)
+        print_debug("Hot reload: watching", len(cls.mtimes), "modules")
+
+    @classmethod
+    def stop(cls) -> None:
+        if cls.timer is not None:
+            cls.timer.stop()
+            cls.timer = None
+        cls.mtimes.clear()
+        cls.fingerprints.clear()
+
+    @classmethod
+    def snapshot(cls, modules) -> None:
+        """ Record the mtime of the modules and the fingerprint of their classes. """
+        for module in modules:
+            cls.mtimes[module.__name__] = _get_mtime(module)
+            for _attr_name, _cls in _iter_module_classes(module):
+                cls.fingerprints[_cls] = _get_class_fingerprint(_cls)
+
+    @classmethod
+    def get_changed_modules(cls) -> Set[str]:
+        modules = cls.get_watched_modules()
+        return {name for name, module in modules.items() if _get_mtime(module) != cls.mtimes.get(name, None)}
+
+    @classmethod
+    def _on_timer(cls):
+        changed = cls.get_changed_modules()
+        if changed:
+            cls.reload(changed)
+
+    # Reload.
+    ########################################################################
+
+    @classmethod
+    def reload(cls, changed: Set[str]) -> bool:
+        from .addon_loader import AddonLoader
+
+        modules = cls.get_watched_modules()
+        module_names = set(modules)
+
+        # Reload the changed modules and every module importing from them (transitively), dependencies first.
+        deps = {name: _get_module_deps(module, module_names) for name, module in modules.items()}
+        importers: Dict[str, Set[str]] = {name: set() for name in module_names}
+        for name, module_deps in deps.items():
+            for dep in module_deps:
+                importers[dep].add(name)
+        affected = set()
+        pending = [name for name in changed if name in modules]
+        while pending:
+            name = pending.pop()
+            if name not in affected:
+                affected.add(name)
+                pending.extend(importers[name])
+        ordered = _order_by_deps({name: deps[name] & affected for name in sorted(affected)})
+        print_debug("Hot reload:", ', '.join(ordered))
+
+        old_classes = {name: [_cls for _attr_name, _cls in _iter_module_classes(modules[name])] for name in ordered}
+
+        for name in reversed(ordered):
+            cls._call_module_callbacks(modules[name], UNLOAD_CALLBACK_IDS)
+            unregister_module_handlers(name)
+            unregister_module_timers(name)
+
+        replaced: List[type] = []
+        new_classes: List[type] = []
+        for name in ordered:
+            module = modules[name]
+            linecache.checkcache(module.__file__)
+            try:
+                importlib.reload(module)
+            except Exception:
+                traceback.print_exc()
+                print(f'[{GLOBALS.ADDON_MODULE_UPPER}]', f"Hot reload: failed to reload '{name}', a full reload is required")
+                cls.mtimes[name] = _get_mtime(module)
+                return False
+
+            module_classes = list(_iter_module_classes(module))
+            new_set = {new_cls for _attr_name, new_cls in module_classes}
+            new_by_idname = {new_cls.bl_idname: new_cls for new_cls in new_set if hasattr(new_cls, 'bl_idname')}
+            old_by_qualname = {_cls.__qualname__: _cls for _cls in old_classes[name]}
+            # Same definition: keep the registered class, so importers get it too.
+            kept: Dict[type, type] = {}
+            for _attr_name, new_cls in module_classes:
+                old_cls = old_by_qualname.pop(new_cls.__qualname__, None)
+                if old_cls is not None \
+                        and cls.fingerprints.get(old_cls, None) is not None \
+                        and cls.fingerprints[old_cls] == _get_class_fingerprint(new_cls):
+                    kept[new_cls] = old_cls
+                elif old_cls is not None:
+                    replaced.append(old_cls)
+            # Classes that are gone.
+            replaced.extend(old_by_qualname.values())
+
+            # Unless one of their bases or register dependencies is replaced, or they are a base or a register
+            # dependency of a new class of the module (which references their new class object, not the kept one).
+            while True:
+                replaced_set = set(replaced)
+                replaced_by_idname = {_cls.bl_idname: _cls for _cls in replaced if hasattr(_cls, 'bl_idname')}
+                referenced = set()
+                for new_cls in new_set.difference(kept):
+                    referenced.update(new_set.intersection(new_cls.__mro__[1:]))
+                    referenced.update(iter_my_register_deps(new_cls, new_set, new_by_idname))
+                changed = [
+                    new_cls for new_cls, old_cls in kept.items()
+                    if new_cls in referenced
+                    or not replaced_set.isdisjoint(old_cls.__mro__)
+                    or any(iter_my_register_deps(old_cls, replaced_set, replaced_by_idname))
+                ]
+                if not changed:
+                    break
+                for new_cls in changed:
+                    replaced.append(kept.pop(new_cls))
+
+            for attr_name, new_cls in module_classes:
+                if new_cls in kept:
+                    setattr(module, attr_name, kept[new_cls])
+                else:
+                    new_classes.append(new_cls)
+
+        # Registered classes of other modules depending on a replaced class (PointerProperty, bl_parent_id...)
+        # keep their class object but have to be registered again.
+        replaced_set = set(replaced)
+        replaced_by_idname = {_cls.bl_idname: _cls for _cls in replaced if hasattr(_cls, 'bl_idname')}
+        dependents = [
+            _cls for btype in BTypes for _cls in btype.get_classes()
+            if _cls.__module__ not in affected and any(iter_my_register_deps(_cls, replaced_set, replaced_by_idname))
+        ]
+
+        cls._unregister_classes(replaced + dependents)
+        for old_cls in replaced:
+            cls._remove_class(old_cls)
+
+        # Same as 'base_type.init', only the outermost classes are registered, now that every importer was reloaded.
+        new_classes = [new_cls for new_cls in new_classes if not new_cls.__subclasses__() and 'btypes' not in new_cls.__module__]
+        for new_cls in new_classes:
+            new_cls.tag_register()
+        has_node_classes = any(issubclass(_cls, (Node, NodeTree)) for _cls in replaced + new_classes)
+        if has_node_classes:
+            for node_classes in NODE_EDITOR_TYPES.values():
+                node_classes.clear()
+            link_node_tree_types(BTypes.Node.get_classes())
+
+        cls._register_classes(new_classes + dependents)
+
+        # Callbacks of the reloaded modules point to the old functions.
+        AddonLoader.module_callbacks.clear_callbacks()
+        AddonLoader.fetch_module_callbacks()
+        for name in ordered:
+            register_module_handlers(name)
+            register_module_timers(name)
+            cls._call_module_callbacks(modules[name], LOAD_CALLBACK_IDS)
+
+        if has_node_classes:
+            cls._rebuild_node_menus()
+
+        cls.snapshot(modules[name] for name in ordered)
+        print_debug(f"Hot reload: {len(ordered)} modules reloaded, {len(new_classes)} classes registered again")
+        return True
+
+    @staticmethod
+    def _call_module_callbacks(module: ModuleType, callback_ids) -> None:
+        for callback_id in callback_ids:
+            if callback := getattr(module, callback_id, None):
+                callback()
+
+    @staticmethod
+    def _get_register_order(classes: List[type]) -> List[type]:
+        classes_set = set(classes)
+        classes_by_idname = {_cls.bl_idname: _cls for _cls in classes if hasattr(_cls, 'bl_idname')}
+        return _order_by_deps({_cls: set(iter_my_register_deps(_cls, classes_set, classes_by_idname)) for _cls in classes})
+
+    @classmethod
+    def _unregister_classes(cls, classes: List[type]) -> None:
+        for _cls in reversed(cls._get_register_order(classes)):
+            if 'bl_rna' in _cls.__dict__:
+                unregister_class(_cls)
+
+    @classmethod
+    def _register_classes(cls, classes: List[type]) -> None:
+        for _cls in cls._get_register_order(classes):
+            if 'bl_rna' not in _cls.__dict__:
+                register_class(_cls)
+
+    @classmethod
+    def _remove_class(cls, old_cls: type) -> None:
+        for btype in BTypes:
+            btype_classes = classes_per_type[btype]
+            if old_cls in btype_classes:
+                btype_classes.remove(old_cls)
+        NODE_EDITOR_TYPES.pop(old_cls, None)
+        for node_classes in NODE_EDITOR_TYPES.values():
+            node_classes.discard(old_cls)
+        cls.fingerprints.pop(old_cls, None)
+
+    @staticmethod
+    def _rebuild_node_menus() -> None:
+        from .addon_loader import ACKIT_PACKAGE
+        # Node add menus and node search are built from the node classes, only if the node editor is in use.
+        categories = sys.modules.get(ACKIT_PACKAGE + '.ne.categories', None)
+        if categories is not None:
+            categories.unregister()
+            categories.late_register()
@@ -0,0 +1,218 @@
+""" Startup manifest: persisted result of the addon module/class discovery.
+
+Cold starts walk the addon source tree, import every submodule and (with autoload)
+build the class dependency graph via ``typing.get_type_hints``. The manifest stores
+the module list, the registration order of the classes, their idnames and the
+dependency edges, keyed by the mtimes and hashes of the source files and package
+directories. Warm starts validate the manifest by only stat'ing those paths, then
+import the listed modules directly and resolve the class order from the manifest.
+"""
+
+import os
+import sys
+import json
+import hashlib
+import importlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..globals import GLOBALS
+from ..debug.output import print_debug
+from ..debug.timings import StartupTimings
+
+
+__all__ = [
+    'StartupManifest',
+]
+
+
+MANIFEST_VERSION = 1
+
+
+def _get_source_paths(module_names: List[str]) -> Tuple[List[Path], List[Path]]:
+    """ Get the source files and the package directories involved in the given modules. """
+    root = GLOBALS.ADDON_SOURCE_PATH
+    files: Dict[str, Path] = {}
+    dirs: Dict[str, Path] = {str(root): root}
+    for module_name in module_names:
+        parts = module_name.split('.')
+        for i in range(1, len(parts)):
+            package_dir = root.joinpath(*parts[:i])
+            dirs[str(package_dir)] = package_dir
+            init_file = package_dir / '__init__.py'
+            files[str(init_file)] = init_file
+        module_path = root.joinpath(*parts)
+        module_file = module_path.with_suffix('.py')
+        if not module_file.exists():
+            # Compiled extension module or namespace, nothing we can track but its directory.
+            continue
+        files[str(module_file)] = module_file
+    return list(files.values()), list(dirs.values())
+
+
+def _hash_file(path: Path) -> str:
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+def _get_cache_key() -> Dict[str, Any]:
+    return {
+        'version': MANIFEST_VERSION,
+        'addon_module': GLOBALS.ADDON_MODULE,
+        'blender_version': list(GLOBALS.BLENDER_VERSION),
+        'python_version': list(sys.version_info[:2]),
+    }
+
+
+class StartupManifest:
+    """ Read/write the startup manifest of the addon. """
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        self.data = data
+
+    @property
+    def module_names(self) -> List[str]:
+        return self.data['modules']
+
+    @staticmethod
+    def get_filepath() -> Path:
+        return Path(GLOBALS.USER_CONFIG_DIR) / f'{GLOBALS.ADDON_MODULE_SHORT}_manifest.json'
+
+    # Load / Validate.
+    ########################################################################
+
+    @classmethod
+    def load(cls) -> Optional['StartupManifest']:
+        """ Load the manifest if it exists and it is still valid for the current source tree. """
+        filepath = cls.get_filepath()
+        try:
+            with filepath.open('r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if data.get('key') != _get_cache_key():
+            print_debug("Startup manifest: outdated cache key.")
+            return None
+
+        manifest = cls(data)
+        if not manifest.validate():
+            return None
+        return manifest
+
+    def validate(self) -> bool:
+        """ Check that no package directory nor source file changed since the manifest was written.
+            Directories are checked by mtime (added/removed modules), files by mtime and then by hash. """
+        for dirpath, mtime_ns in self.data['dirs'].items():
+            try:
+                if os.stat(dirpath).st_mtime_ns != mtime_ns:
+                    print_debug(f"Startup manifest: directory changed '{dirpath}'")
+                    return False
+            except OSError:
+                return False
+
+        files_changed = False
+        for filepath, (mtime_ns, size, file_hash) in self.data['files'].items():
+            try:
+                stat = os.stat(filepath)
+            except OSError:
+                print_debug(f"Startup manifest: missing file '{filepath}'")
+                return False
+            if stat.st_mtime_ns == mtime_ns and stat.st_size == size:
+                continue
+            # The file was touched, only invalidate if its contents changed.
+            if stat.st_size != size or _hash_file(Path(filepath)) != file_hash:
+                print_debug(f"Startup manifest: file changed '{filepath}'")
+                return False
+            self.data['files'][filepath] = [stat.st_mtime_ns, size, file_hash]
+            files_changed = True
+
+        if files_changed:
+            # Refresh the mtimes so the next start skips the hashing.
+            self.write()
+        return True
+
+    # Resolve.
+    ########################################################################
+
+    def import_modules(self) -> List[Any]:
+        modules = []
+        for name in self.module_names:
+            with StartupTimings.measure('import', name):
+                modules.append(importlib.import_module('.' + name, GLOBALS.ADDON_MODULE))
+        return modules
+
+    def get_ordered_classes(self) -> Optional[List[type]]:
+        """ Resolve the registration order of the classes. Returns None if any class can't be found. """
+        ordered_classes = self.data.get('classes', None)
+        if ordered_classes is None:
+            return None
+        sys_modules = sys.modules
+        classes = []
+        for module_name, attr_name, _idname in ordered_classes:
+            module = sys_modules.get(module_name, None)
+            cls = getattr(module, attr_name, None) if module is not None else None
+            if cls is None:
+                print_debug(f"Startup manifest: class not found '{module_name}.{attr_name}'")
+                return None
+            classes.append(cls)
+        return classes
+
+    # Build / Write.
+    ########################################################################
+
+    @classmethod
+    def build(cls, modules: List[Any], ordered_classes: Optional[List[type]] = None, deps_dict: Optional[Dict[type, set]] = None) -> 'StartupManifest':
+        prefix_len = len(GLOBALS.ADDON_MODULE) + 1
+        module_names = [module.__name__[prefix_len:] for module in modules]
+
+        files, dirs = _get_source_paths(module_names)
+        data: Dict[str, Any] = {
+            'key': _get_cache_key(),
+            'modules': module_names,
+            'dirs': {str(path): os.stat(path).st_mtime_ns for path in dirs},
+            'files': {},
+        }
+        for path in files:
+            stat = os.stat(path)
+            data['files'][str(path)] = [stat.st_mtime_ns, stat.st_size, _hash_file(path)]
+
+        if ordered_classes is not None:
+            # Map every class to the (module, attribute) where it was found during discovery.
+            class_keys: Dict[type, Tuple[str, str]] = {}
+            for module in modules:
+                for attr_name, value in module.__dict__.items():
+                    if isinstance(value, type) and value not in class_keys:
+                        class_keys[value] = (module.__name__, attr_name)
+
+            def _key(_cls) -> str:
+                module_name, attr_name = class_keys[_cls]
+                return f'{module_name}:{attr_name}'
+
+            data['classes'] = [
+                [*class_keys[_cls], getattr(_cls, 'bl_idname', None)]
+                for _cls in ordered_classes
+            ]
+            if deps_dict is not None:
+                data['deps'] = {
+                    _key(_cls): sorted(_key(dep) for dep in deps)
+                    for _cls, deps in deps_dict.items() if deps
+                }
+
+        return cls(data)
+
+    def write(self) -> None:
+        filepath = self.get_filepath()
+        try:
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            tmp_filepath = filepath.with_suffix('.tmp')
+            with tmp_filepath.open('w', encoding='utf-8') as f:
+                json.dump(self.data, f)
+            os.replace(tmp_filepath, filepath)
+        except OSError as e:
+            print_debug(f"Startup manifest: could not be written! {e}")
+
+    @classmethod
+    def clear(cls) -> None:
+        filepath = cls.get_filepath()
+        if filepath.exists():
+            filepath.unlink()
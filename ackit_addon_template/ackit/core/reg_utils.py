@@ -1,3 +1,4 @@
+import sys
 import importlib
 import inspect
 import typing
@@ -7,30 +8,44 @@ from collections import defaultdict
 import bpy
 
 from ..globals import GLOBALS
+from ..debug.timings import StartupTimings
 
 
 # Import modules
 #################################################
 
-def get_all_submodules(directory):
-    return list(iter_submodules(directory, GLOBALS.ADDON_MODULE))
+def get_all_submodules(directory, exclude: typing.Iterable[str] = ()):
+    return list(iter_submodules(directory, GLOBALS.ADDON_MODULE, exclude))
 
 
-def iter_submodules(path, package_name):
-    for name in sorted(iter_submodule_names(path)):
-        yield importlib.import_module("." + name, package_name)
+def iter_submodules(path, package_name, exclude: typing.Iterable[str] = ()):
+    for name in sorted(iter_submodule_names(path, exclude=frozenset(exclude))):
+        with StartupTimings.measure('import', name):
+            module = importlib.import_module("." + name, package_name)
+        yield module
 
 
-def iter_submodule_names(path, root=""):
+def iter_submodule_names(path, root="", exclude: typing.FrozenSet[str] = frozenset()):
     for _, module_name, is_package in pkgutil.iter_modules([str(path)]):
+        if root + module_name in exclude:
+            continue
         if is_package:
             sub_path = path / module_name
             sub_root = root + module_name + "."
-            yield from iter_submodule_names(sub_path, sub_root)
+            yield from iter_submodule_names(sub_path, sub_root, exclude)
         else:
             yield root + module_name
 
 
+def get_loaded_submodules(package_name: str) -> list:
+    """ Get the (non-package) submodules of the given package that are already imported, sorted by name. """
+    prefix = package_name + "."
+    return [
+        module for name, module in sorted(sys.modules.items())
+        if name.startswith(prefix) and module is not None and not hasattr(module, '__path__')
+    ]
+
+
 # Get/Find subclasses
 ########################################################################
 
@@ -76,17 +91,6 @@ def pack_classes_by_modules(classes: list, one_per_module: bool = False) -> typi
         d[cls.__module__.split('.')[-2]].append(cls)
     return d
 
-def get_ordered_pg_classes_to_register(classes) -> list:
-    my_classes = set(classes)
-    my_classes_by_idname = {cls.bl_idname : cls for cls in classes if hasattr(cls, "bl_idname")}
-
-    deps_dict = {}
-    for cls in my_classes:
-        deps_dict[cls] = set(iter_my_register_deps(cls, my_classes, my_classes_by_idname))
-
-    return toposort(deps_dict)
-
-
 # Find classes to register
 #################################################
 
@@ -178,24 +182,65 @@ def get_register_base_types():
 # Find order to register to solve dependencies
 #################################################
 
+class DependencyCycleError(ValueError):
+    """ Raised when the register dependencies of some classes form a cycle. """
+
+    def __init__(self, chain: list) -> None:
+        self.chain = chain
+        super().__init__("Register dependency cycle: " + " -> ".join(getattr(value, '__qualname__', str(value)) for value in chain))
+
+
 def toposort(deps_dict):
+    """ Order the keys of ``deps_dict`` (class -> set of classes it depends on) so that dependencies come first.
+        Classes are sorted by levels (Kahn's algorithm), each level ordered by ``bl_order``. Deps out of ``deps_dict`` are ignored.
+        Raises ``DependencyCycleError`` with the chain of classes of a cycle, if any. """
+    # Insertion index, tie-breaker for classes with the same bl_order.
+    index = {value: i for i, value in enumerate(deps_dict)}
+    pending_count = {}
+    dependents = defaultdict(list)
+    for value, deps in deps_dict.items():
+        count = 0
+        for dep in deps:
+            if dep in index and dep is not value:
+                dependents[dep].append(value)
+                count += 1
+            elif dep is value:
+                raise DependencyCycleError([value, value])
+        pending_count[value] = count
+
+    def _sort_key(cls):
+        return (getattr(cls, "bl_order", 0), index[cls])
+
     sorted_list = []
-    sorted_values = set()
-    while len(deps_dict) > 0:
-        unsorted = []
-        sorted_list_sub = []  # helper for additional sorting by bl_order - in panels
-        for value, deps in deps_dict.items():
-            if len(deps) == 0:
-                sorted_list_sub.append(value)
-                sorted_values.add(value)
-            else:
-                unsorted.append(value)
-        deps_dict = {value: deps_dict[value] - sorted_values for value in unsorted}
-        sorted_list_sub.sort(key=lambda cls: getattr(cls, "bl_order", 0))
-        sorted_list.extend(sorted_list_sub)
+    level = sorted((value for value, count in pending_count.items() if count == 0), key=_sort_key)
+    while level:
+        sorted_list.extend(level)
+        next_level = []
+        for value in level:
+            for dependent in dependents.get(value, ()):
+                pending_count[dependent] -= 1
+                if pending_count[dependent] == 0:
+                    next_level.append(dependent)
+        next_level.sort(key=_sort_key)
+        level = next_level
+
+    if len(sorted_list) != len(deps_dict):
+        raise DependencyCycleError(_find_cycle(deps_dict, {value for value, count in pending_count.items() if count > 0}))
     return sorted_list
 
 
+def _find_cycle(deps_dict, unsorted: set) -> list:
+    """ Get a chain of classes forming a cycle, walking the deps of the classes that couldn't be sorted. """
+    # Every unsorted class depends on at least one unsorted class, so the walk always ends in a cycle.
+    value = next(iter(unsorted))
+    path = []
+    position = {}
+    while value not in position:
+        position[value] = len(path)
+        path.append(value)
+        value = next(dep for dep in deps_dict[value] if dep in unsorted)
+    return path[position[value]:] + [value]
+
 
 # Special-dedicated functions.
 ##################################################
@@ -204,7 +249,8 @@ def get_ordered_pg_classes_to_register(pg_classes) -> list:
     my_classes = set(pg_classes)
     deps_dict = {}
 
-    for cls in my_classes:
+    # Iterate the given list (not the set) so classes without ordering constraints keep their order.
+    for cls in pg_classes:
         deps_dict[cls] = set(
             iter_my_deps_from_annotations(cls, my_classes)
         )
@@ -1,8 +1,13 @@
-from .btypes import *
-from .helpers import register_property, batch_register_properties
-from .props import PropertyTypes
-from .props_typed import WrappedTypedPropertyTypes
-from .subscriptions import subscribe_to_rna_change, subscribe_to_rna_change_based_on_context
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .btypes import *
+    from .helpers import register_property, batch_register_properties
+    from .props import PropertyTypes
+    from .props_typed import WrappedTypedPropertyTypes
+    from .subscriptions import subscribe_to_rna_change, subscribe_to_rna_change_based_on_context
 
 # Decide what needs to be exposed
 __all__ = [
@@ -18,4 +23,15 @@ __all__ = [
     # Subscriptions
     'subscribe_to_rna_change',
     'subscribe_to_rna_change_based_on_context',
-] 
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), {
+    'AddonPreferences': ('.btypes', 'AddonPreferences'),
+    'PropertyGroup': ('.btypes', 'PropertyGroup'),
+    'register_property': ('.helpers', 'register_property'),
+    'batch_register_properties': ('.helpers', 'batch_register_properties'),
+    'PropertyTypes': ('.props', 'PropertyTypes'),
+    'WrappedTypedPropertyTypes': ('.props_typed', 'WrappedTypedPropertyTypes'),
+    'subscribe_to_rna_change': ('.subscriptions', 'subscribe_to_rna_change'),
+    'subscribe_to_rna_change_based_on_context': ('.subscriptions', 'subscribe_to_rna_change_based_on_context'),
+})
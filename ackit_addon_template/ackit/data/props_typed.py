@@ -60,7 +60,8 @@ class WrappedPropertyDescriptor(Generic[T]):
             return self # Or None, or raise error
 
     def add_update_callback(self, callback: Callable) -> 'WrappedPropertyDescriptor[T]':
-        """Add an update callback"""
+        """Add an update callback. It can be rate limited with 'debounce', 'throttle' or 'coalesce_per_tick',
+        deferred calls are done per property owner with the current context."""
         if not callable(callback):
             raise TypeError("callback: expected a callable")
         self._update_callback_set.add_callback(callback)
@@ -3,6 +3,7 @@ from functools import wraps
 import bpy
 
 from ..app.handlers import Handlers
+from ..app.rate_limit import RateLimiter
 from ..debug import debug_context, print_debug
 
 
@@ -68,6 +69,8 @@ def subscribe_to_rna_change_based_on_context(data_path: str, attr_name: str, per
 
 
 def _unregister_rna_subscriptions():
+    # Run the calls deferred by rate limited ('debounce'...) callbacks.
+    RateLimiter.flush_callbacks([data['notify'] for data in (*rna_listeners.values(), *ctx_rna_listeners.values())])
     for owner in owners:
         bpy.msgbus.clear_by_owner(owner)
     owners.clear()
@@ -1,5 +1,6 @@
-from .output import print_debug, pprint_debug, DebugPrintContext
+from .output import print_debug, print_debug_lazy, pprint_debug, DebugPrintContext
 from .logger import get_logger
+from .timings import StartupTimings
 from .profiler import (
     profile_function,
     profile_block,
@@ -12,9 +13,11 @@ debug_context = DebugPrintContext
 
 __all__ = [
     'print_debug',
+    'print_debug_lazy',
     'pprint_debug',
     'debug_context',
     'get_logger',
+    'StartupTimings',
     'profile_function',
     'profile_block',
     'start_timer',
@@ -6,13 +6,20 @@ from ..globals import GLOBALS
 
 def print_debug(*args) -> None:
     """Simple debug print with addon module prefix."""
-    if GLOBALS.check_in_development():
+    if GLOBALS.IN_DEVELOPMENT:
         print(f'[{GLOBALS.ADDON_MODULE_UPPER}]', *args)
 
 
+def print_debug_lazy(msg: str, *args) -> None:
+    """Debug print with %-style arguments, only formatted in development mode.
+    Use it instead of f-strings in hot paths, e.g. print_debug_lazy("Register %s class: %s", btype, cls.__name__)."""
+    if GLOBALS.IN_DEVELOPMENT:
+        print(f'[{GLOBALS.ADDON_MODULE_UPPER}]', msg % args if args else msg)
+
+
 def pprint_debug(title: str, data: Dict[str, Any], sort: bool = False) -> None:
     """Pretty print debug output with title and formatting."""
-    if GLOBALS.check_in_development():
+    if GLOBALS.IN_DEVELOPMENT:
         print_debug('\n+++', title, '++++++++++++++++++++++++++++++++')
         pprint.pprint(data, indent=4, sort_dicts=sort)
         print_debug('++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++\n')
@@ -21,7 +28,7 @@ def pprint_debug(title: str, data: Dict[str, Any], sort: bool = False) -> None:
 class DebugPrintContext:
     """Context manager for hierarchical debug printing."""
     def __init__(self, title: str) -> None:
-        self.use_debug = GLOBALS.check_in_development()
+        self.use_debug = GLOBALS.IN_DEVELOPMENT
         if self.use_debug:
             self.title = title
             print(f"<{GLOBALS.ADDON_MODULE_UPPER} - {title}>")
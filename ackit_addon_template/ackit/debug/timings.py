@@ -0,0 +1,168 @@
+""" Startup and registration timings.
+
+``AddonLoader`` and ``BTypes`` record how long each step of the addon startup takes:
+loader phases, module imports, module callbacks (``init``, ``register``...), AutoCode
+generators and ``register_class`` calls. Once registered, the report is written as JSON
+to ``GLOBALS.USER_CONFIG_DIR`` and any entry slower than ``StartupTimings.slow_threshold``
+is warned about. Only enabled in development, unless ``StartupTimings.enabled`` is set.
+"""
+
+import os
+import json
+import time
+from pathlib import Path
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Dict, Iterator, List, Optional
+
+from ..globals import GLOBALS
+from .output import print_debug
+
+
+__all__ = [
+    'StartupTimings',
+    'TimingRecord',
+]
+
+
+@dataclass
+class TimingRecord:
+    category: str  # 'phase', 'import', 'callback', 'auto_code', 'register_class'.
+    name: str
+    duration: float  # Seconds, without the nested entries (except for phases).
+    total: float = 0.0  # Seconds, including the nested entries.
+
+
+class StartupTimings:
+    """ Collects the timings of the addon startup. Entry durations exclude their nested entries
+        (a module import doesn't include the imports it triggers), so they can be summed. """
+
+    # None: only in development.
+    enabled: Optional[bool] = None
+    # Entries (except the 'phase' ones) taking longer than this, in seconds, are warned about.
+    slow_threshold: float = 0.05
+    # Max duration of the whole startup (init + register), in seconds. None to disable.
+    budget: Optional[float] = None
+
+    records: List[TimingRecord] = []
+    # Time of the nested (non phase) entries, per open entry.
+    _nested: List[float] = []
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return GLOBALS.check_in_development() if cls.enabled is None else cls.enabled
+
+    @classmethod
+    def clear(cls) -> None:
+        cls.records.clear()
+        cls._nested.clear()
+
+    @classmethod
+    def add(cls, category: str, name: str, duration: float) -> None:
+        if cls.is_enabled():
+            cls.records.append(TimingRecord(category, name, duration, duration))
+            if category != 'phase' and cls._nested:
+                cls._nested[-1] += duration
+
+    @classmethod
+    @contextmanager
+    def measure(cls, category: str, name: str) -> Iterator[None]:
+        if not cls.is_enabled():
+            yield
+            return
+        is_phase = category == 'phase'
+        if not is_phase:
+            cls._nested.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            total = time.perf_counter() - start
+            if is_phase:
+                cls.records.append(TimingRecord(category, name, total, total))
+            else:
+                nested = cls._nested.pop()
+                cls.records.append(TimingRecord(category, name, total - nested, total))
+                if cls._nested:
+                    cls._nested[-1] += total
+
+    # Query.
+    ########################################################################
+
+    @classmethod
+    def get_sorted(cls, category: Optional[str] = None) -> List[TimingRecord]:
+        records = cls.records if category is None else [record for record in cls.records if record.category == category]
+        return sorted(records, key=lambda record: record.duration, reverse=True)
+
+    @classmethod
+    def get_total(cls) -> float:
+        return sum(record.duration for record in cls.records if record.category == 'phase' and record.name in ('init_modules', 'register_modules'))
+
+    @classmethod
+    def get_slow(cls) -> List[TimingRecord]:
+        return [record for record in cls.get_sorted() if record.category != 'phase' and record.duration >= cls.slow_threshold]
+
+    @classmethod
+    def get_totals_per_category(cls) -> Dict[str, float]:
+        totals: Dict[str, float] = {}
+        for record in cls.records:
+            if record.category != 'phase':
+                totals[record.category] = totals.get(record.category, 0.0) + record.duration
+        return totals
+
+    # Output.
+    ########################################################################
+
+    @classmethod
+    def format_table(cls, limit: Optional[int] = None) -> str:
+        records = cls.get_sorted()[:limit]
+        name_width = max((len(record.name) for record in records), default=4)
+        lines = [
+            f"{'Time (ms)':>10}  {'Category':<14}  {'Name':<{name_width}}",
+            f"{'-' * 10}  {'-' * 14}  {'-' * name_width}",
+        ]
+        for record in records:
+            slow = ' (!)' if record.category != 'phase' and record.duration >= cls.slow_threshold else ''
+            lines.append(f"{record.duration * 1000:>10.2f}  {record.category:<14}  {record.name:<{name_width}}{slow}")
+        return '\n'.join(lines)
+
+    @staticmethod
+    def get_filepath() -> Path:
+        return Path(GLOBALS.USER_CONFIG_DIR) / f'{GLOBALS.ADDON_MODULE_SHORT}_startup_timings.json'
+
+    @classmethod
+    def write_json(cls, filepath: Optional[Path] = None) -> Optional[Path]:
+        filepath = Path(filepath) if filepath is not None else cls.get_filepath()
+        data = {
+            'addon_module': GLOBALS.ADDON_MODULE,
+            'blender_version': list(GLOBALS.BLENDER_VERSION),
+            'total': cls.get_total(),
+            'budget': cls.budget,
+            'slow_threshold': cls.slow_threshold,
+            'totals_per_category': cls.get_totals_per_category(),
+            'records': [asdict(record) for record in cls.get_sorted()],
+        }
+        try:
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            tmp_filepath = filepath.with_suffix('.tmp')
+            with tmp_filepath.open('w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_filepath, filepath)
+        except OSError as e:
+            print_debug(f"Startup timings: could not be written! {e}")
+            return None
+        return filepath
+
+    @classmethod
+    def report(cls) -> None:
+        """ Write the JSON report, print the table (development only) and warn about slow entries. """
+        if not cls.is_enabled() or not cls.records:
+            return
+        cls.write_json()
+        print_debug(f"Startup timings ({cls.get_total() * 1000:.2f} ms):\n" + cls.format_table())
+
+        prefix = f'[{GLOBALS.ADDON_MODULE_UPPER}]'
+        for record in cls.get_slow():
+            print(prefix, f"WARNING! Slow {record.category} '{record.name}': {record.duration * 1000:.2f} ms (threshold: {cls.slow_threshold * 1000:.2f} ms)")
+        if cls.budget is not None and (total := cls.get_total()) > cls.budget:
+            print(prefix, f"WARNING! Startup took {total * 1000:.2f} ms, over its budget of {cls.budget * 1000:.2f} ms")
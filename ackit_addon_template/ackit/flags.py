@@ -1,5 +1,5 @@
 from enum import Enum, auto
-from typing import Type, Callable, TypeVar
+from typing import TYPE_CHECKING, Type, Callable, TypeVar
 
 import bpy
 
@@ -12,8 +12,10 @@ from typing import Any
 # from .ne.btypes.node import Node
 # from .ui.btypes.panel import Panel
 # Import base types for TypeVar bounds
-from .ne.btypes import Node as _NodeType # Use alias to avoid name clash if needed
-from .ui.btypes import Panel as _PanelType # Use alias
+if TYPE_CHECKING:
+    # Only needed as TypeVar bounds, importing them here would load the node editor and UI subsystems.
+    from .ne.btypes import Node as _NodeType # Use alias to avoid name clash if needed
+    from .ui.btypes import Panel as _PanelType # Use alias
 
 __all__ = [
     'OPERATOR',
@@ -215,7 +217,7 @@ class MODAL:
 
 # --- Panel Flags ---
 
-PanelT = TypeVar('PanelT', bound=_PanelType) # Bound to Panel base type
+PanelT = TypeVar('PanelT', bound='_PanelType') # Bound to Panel base type
 
 class PANEL(Enum):
     """ Decorator flags for Panels. Use as @flags.PANEL.HIDE_HEADER etc. """
@@ -232,7 +234,7 @@ class PANEL(Enum):
 
 # --- Node Category Flag ---
 
-NodeT = TypeVar('NodeT', bound=_NodeType) # Bound to Node base type
+NodeT = TypeVar('NodeT', bound='_NodeType') # Bound to Node base type
 
 def NODE_CATEGORY(category: str) -> Callable[[Type[NodeT]], Type[NodeT]]:
     """
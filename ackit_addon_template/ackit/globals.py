@@ -38,14 +38,22 @@ class GLOBALS:
         'ackit'  # Base config folder for ackit
     )
 
+    # Cached development mode, updated by 'refresh_in_development'.
+    IN_DEVELOPMENT: bool = False
+
     @classmethod
     def check_in_development(cls) -> bool:
         """Check if addon is in development mode."""
-        if bpy.app.debug_value == 1:
-            return True
-        if (hasattr(sys, 'gettrace') and sys.gettrace() is not None) and is_junction(GLOBALS.ADDON_SOURCE_PATH):
-            return True
-        return False
+        return cls.IN_DEVELOPMENT
+
+    @classmethod
+    def refresh_in_development(cls) -> bool:
+        """Evaluate the development mode again (debug value, attached debugger, junction install) and cache it.
+        Call it after changing 'bpy.app.debug_value' or attaching a debugger at runtime."""
+        cls.IN_DEVELOPMENT = bpy.app.debug_value == 1 or (
+            (hasattr(sys, 'gettrace') and sys.gettrace() is not None) and is_junction(GLOBALS.ADDON_SOURCE_PATH)
+        )
+        return cls.IN_DEVELOPMENT
 
     @classmethod
     def check_in_production(cls) -> bool:
@@ -71,9 +79,13 @@ class GLOBALS:
         getattr(bpy, GLOBALS.ADDON_MODULE)[key] = value
 
 
+GLOBALS.refresh_in_development()
+
+
 # ----------------------------------------------------------------
 
 def init():
+    GLOBALS.refresh_in_development()
     GLOBALS.ensure_config_dir()
 
 
@@ -116,3 +116,26 @@ def rect_3d(x: int, y: int, z: int, w: int, h: int, rgba: RGBA):
     shader.uniform_float("color", rgba)
     batch.draw(shader)
     gpu_state.blend_set('NONE')
+
+def image_2d(x: int, y: int, w: int, h: int, texture: gpu.types.GPUTexture, uv_rect: Tuple[float, float, float, float] = (0.0, 0.0, 1.0, 1.0)):
+    images_2d(texture, ((x, y, w, h),), (uv_rect,))
+
+def images_2d(texture: gpu.types.GPUTexture, rects, uv_rects):
+    """Draws textured quads in a single batch, each (x, y, w, h) rect samples its (u0, v0, u1, v1) sub-rect of the texture."""
+    pos, tex_coords, indices = [], [], []
+    for i, ((x, y, w, h), (u0, v0, u1, v1)) in enumerate(zip(rects, uv_rects)):
+        pos.extend(((x, y), (x + w, y), (x, y + h), (x + w, y + h)))
+        tex_coords.extend(((u0, v0), (u1, v0), (u0, v1), (u1, v1)))
+        k = i * 4
+        indices.extend(((k, k + 1, k + 2), (k + 2, k + 1, k + 3)))
+
+    shader = gpu.shader.from_builtin('IMAGE')
+    batch = batch_for_shader(
+        shader, 'TRIS',
+        {"pos": pos, "texCoord": tex_coords},
+        indices=indices
+    )
+    gpu_state.blend_set('ALPHA')
+    shader.uniform_sampler("image", texture)
+    batch.draw(shader)
+    gpu_state.blend_set('NONE')
@@ -1,16 +1,17 @@
-from typing import Callable, Type, Any, TypeVar
+from typing import TYPE_CHECKING, Callable, Type, Any, TypeVar
 
 # Updated imports to reflect the new structure
 # Assuming base classes are imported into the __init__.py of their respective btypes folders
-from .ne.btypes import Node as _NodeType
-from .ne.btypes import NodeSocket as _NodeSocketType
-from .ops.btypes import Generic as _OperatorType
+if TYPE_CHECKING:
+    from .ne.btypes import Node as _NodeType
+    from .ne.btypes import NodeSocket as _NodeSocketType
+    from .ops.btypes import Generic as _OperatorType
 
 
 # Define TypeVars bound to base classes
-NodeTypeVar = TypeVar('NodeTypeVar', bound=_NodeType)
-NodeSocketTypeVar = TypeVar('NodeSocketTypeVar', bound=_NodeSocketType)
-OperatorTypeVar = TypeVar('OperatorTypeVar', bound=_OperatorType)
+NodeTypeVar = TypeVar('NodeTypeVar', bound='_NodeType')
+NodeSocketTypeVar = TypeVar('NodeSocketTypeVar', bound='_NodeSocketType')
+OperatorTypeVar = TypeVar('OperatorTypeVar', bound='_OperatorType')
 
 
 def Node(label: str | None = None, tooltip: str = "", icon: str = 'NONE') -> Callable[[Type[NodeTypeVar]], Type[NodeTypeVar]]:
@@ -2,6 +2,7 @@ from .btypes import *
 from .socket_types import * # Expose all specific socket types
 from .annotations import NodeInput, NodeOutput
 from .socket_casting import SocketCast
+from . import categories  # noqa: F401, builds the node add menus (late_register) of any registered node.
 
 # Expose base types
 __all__ = [
@@ -4,6 +4,7 @@ import re # For parsing menu ID back to path
 
 from ..core.btypes import BTypes
 from ..globals import GLOBALS
+from ..utils.search import SearchIndex
 
 # --- Global storage ---
 # Stores the generated hierarchy, e.g., {'Inputs': {'Data': {'__nodes__': [(NodeA, 'TREE_A')], '__tree_types__': {'TREE_A'}}, '__nodes__': [(NodeB, 'TREE_B')], '__tree_types__': {'TREE_B'}}, ...}
@@ -11,6 +12,11 @@ _category_hierarchy = {}
 # Stores dynamically created menu classes, mapping bl_idname to the class
 _registered_menu_classes = {}
 
+# Search index over '<category path>/<node label>' entries, values are (search path, tree type idname, node class)
+_node_search_index = SearchIndex()
+# Maps each (tree type idname, search path) to its node class, tree types may share search paths
+_node_classes_by_search_path = {}
+
 # Special key for storing direct node classes within a category level
 _NODE_LIST_KEY = '__nodes__'
 # Special key for storing the set of tree types applicable to a category level
@@ -76,6 +82,71 @@ def build_hierarchy():
              print(f"Warning: Node class {node_class.__name__} has category '{category_path}' but is missing '_node_tree_type'. Skipping.")
         # Nodes without category or tree type are ignored for the menu
 
+    build_search_index()
+
+
+def build_search_index():
+    """Builds the node-add search index from the registered node classes and their category paths."""
+    _node_search_index.clear()
+    _node_classes_by_search_path.clear()
+
+    entries = []
+    for node_class in BTypes.Node.get_classes():
+        category_path = getattr(node_class, '_node_category', None)
+        node_tree_type = getattr(node_class, '_node_tree_type', None)
+        if not category_path or not node_tree_type:
+            continue
+        path_parts = [p.strip() for p in category_path.strip('/').split('/') if p.strip()]
+        search_path = '/'.join(path_parts + [node_class.bl_label])
+        entries.append((search_path, node_tree_type.bl_idname, node_class))
+
+    for search_path, node_tree_type, node_class in sorted(entries, key=lambda entry: entry[0]):
+        _node_search_index.add(search_path, (search_path, node_tree_type, node_class))
+        _node_classes_by_search_path[(node_tree_type, search_path)] = node_class
+
+
+def search_node_classes(edit_text: str, tree_type: str | None = None) -> list:
+    """Returns the node classes matching the search text, optionally filtered by node tree type."""
+    return [
+        node_class for _search_path, node_tree_type, node_class in _node_search_index.search(edit_text)
+        if tree_type is None or node_tree_type == tree_type
+    ]
+
+
+def search_node_paths(self, context, edit_text):
+    """Search function (StringProperty) for the node search paths of the context tree type."""
+    tree_type = getattr(context.space_data, 'tree_type', None)
+    return [
+        search_path for search_path, node_tree_type, _node_class in _node_search_index.search(edit_text)
+        if node_tree_type == tree_type
+    ]
+
+
+class ACKIT_OT_node_search_add(bpy.types.Operator):
+    """Search a node by its category path and name, then add it to the node tree"""
+    bl_idname = "node.ackit_search_add"
+    bl_label = "Search..."
+    bl_options = {'REGISTER', 'UNDO'}
+
+    node_path: bpy.props.StringProperty(name="Node", search=search_node_paths)
+
+    @classmethod
+    def poll(cls, context):
+        tree_type = getattr(context.space_data, 'tree_type', None)
+        return tree_type is not None and tree_type in _category_hierarchy.get(_TREE_TYPES_KEY, set())
+
+    def invoke(self, context, event):
+        self.node_path = ""
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        tree_type = getattr(context.space_data, 'tree_type', None)
+        node_class = _node_classes_by_search_path.get((tree_type, self.node_path), None)
+        if node_class is None:
+            return {'CANCELLED'}
+        bpy.ops.node.add_node('INVOKE_DEFAULT', type=node_class.get_idname(), use_transform=True)
+        return {'FINISHED'}
+
 # --- Dynamic Menu Drawing ---
 
 def draw_submenu(self, context):
@@ -204,6 +275,9 @@ def draw_ackit_add_menu(self, context):
 
     layout = self.layout
 
+    if current_context_tree_type in _category_hierarchy.get(_TREE_TYPES_KEY, set()):
+        layout.operator(ACKIT_OT_node_search_add.bl_idname, icon='VIEWZOOM')
+
     # Draw top-level menus from the hierarchy, filtered by tree type
     # Filter out the special keys from top-level keys
     sorted_top_keys = sorted([k for k in _category_hierarchy.keys() if k not in (_NODE_LIST_KEY, _TREE_TYPES_KEY)])
@@ -261,7 +335,11 @@ def late_register():
         except Exception as e:
             print(f"Error registering menu class {menu_cls.bl_idname}: {e}")
 
-    # 4. Append main draw function to the add menu
+    # 4. Register the node search operator
+    if 'bl_rna' not in ACKIT_OT_node_search_add.__dict__:
+        bpy.utils.register_class(ACKIT_OT_node_search_add)
+
+    # 5. Append main draw function to the add menu
     try:
         bpy.types.NODE_MT_add.append(draw_ackit_add_menu)
     except Exception as e:
@@ -287,6 +365,12 @@ def unregister():
         except Exception as e:
             print(f"Error unregistering menu class {menu_cls.bl_idname}: {e}")
 
-    # 3. Clear global storage
+    # 3. Unregister the node search operator
+    if 'bl_rna' in ACKIT_OT_node_search_add.__dict__:
+        bpy.utils.unregister_class(ACKIT_OT_node_search_add)
+
+    # 4. Clear global storage
     _registered_menu_classes.clear()
     _category_hierarchy.clear()
+    _node_search_index.clear()
+    _node_classes_by_search_path.clear()
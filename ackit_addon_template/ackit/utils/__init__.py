@@ -1,9 +1,24 @@
-from ..enums.operator import OpsReturn, SubmodalReturn
-from .cursor import Cursor
-from .event import *
-from .polling import Polling
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ..enums.operator import OpsReturn, SubmodalReturn
+    from .cursor import Cursor
+    from .event import *
+    from .polling import Polling
 # Import other potential utils here
 
 __all__ = [
     'Polling',
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), {
+    'OpsReturn': ('..enums.operator', 'OpsReturn'),
+    'SubmodalReturn': ('..enums.operator', 'SubmodalReturn'),
+    'Cursor': ('.cursor', 'Cursor'),
+    'Polling': ('.polling', 'Polling'),
+    **{name: ('.event', name) for name in (
+        'GEvent', 'IsEventType', 'IsEventValue', 'is_event', 'set_global_event', 'get_global_event', 'Mouse', 'FakeEvent'
+    )},
+})
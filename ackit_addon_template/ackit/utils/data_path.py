@@ -0,0 +1,193 @@
+""" Cached resolution of user-typed RNA data paths.
+
+Paths like ``object.data.vertices[0].co`` or ``modifiers["Subdivision"].levels``
+are tokenized once into an accessor chain (``DataPath``) and the resolved target
+is cached per owner ID datablock. The cache is flushed on depsgraph, undo/redo and
+file load events, since any of those can invalidate the cached references. Other owners
+(window manager, preferences, screen areas, collection items...) change without any of
+those events, so only their parsed path is cached.
+"""
+
+import re
+from typing import Any, Dict, Optional, Tuple
+
+from bpy.types import ID, Context
+
+from ..app.handlers import Handlers
+
+
+__all__ = [
+    'DataPath',
+    'parse_data_path',
+    'resolve_data_path',
+    'resolve_data_path_owner',
+    'clear_data_path_cache',
+]
+
+
+# Matches a single accessor: '.attr' (dot optional for the first token), '[0]', '["key"]' or "['key']".
+_TOKEN_PATTERN = re.compile(
+    r'\.?([A-Za-z_][A-Za-z0-9_]*)'
+    r'|\[\s*(-?\d+)\s*\]'
+    r'|\[\s*"((?:[^"\\]|\\.)*)"\s*\]'
+    r"|\[\s*'((?:[^'\\]|\\.)*)'\s*\]"
+)
+
+ATTR = 0
+ITEM = 1
+
+_MISSING = object()
+
+_parsed_paths: Dict[str, 'DataPath'] = {}
+_resolved_targets: Dict[Tuple[int, str], Any] = {}
+
+
+class DataPath:
+    """ RNA data path parsed into a tuple of ``(kind, key)`` accessors. """
+
+    __slots__ = ('path', 'accessors', 'is_valid')
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.accessors: Tuple[Tuple[int, Any], ...] = ()
+        self.is_valid = False
+
+        if path.startswith('context.'):
+            path = path[len('context.'):]
+        if not path:
+            return
+
+        accessors = []
+        pos = 0
+        end = len(path)
+        while pos < end:
+            match = _TOKEN_PATTERN.match(path, pos)
+            if match is None or (pos != 0 and path[pos] not in '.['):
+                return
+            attr, index, dq_key, sq_key = match.groups()
+            if attr is not None:
+                accessors.append((ATTR, attr))
+            elif index is not None:
+                accessors.append((ITEM, int(index)))
+            else:
+                key = dq_key if dq_key is not None else sq_key
+                accessors.append((ITEM, key.replace('\\"', '"').replace("\\'", "'")))
+            pos = match.end()
+
+        self.accessors = tuple(accessors)
+        self.is_valid = True
+
+    @property
+    def prop_name(self) -> Optional[str]:
+        """ Name of the last accessor if it is an attribute, to be used with ``UILayout.prop``. """
+        if not self.accessors:
+            return None
+        kind, key = self.accessors[-1]
+        return key if kind == ATTR else None
+
+    def walk(self, root: Any, start: int = 0, stop: Optional[int] = None) -> Any:
+        """ Walk the accessor chain from ``root``. Returns None if any step fails. """
+        data = root
+        try:
+            for kind, key in self.accessors[start:stop]:
+                if data is None:
+                    return None
+                data = getattr(data, key) if kind == ATTR else data[key]
+        except (AttributeError, KeyError, IndexError, TypeError, ValueError):
+            return None
+        return data
+
+
+def parse_data_path(path: str) -> DataPath:
+    """ Get the parsed ``DataPath`` for the given string, parsing it only the first time. """
+    data_path = _parsed_paths.get(path, None)
+    if data_path is None:
+        data_path = _parsed_paths[path] = DataPath(path)
+    return data_path
+
+
+def _get_owner_key(data: Any) -> Optional[int]:
+    as_pointer = getattr(data, 'as_pointer', None)
+    if as_pointer is None:
+        return None
+    try:
+        return as_pointer()
+    except ReferenceError:
+        return None
+
+
+def _resolve(root: Any, data_path: DataPath, stop: Optional[int], cache_tag: str) -> Any:
+    if root is None or not data_path.is_valid:
+        return None
+
+    start = 0
+    if isinstance(root, Context):
+        # Context members (active object, scene...) change without notice,
+        # so the first hop is always evaluated and used as the cache owner.
+        root = data_path.walk(root, 0, 1)
+        start = 1
+        if root is None:
+            return None
+
+    owner_key = _get_owner_key(root) if isinstance(root, ID) else None
+    if owner_key is None:
+        return data_path.walk(root, start, stop)
+
+    cache_key = (owner_key, cache_tag)
+    target = _resolved_targets.get(cache_key, _MISSING)
+    if target is not _MISSING and (not hasattr(target, 'as_pointer') or _get_owner_key(target) is not None):
+        return target
+    target = data_path.walk(root, start, stop)
+    # Failed paths are not cached, the data may show up without a flush event.
+    if target is not None:
+        _resolved_targets[cache_key] = target
+    return target
+
+
+def resolve_data_path(root: Any, path: str) -> Any:
+    """ Resolve a data path (relative to a Context or any bpy_struct). Returns None if invalid. """
+    return _resolve(root, parse_data_path(path), None, path)
+
+
+def resolve_data_path_owner(root: Any, path: str) -> Tuple[Any, Optional[str]]:
+    """ Resolve the struct owning the last property of the data path.
+        Returns a tuple of (owner, property name), ready to use with ``UILayout.prop``. """
+    data_path = parse_data_path(path)
+    prop_name = data_path.prop_name
+    if prop_name is None:
+        return None, None
+    if len(data_path.accessors) == 1:
+        return root, prop_name
+    return _resolve(root, data_path, -1, '<owner>' + path), prop_name
+
+
+def clear_data_path_cache() -> None:
+    """ Flush resolved targets. Parsed paths are kept as they never go stale. """
+    _resolved_targets.clear()
+
+
+@Handlers.DEPSGRAPH_UPDATE_POST(persistent=True)
+def _on_depsgraph_update_post(context, *args):
+    clear_data_path_cache()
+
+
+@Handlers.UNDO_POST(persistent=True)
+def _on_undo_post(context, *args):
+    clear_data_path_cache()
+
+
+@Handlers.REDO_POST(persistent=True)
+def _on_redo_post(context, *args):
+    clear_data_path_cache()
+
+
+@Handlers.LOAD_POST(persistent=True)
+def _on_load_post(context, *args):
+    clear_data_path_cache()
+
+
+# ----------------------------------------------------------------
+
+def unregister():
+    clear_data_path_cache()
+    _parsed_paths.clear()
@@ -0,0 +1,173 @@
+""" Indexed text search for UI search callbacks (StringProperty 'search', search popups...).
+
+Keys are lowercased once when building the index. Lookups go through a prefix trie
+(for 'starts with' matches) and a 1-to-3 character n-gram index (for 'contains' matches),
+so a keystroke never scans the whole item set.
+"""
+
+from typing import Any, Dict, Generic, Iterable, List, Optional, Set, Tuple, TypeVar
+
+
+__all__ = [
+    'SearchIndex',
+]
+
+
+T = TypeVar('T')
+
+# Max n-gram size stored in the index. Longer queries intersect their trigrams.
+_GRAM_SIZE = 3
+# Trie node key that stores the ids of the entries with the prefix of that node.
+_IDS_KEY = ''
+
+
+class SearchIndex(Generic[T]):
+    """ Search index over ``(key, value)`` entries.
+
+        Ranking mirrors the classic UI search order, entries keep their insertion order in each group:
+        1. keys that start with the query.
+        2. keys that contain the query.
+        3. keys that contain every whitespace-separated word of the query (in any order).
+    """
+
+    def __init__(self, entries: Optional[Iterable[Tuple[str, T]]] = None) -> None:
+        # Indexed by entry id, None once removed (ids are never reused, so postings stay sorted).
+        self._keys: List[Optional[str]] = []
+        self._values: List[Optional[T]] = []
+        self._count = 0
+        self._trie: Dict[str, Any] = {_IDS_KEY: []}
+        self._grams: Dict[str, List[int]] = {}
+        if entries is not None:
+            for key, value in entries:
+                self.add(key, value)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    @property
+    def values(self) -> List[T]:
+        return [value for key, value in zip(self._keys, self._values) if key is not None]
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._values.clear()
+        self._count = 0
+        self._trie = {_IDS_KEY: []}
+        self._grams.clear()
+
+    def add(self, key: str, value: T) -> None:
+        key = key.lower()
+        entry_id = len(self._keys)
+        self._keys.append(key)
+        self._values.append(value)
+        self._count += 1
+
+        node = self._trie
+        node[_IDS_KEY].append(entry_id)
+        for char in key:
+            child = node.get(char, None)
+            if child is None:
+                child = node[char] = {_IDS_KEY: []}
+            child[_IDS_KEY].append(entry_id)
+            node = child
+
+        grams = self._grams
+        seen: Set[str] = set()
+        for size in range(1, _GRAM_SIZE + 1):
+            for i in range(len(key) - size + 1):
+                gram = key[i:i+size]
+                if gram in seen:
+                    continue
+                seen.add(gram)
+                if gram in grams:
+                    grams[gram].append(entry_id)
+                else:
+                    grams[gram] = [entry_id]
+
+    def remove(self, key: str) -> int:
+        """ Remove the entries with this key. Returns how many were removed. """
+        key = key.lower()
+        entry_ids = [entry_id for entry_id in self._starts_with(key) if self._keys[entry_id] == key]
+        if not entry_ids:
+            return 0
+        removed = set(entry_ids)
+
+        node = self._trie
+        node[_IDS_KEY][:] = [entry_id for entry_id in node[_IDS_KEY] if entry_id not in removed]
+        for char in key:
+            node = node[char]
+            node[_IDS_KEY][:] = [entry_id for entry_id in node[_IDS_KEY] if entry_id not in removed]
+
+        grams = self._grams
+        for size in range(1, _GRAM_SIZE + 1):
+            for i in range(len(key) - size + 1):
+                gram = key[i:i+size]
+                if (ids := grams.get(gram, None)) is not None:
+                    ids[:] = [entry_id for entry_id in ids if entry_id not in removed]
+                    if not ids:
+                        del grams[gram]
+
+        for entry_id in entry_ids:
+            self._keys[entry_id] = None
+            self._values[entry_id] = None
+        self._count -= len(entry_ids)
+        return len(entry_ids)
+
+    def _starts_with(self, text: str) -> List[int]:
+        node = self._trie
+        for char in text:
+            node = node.get(char, None)
+            if node is None:
+                return []
+        return node[_IDS_KEY]
+
+    def _contains(self, text: str) -> List[int]:
+        if len(text) <= _GRAM_SIZE:
+            return self._grams.get(text, [])
+
+        # Intersect the postings of every trigram, starting with the shortest one.
+        postings = []
+        for i in range(len(text) - _GRAM_SIZE + 1):
+            ids = self._grams.get(text[i:i+_GRAM_SIZE], None)
+            if ids is None:
+                return []
+            postings.append(ids)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for ids in postings[1:]:
+            candidates.intersection_update(ids)
+            if not candidates:
+                return []
+        keys = self._keys
+        return sorted(entry_id for entry_id in candidates if text in keys[entry_id])
+
+    def search_ids(self, text: str, limit: Optional[int] = None) -> List[int]:
+        text = text.lower()
+        if not text:
+            ids = self._trie[_IDS_KEY]
+            return ids[:limit] if limit is not None else list(ids)
+
+        result = list(self._starts_with(text))
+        found = set(result)
+        result.extend(entry_id for entry_id in self._contains(text) if entry_id not in found)
+
+        words = text.split()
+        if len(words) > 1:
+            found.update(result)
+            word_matches: Optional[Set[int]] = None
+            for word in words:
+                ids = self._contains(word)
+                word_matches = set(ids) if word_matches is None else word_matches.intersection(ids)
+                if not word_matches:
+                    break
+            if word_matches:
+                result.extend(sorted(word_matches.difference(found)))
+
+        return result[:limit] if limit is not None else result
+
+    def search(self, text: str, limit: Optional[int] = None) -> List[T]:
+        values = self._values
+        return [values[entry_id] for entry_id in self.search_ids(text, limit)]
@@ -1,9 +1,11 @@
-from typing import Dict, Any, Set, Optional
+from typing import Dict, Set, Optional
 import bpy
 from bpy import types as bpy_types
 
 # Import ACK from the root ackit library
 from ....ackit import ACK
+from ....ackit.utils.data_path import resolve_data_path
+from ....ackit.utils.search import SearchIndex
 # Import ElementSocket from the sockets file in the same editor definition
 from ..sockets import ElementSocket
 from .enums import search_icon_items, icons_ids_set
@@ -24,27 +26,21 @@ def process_ui_list_name(name: str) -> str:
     return name.replace('_', ' ').title()
 
 ui_list_types_x_names = None
+ui_list_types_search_index = None
 
 def update_ui_list_types():
-    global ui_list_types_x_names
+    global ui_list_types_x_names, ui_list_types_search_index
     ui_list_types = bpy_types.UIList.__subclasses__()
     ui_list_types_x_names = {
         process_ui_list_name(item.__name__): item for item in ui_list_types
     }
+    ui_list_types_search_index = SearchIndex((name, name) for name in ui_list_types_x_names.keys())
 
 def search_list_type_idname(self, context, edit_text):
     """Search function for list type idnames."""
-    global ui_list_types_x_names
-    if ui_list_types_x_names is None:
+    if ui_list_types_search_index is None:
         update_ui_list_types()
-    startswith = []
-    contains = []
-    for key in ui_list_types_x_names.keys():
-        if key.startswith(edit_text):
-            startswith.append(key)
-        elif edit_text in key:
-            contains.append(key)
-    return startswith + contains
+    return ui_list_types_search_index.search(edit_text)
 
 
 # --- Template List Node ---
@@ -160,20 +156,8 @@ class TemplateListNode(TemplateNode, ACK.NE.NodeExec):
         if not self.data_path or not self.propname or not self.active_data_path or not self.active_propname:
             return None
 
-        def _get_owner(context, data_path: str) -> Any:
-            try:
-                if isinstance(context, bpy.types.Context) and data_path.startswith('context.'):
-                    data_path = data_path[len('context.'):]
-                else:
-                    data_path = data_path
-                owner = context.path_resolve(data_path, False),  # coerce to False
-                return owner[0]
-            except Exception as e:
-                print(f"Error: {e}")
-                return None
-
-        owner = _get_owner(context, self.data_path)
-        active_owner = _get_owner(owner if self.use_relative_active_data_path else context, self.active_data_path)
+        owner = resolve_data_path(context, self.data_path)
+        active_owner = resolve_data_path(owner if self.use_relative_active_data_path else context, self.active_data_path)
         if not owner or not active_owner:
             return None
 
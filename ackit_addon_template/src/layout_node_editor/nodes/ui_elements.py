@@ -4,6 +4,7 @@ from bpy import types as bpy_types
 
 # Import ACK from the root ackit library
 from ....ackit import ACK
+from ....ackit.utils.data_path import resolve_data_path_owner
 # Import ElementSocket from the sockets file in the same editor definition
 from ..sockets import ElementSocket
 from .enums import search_icon_items, icons_ids_set
@@ -247,7 +248,8 @@ class PropNode(UIElementsNode, ACK.NE.NodeExec):
                     # Add other presets here...
                     else: data_block = None # Unknown preset
 
-                    prop_path = self.context_preset_data_path
+                    if data_block is not None and self.context_preset_data_path:
+                        data_block, prop_path = resolve_data_path_owner(data_block, self.context_preset_data_path)
 
                 elif self.context_mode == 'DATA_PATH':
                     full_path = self.context_data_path
@@ -257,24 +259,10 @@ class PropNode(UIElementsNode, ACK.NE.NodeExec):
                         layout.label(text=f"Invalid Context Path", icon='ERROR')
                         return None
 
-                    # Separate owner path from property name
-                    if '.' not in full_path:
-                        data_block = context
-                        prop_path = full_path
-                    else:
-                        owner_path, prop_name = full_path.rsplit('.', 1)
-                        try:
-                            # Resolve the owner object/struct
-                            data_block = context.path_resolve(owner_path, False) # coerce=False
-                            prop_path = prop_name
-                        except ValueError: # path_resolve raises ValueError if path is invalid
-                            print(f"Error: PropNode '{self.name}': Could not resolve context owner path '{owner_path}'")
-                            data_block = None
-                            prop_path = None
-                        except Exception as e_resolve:
-                            print(f"Error resolving context path '{owner_path}' in PropNode '{self.name}': {e_resolve}")
-                            data_block = None
-                            prop_path = None
+                    # Separate owner path from property name (parsed once, resolved owner is cached).
+                    data_block, prop_path = resolve_data_path_owner(context, full_path)
+                    if data_block is None:
+                        print(f"Error: PropNode '{self.name}': Could not resolve context owner path '{full_path}'")
 
 
             elif self.mode == 'DATA':
@@ -293,9 +281,7 @@ class PropNode(UIElementsNode, ACK.NE.NodeExec):
                 prop_path = self.data_item_path
                 
                 if data_block and prop_path:
-                    split_path = prop_path.split('.')
-                    data_block = data_block.path_resolve('.'.join(split_path[:-1]), False) # coerce=False
-                    prop_path = split_path[-1]
+                    data_block, prop_path = resolve_data_path_owner(data_block, prop_path)
 
             # --- Validate and Draw ---
             if data_block is None:
@@ -0,0 +1,55 @@
+""" The pure Python parts of ACKit are tested without Blender.
+
+The ``ackit`` package is loaded from its directory, the addon root is NOT added to ``sys.path``
+(its generated ``types.py`` would shadow the standard library one). Its ``__init__`` modules are
+lazy, so importing a bpy-free submodule doesn't import bpy. The few bpy-bound modules a test
+module depends on are replaced by stubs, only while that test runs.
+"""
+
+import sys
+import types
+import importlib
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+
+ACKIT_DIR = Path(__file__).resolve().parents[1] / 'ackit_addon_template' / 'ackit'
+
+
+def _load_package() -> types.ModuleType:
+    if (package := sys.modules.get('ackit', None)) is None:
+        spec = importlib.util.spec_from_file_location('ackit', ACKIT_DIR / '__init__.py', submodule_search_locations=[str(ACKIT_DIR)])
+        package = sys.modules['ackit'] = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(package)
+    return package
+
+
+def make_stub(name: str, **attrs) -> types.ModuleType:
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    return module
+
+
+@pytest.fixture
+def import_ackit(monkeypatch):
+    """ ``import_ackit('app.work_queue', stubs={'app.timer': module})``: fresh import of an ackit submodule.
+        Stub names are relative to the package, except 'bpy'. """
+    _load_package()
+    loaded = set(sys.modules)
+
+    def _import(name: str, stubs: dict = None) -> types.ModuleType:
+        for stub_name, stub in (stubs or {}).items():
+            monkeypatch.setitem(sys.modules, stub_name if stub_name == 'bpy' else f'ackit.{stub_name}', stub)
+        module_name = f'ackit.{name}'
+        # Records the previous state, restored after the test: the module may hold the stubs.
+        monkeypatch.setitem(sys.modules, module_name, None)
+        del sys.modules[module_name]
+        return importlib.import_module(module_name)
+    yield _import
+
+    # Same for the ackit modules it imported.
+    for module_name in set(sys.modules) - loaded:
+        if module_name.startswith('ackit.'):
+            del sys.modules[module_name]
@@ -0,0 +1,59 @@
+""" AddonLoader registration of the ackit modules imported lazily, once registered. """
+
+import sys
+import types
+
+import pytest
+
+from conftest import make_stub
+
+
+@pytest.fixture
+def ackit(import_ackit, monkeypatch):
+    bpy_utils = make_stub('bpy.utils', register_class=None, unregister_class=None)
+    monkeypatch.setitem(sys.modules, 'bpy.utils', bpy_utils)
+    GLOBALS = types.SimpleNamespace(ADDON_MODULE_UPPER='TEST', check_in_development=lambda: False)
+    stubs = {
+        'bpy': make_stub('bpy', utils=bpy_utils),
+        'globals': make_stub('ackit.globals', GLOBALS=GLOBALS),
+        'debug': make_stub('ackit.debug', __path__=[]),
+        'debug.output': make_stub('ackit.debug.output', print_debug=lambda *args: None),
+        'debug.timings': make_stub('ackit.debug.timings', StartupTimings=None),
+        'core.manifest': make_stub('ackit.core.manifest', StartupManifest=None),
+    }
+    addon_loader = import_ackit('core.addon_loader', stubs=stubs)
+    AddonLoader = addon_loader.AddonLoader
+    monkeypatch.setattr(AddonLoader, 'module_callbacks', addon_loader.CallbackDict())
+    # Every ackit module loaded so far is part of the addon modules.
+    monkeypatch.setattr(AddonLoader, 'modules', addon_loader.get_loaded_submodules('ackit'))
+    return types.SimpleNamespace(AddonLoader=AddonLoader, lazy=import_ackit('_lazy'))
+
+
+@pytest.fixture
+def log(monkeypatch):
+    log = []
+    module = make_stub('ackit.app.lazy_test')
+    for callback_id in ('register', 'late_register', 'unregister'):
+        setattr(module, callback_id, lambda callback_id=callback_id: log.append(callback_id))
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    return log
+
+
+def test_registered(ackit, log, monkeypatch):
+    monkeypatch.setattr(ackit.AddonLoader, 'registered', True)
+    module = ackit.lazy.import_lazily('.app.lazy_test', 'ackit')
+    assert log == ['register', 'late_register']
+    assert module in ackit.AddonLoader.modules
+    # Only once.
+    ackit.lazy.import_lazily('.app.lazy_test', 'ackit')
+    assert log == ['register', 'late_register']
+    ackit.AddonLoader.module_callbacks.call_callbacks('unregister')
+    assert log == ['register', 'late_register', 'unregister']
+
+
+def test_not_registered(ackit, log, monkeypatch):
+    monkeypatch.setattr(ackit.AddonLoader, 'registered', False)
+    ackit.lazy.import_lazily('.app.lazy_test', 'ackit')
+    # Left to the addon registration.
+    assert log == []
+    assert all(module.__name__ != 'ackit.app.lazy_test' for module in ackit.AddonLoader.modules)
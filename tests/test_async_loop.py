@@ -0,0 +1,64 @@
+""" AsyncLoop tests, with the timer stubbed (steps are run by hand). """
+
+import time
+import asyncio
+
+import pytest
+
+from conftest import make_stub
+
+
+@pytest.fixture
+def AsyncLoop(import_ackit):
+    debug = make_stub('ackit.debug', __path__=[])
+    module = import_ackit('app.async_loop', stubs={
+        'debug': debug,
+        'debug.output': make_stub('ackit.debug.output', print_debug=print),
+        'app.timer': make_stub('ackit.app.timer', new_timer=lambda *args, **kwargs: object(), TimerHandler=object),
+    })
+    yield module.AsyncLoop
+    module.AsyncLoop.timer = None
+    module.AsyncLoop.stop()
+
+
+def run_steps(AsyncLoop, until, timeout: float = 2.0) -> None:
+    end = time.monotonic() + timeout
+    while not until() and time.monotonic() < end:
+        AsyncLoop.step()
+        time.sleep(0.001)
+
+
+def test_keeps_the_main_thread_loop(AsyncLoop):
+    other = asyncio.new_event_loop()
+    asyncio.set_event_loop(other)
+    try:
+        results = []
+
+        async def work():
+            results.append(asyncio.get_event_loop() is AsyncLoop.loop)
+
+        task = AsyncLoop.run(work())
+        run_steps(AsyncLoop, task.done)
+        assert results == [True]
+        assert asyncio.get_event_loop_policy().get_event_loop() is other
+    finally:
+        asyncio.set_event_loop(None)
+        other.close()
+
+
+def test_thread_wakeup_resets_the_interval(AsyncLoop):
+    async def work():
+        await AsyncLoop.run_in_thread(time.sleep, 0.05)
+        await asyncio.sleep(10)
+
+    task = AsyncLoop.run(work())
+    # Waiting: backs off.
+    for _ in range(5):
+        AsyncLoop.step()
+    assert AsyncLoop.interval > AsyncLoop.min_interval
+    time.sleep(0.2)
+    assert AsyncLoop._woken
+    AsyncLoop.step()
+    assert not task.done()
+    assert AsyncLoop.interval == AsyncLoop.min_interval
+    assert not AsyncLoop._woken
@@ -0,0 +1,42 @@
+""" Shared helpers of the handler like dispatchers (persistence, hot reload replacement). """
+
+import sys
+import types
+
+import pytest
+
+from conftest import make_stub
+
+
+@pytest.fixture
+def handlers(import_ackit, monkeypatch):
+    app = make_stub('bpy.app', handlers=make_stub('bpy.app.handlers', persistent=lambda function: function))
+    monkeypatch.setitem(sys.modules, 'bpy.app', app)
+    return import_ackit('app.handlers', stubs={
+        'bpy': make_stub('bpy', app=app),
+        'debug': make_stub('ackit.debug', __path__=[], debug_context=None),
+        'app.rate_limit': make_stub('ackit.app.rate_limit', RateLimiter=None),
+    })
+
+
+def item(key, persistent=False):
+    return types.SimpleNamespace(key=key, persistent=persistent)
+
+
+def test_keep_persistent(handlers):
+    a, b, c = item('a', True), item('b'), item('c', True)
+    items = [a, b, c]
+    assert handlers.keep_persistent(items) == [b]
+    assert items == [a, c]
+    assert handlers.keep_persistent(items) == []
+
+
+def test_replace_by_key(handlers):
+    a, b = item('a'), item('b')
+    items = [a, b]
+    new_a = item('a')
+    assert handlers.replace_by_key(items, new_a) == [a]
+    assert items == [b, new_a]
+    c = item('c')
+    assert handlers.replace_by_key(items, c) == []
+    assert items == [b, new_a, c]
@@ -0,0 +1,128 @@
+""" HotReload of a module, with bpy and the registration stubbed. """
+
+import sys
+import types
+import textwrap
+
+import pytest
+
+from conftest import make_stub
+
+
+class PropertyDeferred:
+    def __init__(self, keywords: dict) -> None:
+        self.keywords = keywords
+
+
+MODULE = '''
+from bpy.props import PointerProperty
+from ackit.core.base_type import BaseType
+
+
+class Target(BaseType):
+    bl_idname = 'TARGET'
+    {target}
+
+
+class Other(BaseType):
+    bl_idname = 'OTHER'
+
+
+class Dependent(BaseType):
+    bl_idname = 'DEPENDENT'
+    target: PointerProperty(type=Target)
+    {dependent}
+'''
+
+
+@pytest.fixture
+def hot_reload(import_ackit, monkeypatch, tmp_path):
+    registered = set()
+
+    def register_class(cls):
+        cls.bl_rna = object()
+        registered.add(cls)
+
+    def unregister_class(cls):
+        del cls.bl_rna
+        registered.discard(cls)
+
+    props = make_stub('bpy.props', _PropertyDeferred=PropertyDeferred, PointerProperty=lambda **kwargs: PropertyDeferred(kwargs))
+    bpy_types = make_stub('bpy.types', Panel=type('Panel', (), {}), Node=type('Node', (), {}), NodeTree=type('NodeTree', (), {}))
+    bpy_utils = make_stub('bpy.utils', register_class=register_class, unregister_class=unregister_class)
+    for stub in (props, bpy_types, bpy_utils):
+        monkeypatch.setitem(sys.modules, stub.__name__, stub)
+    BaseType = type('BaseType', (), {'tag_register': classmethod(lambda cls: None)})
+    AddonLoader = types.SimpleNamespace(modules=[], module_callbacks=make_stub('callbacks', clear_callbacks=lambda: None), fetch_module_callbacks=lambda: None)
+    GLOBALS = types.SimpleNamespace(ADDON_MODULE_UPPER='TEST', check_in_development=lambda: True)
+    hot_reload = import_ackit('core.hot_reload', stubs={
+        'bpy': make_stub('bpy', props=props, types=bpy_types, utils=bpy_utils),
+        'globals': make_stub('ackit.globals', GLOBALS=GLOBALS),
+        'debug': make_stub('ackit.debug', __path__=[]),
+        'debug.output': make_stub('ackit.debug.output', print_debug=lambda *args: None),
+        'debug.timings': make_stub('ackit.debug.timings', StartupTimings=None),
+        'app.handlers': make_stub('ackit.app.handlers', register_module_handlers=lambda name: None, unregister_module_handlers=lambda name: None),
+        'app.timer': make_stub(
+            'ackit.app.timer', new_timer=None, TimerHandler=None,
+            register_module_timers=lambda name: None, unregister_module_timers=lambda name: None,
+        ),
+        'core.btypes': make_stub('ackit.core.btypes', BTypes=[], classes_per_type={}),
+        'core.base_type': make_stub('ackit.core.base_type', BaseType=BaseType, NODE_EDITOR_TYPES={}, link_node_tree_types=None),
+        'core.addon_loader': make_stub('ackit.core.addon_loader', AddonLoader=AddonLoader, ACKIT_PACKAGE='ackit'),
+    })
+    monkeypatch.setattr(hot_reload.HotReload, 'fingerprints', {})
+    monkeypatch.setattr(hot_reload.HotReload, 'mtimes', {})
+    # Reloads always read the source, whatever its mtime.
+    monkeypatch.setattr(sys, 'dont_write_bytecode', True)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    def write(target: str = '', dependent: str = '') -> None:
+        (tmp_path / 'hot_reload_test.py').write_text(textwrap.dedent(MODULE.format(target=target, dependent=dependent)))
+
+    def load():
+        write()
+        monkeypatch.delitem(sys.modules, 'hot_reload_test', raising=False)
+        module = __import__('hot_reload_test')
+        AddonLoader.modules = [module]
+        for _attr_name, cls in hot_reload._iter_module_classes(module):
+            register_class(cls)
+        hot_reload.HotReload.snapshot([module])
+        return module
+
+    def edit(module, **changes) -> None:
+        write(**changes)
+        assert hot_reload.HotReload.reload({module.__name__})
+
+    return types.SimpleNamespace(load=load, edit=edit, registered=registered)
+
+
+def test_dependent_changed(hot_reload):
+    module = hot_reload.load()
+    target, other, dependent = module.Target, module.Other, module.Dependent
+    hot_reload.edit(module, dependent="bl_label = 'Changed'")
+
+    assert module.Dependent is not dependent
+    # Referenced by the new dependent class: registered again, with it.
+    assert module.Target is not target
+    assert module.Dependent.__annotations__['target'].keywords['type'] is module.Target
+    assert module.Other is other
+    assert hot_reload.registered == {module.Target, module.Other, module.Dependent}
+
+
+def test_target_changed(hot_reload):
+    module = hot_reload.load()
+    target, other, dependent = module.Target, module.Other, module.Dependent
+    hot_reload.edit(module, target="bl_label = 'Changed'")
+
+    # The kept dependent class would reference the old target class.
+    assert module.Target is not target and module.Dependent is not dependent
+    assert module.Other is other
+    assert hot_reload.registered == {module.Target, module.Other, module.Dependent}
+
+
+def test_unchanged(hot_reload):
+    module = hot_reload.load()
+    classes = module.Target, module.Other, module.Dependent
+    hot_reload.edit(module)
+    assert (module.Target, module.Other, module.Dependent) == classes
+    assert hot_reload.registered == set(classes)
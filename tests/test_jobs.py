@@ -0,0 +1,60 @@
+""" Jobs tests, with the timer and the process pool stubbed (completions are drained by hand). """
+
+import types
+import threading
+
+import pytest
+
+from conftest import make_stub
+
+
+class FailingProcessPool:
+    @staticmethod
+    def submit(fn, *args, **kwargs):
+        raise TypeError(f"module, class, method, function, traceback, frame, or code object was expected, got {type(fn).__name__}")
+
+
+@pytest.fixture
+def jobs(import_ackit):
+    module = import_ackit('app.jobs', stubs={
+        'globals': make_stub('ackit.globals', GLOBALS=types.SimpleNamespace(ADDON_MODULE_SHORT='test', ADDON_MODULE_UPPER='TEST')),
+        'app.timer': make_stub('ackit.app.timer', new_timer=lambda *args, **kwargs: object(), TimerHandler=object),
+        'app.process_pool': make_stub('ackit.app.process_pool', ProcessPool=FailingProcessPool),
+    })
+    yield module
+    module.Jobs._timer = None
+    module.Jobs.shutdown()
+
+
+def wait_idle(Jobs, timeout: float = 2.0) -> None:
+    event = threading.Event()
+    for _ in range(int(timeout / 0.01)):
+        if Jobs.is_idle():
+            return
+        event.wait(0.01)
+
+
+def test_thread_job(jobs):
+    results = []
+    job = jobs.Jobs.submit(sum, [1, 2, 3], on_done=results.append)
+    wait_idle(jobs.Jobs)
+    assert jobs.Jobs.drain()
+    assert results == [6]
+    assert job.state == jobs.JobState.DONE
+
+
+def test_submit_failure(jobs):
+    errors = []
+    job = jobs.Jobs.submit(len, [1], use_process=True, on_error=errors.append)
+    # The slot isn't leaked, the job fails in the main thread.
+    assert jobs.Jobs._running[True] == 0
+    assert job not in jobs.Jobs._active
+    assert jobs.Jobs.is_idle()
+    assert jobs.Jobs.drain()
+    assert job.state == jobs.JobState.FAILED
+    assert len(errors) == 1 and isinstance(errors[0], TypeError)
+
+
+def test_process_jobs_reject_progress(jobs):
+    with pytest.raises(ValueError):
+        jobs.Jobs.submit(len, [1], use_process=True, on_progress=lambda progress, message: None)
@@ -0,0 +1,70 @@
+""" Register ordering (reg_utils.toposort) tests. """
+
+import pytest
+
+from conftest import make_stub
+
+
+@pytest.fixture
+def reg_utils(import_ackit):
+    debug = make_stub('ackit.debug', __path__=[])
+    return import_ackit('core.reg_utils', stubs={
+        'bpy': make_stub('bpy'),
+        'globals': make_stub('ackit.globals', GLOBALS=None),
+        'debug': debug,
+        'debug.timings': make_stub('ackit.debug.timings', StartupTimings=None),
+    })
+
+
+def make_class(name: str, bl_order: int = 0) -> type:
+    return type(name, (), {'bl_order': bl_order})
+
+
+def test_levels(reg_utils):
+    A, B, C, D = (make_class(name) for name in 'ABCD')
+    order = reg_utils.toposort({D: {B, C}, C: {A}, B: {A}, A: set()})
+    assert order == [A, C, B, D]
+
+
+def test_bl_order_within_level(reg_utils):
+    A, B, C = make_class('A', 2), make_class('B'), make_class('C', -1)
+    D = make_class('D', -5)
+    # D has the lowest bl_order but depends on A, so it stays after it.
+    assert reg_utils.toposort({A: set(), B: set(), C: set(), D: {A}}) == [C, B, A, D]
+
+
+def test_keeps_insertion_order(reg_utils):
+    classes = [make_class(f'C{i}') for i in range(50)]
+    assert reg_utils.toposort({cls: set() for cls in classes}) == classes
+
+
+def test_ignores_unknown_deps(reg_utils):
+    A, B, External = (make_class(name) for name in ('A', 'B', 'External'))
+    assert reg_utils.toposort({B: {A, External}, A: {External}}) == [A, B]
+
+
+def test_long_chain(reg_utils):
+    classes = [make_class(f'C{i}') for i in range(2000)]
+    deps_dict = {cls: {classes[i - 1]} if i else set() for i, cls in reversed(list(enumerate(classes)))}
+    assert reg_utils.toposort(deps_dict) == classes
+
+
+def test_cycle(reg_utils):
+    A, B, C, D, E = (make_class(name) for name in 'ABCDE')
+    deps_dict = {E: set(), D: {A}, A: {B}, B: {C}, C: {A, E}}
+    with pytest.raises(reg_utils.DependencyCycleError) as error:
+        reg_utils.toposort(deps_dict)
+    chain = error.value.chain
+    # The chain closes on itself, each class depending on the next one, and only has cycle members.
+    assert chain[0] is chain[-1]
+    assert set(chain) == {A, B, C}
+    assert all(dep in deps_dict[cls] for cls, dep in zip(chain, chain[1:]))
+    assert ' -> '.join(cls.__qualname__ for cls in chain) in str(error.value)
+
+
+def test_self_dependency(reg_utils):
+    A, B = make_class('A'), make_class('B')
+    with pytest.raises(reg_utils.DependencyCycleError) as error:
+        reg_utils.toposort({A: set(), B: {B}})
+    assert error.value.chain == [B, B]
+    assert isinstance(error.value, ValueError)
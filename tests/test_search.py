@@ -0,0 +1,91 @@
+""" SearchIndex tests. """
+
+import pytest
+
+
+@pytest.fixture
+def SearchIndex(import_ackit):
+    return import_ackit('utils.search').SearchIndex
+
+
+ICONS = ['ADD', 'REMOVE', 'MESH_CUBE', 'MESH_CYLINDER', 'CUBE', 'OBJECT_DATA', 'MOD_ARRAY', 'SCENE_DATA']
+
+
+def make_index(SearchIndex):
+    return SearchIndex((name.replace('_', ' '), name) for name in ICONS)
+
+
+def test_empty_query(SearchIndex):
+    index = make_index(SearchIndex)
+    assert index.search('') == ICONS
+    assert index.search('', limit=2) == ICONS[:2]
+
+
+def test_prefix(SearchIndex):
+    index = make_index(SearchIndex)
+    assert index.search('mesh') == ['MESH_CUBE', 'MESH_CYLINDER']
+    assert index.search('MESH C') == ['MESH_CUBE', 'MESH_CYLINDER']
+    assert index.search('mesh cu') == ['MESH_CUBE']
+    assert index.search('zzz') == []
+
+
+@pytest.mark.parametrize('query, expected', [
+    # Single characters, bigrams and trigrams come straight from the n-gram postings.
+    ('y', ['MESH_CYLINDER', 'MOD_ARRAY']),
+    ('ta', ['OBJECT_DATA', 'SCENE_DATA']),
+    ('ray', ['MOD_ARRAY']),
+    # Longer ones intersect their trigrams, then check the key.
+    (' data', ['OBJECT_DATA', 'SCENE_DATA']),
+    ('ylinder', ['MESH_CYLINDER']),
+    ('cube', ['CUBE', 'MESH_CUBE']),
+])
+def test_contains(SearchIndex, query, expected):
+    assert sorted(make_index(SearchIndex).search(query)) == sorted(expected)
+
+
+def test_trigram_false_positive(SearchIndex):
+    # Both trigrams of 'abcd' are in the key, but not the query itself.
+    index = SearchIndex([('abc xbcd', 1), ('xabcd', 2)])
+    assert index.search('abcd') == [2]
+
+
+def test_ranking(SearchIndex):
+    keys = ['data object', 'object data', 'data', 'object', 'data copy']
+    index = SearchIndex((key, key) for key in keys)
+    # Starts with, then contains, then every word in any order, insertion order in each group.
+    assert index.search('data') == ['data object', 'data', 'data copy', 'object data']
+    assert index.search('object data') == ['object data', 'data object']
+    assert index.search('data', limit=2) == ['data object', 'data']
+
+
+def test_case_insensitive(SearchIndex):
+    index = SearchIndex([('Add Node', 1)])
+    assert index.search('aDD n') == [1]
+    assert index.search('NODE') == [1]
+
+
+def test_remove(SearchIndex):
+    index = make_index(SearchIndex)
+    assert index.remove('mesh cube') == 1
+    assert len(index) == len(ICONS) - 1
+    assert 'MESH_CUBE' not in index.values
+    assert index.search('mesh') == ['MESH_CYLINDER']
+    assert index.search('cube') == ['CUBE']
+    assert index.search('sh c') == ['MESH_CYLINDER']
+    assert index.search('') == [name for name in ICONS if name != 'MESH_CUBE']
+    assert index.remove('mesh cube') == 0
+
+    # Every entry with the key, and ids aren't reused.
+    index.add('Cube', 'CUBE 2')
+    assert index.remove('CUBE') == 2
+    index.add('cube', 'CUBE 3')
+    assert index.search('cub') == ['CUBE 3']
+
+
+def test_clear(SearchIndex):
+    index = make_index(SearchIndex)
+    index.clear()
+    assert not index
+    assert index.search('mesh') == []
+    index.add('mesh', 1)
+    assert index.search('es') == [1]
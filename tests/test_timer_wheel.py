@@ -0,0 +1,98 @@
+""" TimerWheel tests. The wheel is pure Python, they run without Blender. """
+
+import pytest
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTimerWheel:
+    @pytest.fixture(autouse=True)
+    def setup(self, import_ackit):
+        self.clock = FakeClock()
+        self.wheel = import_ackit('app.timer_wheel').TimerWheel(resolution=0.01, clock=self.clock)
+        self.calls = []
+
+    def run_until(self, t: float, step: float = 0.01) -> None:
+        while self.clock.now < t:
+            self.clock.now = min(t, self.clock.now + step)
+            self.wheel.run()
+
+    def test_one_shot(self):
+        self.wheel.schedule(lambda: self.calls.append(self.clock.now), delay=0.5)
+        self.run_until(100.49)
+        assert self.calls == []
+        self.run_until(101.0)
+        assert len(self.calls) == 1
+        assert self.calls[0] >= 100.5
+        assert self.wheel.count == 0
+        assert self.wheel.get_next_deadline() is None
+
+    def test_interval(self):
+        self.wheel.schedule(lambda: self.calls.append(self.clock.now), delay=0.1, interval=0.1)
+        self.run_until(100.55)
+        assert len(self.calls) == 5
+
+    def test_return_value(self):
+        def callback():
+            self.calls.append(self.clock.now)
+            return -1 if len(self.calls) == 3 else 0.2
+        self.wheel.schedule(callback, delay=0.1, interval=10.0)
+        self.run_until(102.0)
+        assert len(self.calls) == 3
+        assert self.calls[1] - self.calls[0] == pytest.approx(0.2, abs=0.011)
+
+    def test_cancel(self):
+        entry = self.wheel.schedule(lambda: self.calls.append(1), delay=0.1)
+        entry.cancel()
+        assert not entry.is_active
+        assert self.wheel.count == 0
+        self.run_until(101.0)
+        assert self.calls == []
+
+    def test_cancel_from_callback(self):
+        def callback():
+            self.calls.append(1)
+            entry.cancel()
+        entry = self.wheel.schedule(callback, delay=0.1, interval=0.1)
+        self.run_until(101.0)
+        assert self.calls == [1]
+        assert self.wheel.count == 0
+
+    def test_timeout(self):
+        self.wheel.schedule(lambda: self.calls.append(1), delay=0.1, interval=0.1, timeout=0.35)
+        self.run_until(102.0)
+        assert len(self.calls) == 4
+
+    def test_deadline_order(self):
+        self.wheel.schedule(lambda: self.calls.append('b'), delay=0.3)
+        self.wheel.schedule(lambda: self.calls.append('a'), delay=0.1)
+        assert self.wheel.get_next_deadline() == pytest.approx(100.1, abs=0.011)
+        self.clock.now = 101.0
+        self.wheel.run()
+        assert self.calls == ['a', 'b']
+
+    def test_upper_levels(self):
+        # Beyond level 0 (0.64 s) and level 1 (~41 s) turns.
+        for delay in (0.7, 50.0, 3000.0):
+            self.wheel.schedule(lambda delay=delay: self.calls.append((delay, self.clock.now)), delay=delay)
+        self.run_until(100.0 + 3001.0, step=0.25)
+        assert [delay for delay, _ in self.calls] == [0.7, 50.0, 3000.0]
+        for delay, t in self.calls:
+            assert t >= 100.0 + delay
+            assert t < 100.0 + delay + 0.26
+
+    def test_cancel_all(self):
+        persistent = self.wheel.schedule(lambda: self.calls.append('persistent'), delay=0.1, persistent=True)
+        self.wheel.schedule(lambda: self.calls.append('temporary'), delay=0.1)
+        self.wheel.cancel_all(lambda entry: not entry.persistent)
+        assert persistent.is_active
+        assert self.wheel.count == 1
+        self.run_until(101.0)
+        assert self.calls == ['persistent']
+
@@ -0,0 +1,171 @@
+""" WorkQueue tests, with the timer stubbed. """
+
+import types
+
+import pytest
+
+from conftest import make_stub
+
+
+class FakeTimerHandler:
+    def __init__(self) -> None:
+        self.stopped = False
+
+    def stop(self) -> None:
+        self.stopped = True
+
+
+@pytest.fixture
+def timers():
+    return []
+
+
+@pytest.fixture
+def WorkQueue(import_ackit, timers):
+    def new_timer(callback, **kwargs):
+        timers.append((callback, kwargs))
+        return FakeTimerHandler()
+
+    return import_ackit('app.work_queue', stubs={
+        'globals': make_stub('ackit.globals', GLOBALS=types.SimpleNamespace(ADDON_MODULE_UPPER='TEST')),
+        'app.timer': make_stub('ackit.app.timer', new_timer=new_timer, TimerHandler=FakeTimerHandler),
+    }).WorkQueue
+
+
+def counter(n, log=None, name=None):
+    for i in range(n):
+        if log is not None:
+            log.append(name)
+        yield i / n
+    return n
+
+
+def run_step(WorkQueue, item) -> None:
+    # An end in the past runs a single step.
+    WorkQueue._run_slice(item, 0.0)
+
+
+def test_submit(WorkQueue, timers):
+    item = WorkQueue.submit(counter, 3, priority=2)
+    WorkQueue.submit(counter(3))
+    assert item.name == 'counter' and item.priority == 2
+    assert len(WorkQueue.items) == 2
+    # A single persistent timer drives the queue.
+    assert len(timers) == 1
+    assert timers[0][1]['persistent'] is True
+    with pytest.raises(TypeError):
+        WorkQueue.submit(lambda: None)
+
+
+def test_pick_priority_then_order(WorkQueue):
+    low = WorkQueue.submit(counter, 3, priority=0)
+    first = WorkQueue.submit(counter, 3, priority=5)
+    second = WorkQueue.submit(counter, 3, priority=5)
+    now = max(item.last_run for item in (low, first, second))
+    for item in (low, first, second):
+        item.last_run = now
+    assert WorkQueue._pick(now) is first
+    first.cancel()
+    assert WorkQueue._pick(now) is second
+    assert first not in WorkQueue.items
+
+
+def test_aging_avoids_starvation(WorkQueue, monkeypatch):
+    monkeypatch.setattr(WorkQueue, 'aging', 1.0)
+    log = []
+    high = WorkQueue.submit(counter, 1000, log, 'high', priority=10)
+    low = WorkQueue.submit(counter, 1000, log, 'low', priority=0)
+    now = 100.0
+    high.last_run = low.last_run = now
+    for _ in range(30):
+        now += 1.0
+        item = WorkQueue._pick(now)
+        run_step(WorkQueue, item)
+        # Run at 'now', in this simulated clock.
+        item.last_run = now
+    # The high priority item runs first, the low one gets to run once it waited 10 seconds more.
+    assert log[0] == 'high'
+    assert 'low' in log
+    assert log.index('low') <= 11
+
+
+def test_progress_and_on_done(WorkQueue):
+    results = []
+    item = WorkQueue.submit(counter, 2, on_done=results.append)
+    run_step(WorkQueue, item)
+    assert item.progress == 0.0
+    run_step(WorkQueue, item)
+    assert item.progress == 0.5 and not item.finished
+    run_step(WorkQueue, item)
+    assert item.finished and item.progress == 1.0
+    assert results == [2]
+
+
+def failing():
+    yield
+    raise KeyError('boom')
+
+
+def test_on_error(WorkQueue):
+    errors = []
+    item = WorkQueue.submit(failing, on_done=lambda value: errors.append('done'), on_error=errors.append)
+    WorkQueue._run_slice(item, float('inf'))
+    assert item.finished
+    assert len(errors) == 1 and isinstance(errors[0], KeyError)
+
+
+def test_failing_callbacks_are_contained(WorkQueue, capsys):
+    def raise_error(*args):
+        raise RuntimeError('callback')
+
+    errored = WorkQueue.submit(failing, on_error=raise_error)
+    done = WorkQueue.submit(counter, 1, on_done=raise_error)
+    WorkQueue._run_slice(errored, float('inf'))
+    WorkQueue._run_slice(done, float('inf'))
+    assert errored.finished and done.finished
+    assert 'RuntimeError' in capsys.readouterr().err
+
+
+def test_error_without_on_error(WorkQueue, capsys):
+    item = WorkQueue.submit(failing)
+    WorkQueue._run_slice(item, float('inf'))
+    assert item.finished
+    captured = capsys.readouterr()
+    assert "Work 'failing' failed!" in captured.out
+    assert 'KeyError' in captured.err
+
+
+def test_budget_adapts_to_frame_time(WorkQueue, monkeypatch):
+    monkeypatch.setattr(WorkQueue, 'target_frame_time', 0.033)
+    monkeypatch.setattr(WorkQueue, 'interval', 0.01)
+    monkeypatch.setattr(WorkQueue, 'min_budget', 0.001)
+    monkeypatch.setattr(WorkQueue, 'max_budget', 0.008)
+    WorkQueue._update_budget(10.0)
+    assert WorkQueue.frame_time is None
+
+    # Fast frames: the budget goes up to its max.
+    WorkQueue._used = 0.0
+    WorkQueue._update_budget(10.01)
+    assert WorkQueue.budget == pytest.approx(0.008)
+
+    # Slow frames (the rest of the frame takes long): down to its min.
+    WorkQueue.frame_time = None
+    WorkQueue._update_budget(10.06)
+    assert WorkQueue.budget == pytest.approx(0.001)
+
+    # In between: what's left of the target frame time.
+    WorkQueue.frame_time = None
+    WorkQueue._used = 0.002
+    WorkQueue._update_budget(10.06 + 0.03)
+    # others = 0.03 - 0.002 - 0.01, budget = 0.033 - others - 0.01
+    assert WorkQueue.budget == pytest.approx(0.033 - 0.018 - 0.01)
+
+
+def test_on_timer_stops_when_done(WorkQueue):
+    results = []
+    WorkQueue.submit(counter, 3, on_done=results.append)
+    WorkQueue.max_budget = WorkQueue.min_budget = 1.0
+    WorkQueue.budget = 1.0
+    assert WorkQueue._on_timer() == -1
+    assert results == [3]
+    assert WorkQueue.items == [] and WorkQueue._timer is None